@@ -1,3 +1,11 @@
 """SpeakWith - Communication assistant for people who cannot speak but can read."""
 
 __version__ = "0.1.0"
+
+from speakwith._lazy import lazy_exports
+
+__all__ = ["Session"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Session": "speakwith.session",
+})
@@ -0,0 +1,31 @@
+"""Deferred attribute imports for package __init__ modules."""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a module-level `__getattr__`/`__dir__` pair (PEP 562).
+
+    Each exported name is imported from its submodule the first time it is
+    accessed and then cached on the package, so `from package import Name`
+    keeps working while `import package` stays cheap.
+
+    Args:
+        package: The package's `__name__`.
+        exports: Mapping of exported name to the module that defines it.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
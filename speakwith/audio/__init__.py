@@ -1,5 +1,25 @@
 """Audio recording module."""
 
-from speakwith.audio.recorder import AudioRecorder
+from speakwith._lazy import lazy_exports
 
-__all__ = ["AudioRecorder"]
+__all__ = [
+    "AudioRecorder",
+    "AudioRing",
+    "AudioSpool",
+    "CaptureConverter",
+    "NoiseSuppressor",
+    "PolyphaseResampler",
+    "ProcessAudioRecorder",
+    "SharedAudioRing",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AudioRecorder": "speakwith.audio.recorder",
+    "AudioRing": "speakwith.audio.ring",
+    "AudioSpool": "speakwith.audio.spool",
+    "CaptureConverter": "speakwith.audio.resample",
+    "NoiseSuppressor": "speakwith.audio.denoise",
+    "PolyphaseResampler": "speakwith.audio.resample",
+    "ProcessAudioRecorder": "speakwith.audio.capture_process",
+    "SharedAudioRing": "speakwith.audio.shm_ring",
+})
@@ -0,0 +1,199 @@
+"""Audio capture in a dedicated process, feeding a shared-memory ring."""
+
+import asyncio
+import multiprocessing
+import time
+from typing import Any, AsyncIterator, Callable, Optional
+
+import numpy as np
+
+from speakwith.audio.resample import CaptureConverter
+from speakwith.audio.shm_ring import FAILED, RUNNING, SharedAudioRing
+from speakwith.config import Config
+from speakwith.metrics import get_metrics
+from speakwith.models import AudioChunk
+
+# open_stream(sample_rate, capture_native, capture_channels, callback)
+#     -> (stream with start/stop/close, device rate, channels)
+StreamOpener = Callable[[int, bool, int, Callable], tuple[Any, int, int]]
+
+
+def open_input(sample_rate: int, capture_native: bool, capture_channels: int, callback: Callable) -> tuple[Any, int, int]:
+    """Open the default input device the way AudioRecorder does."""
+    import sounddevice as sd
+
+    if capture_native:
+        info = sd.query_devices(kind="input")
+        rate = int(info["default_samplerate"])
+        channels = int(info["max_input_channels"]) or 1
+        if capture_channels:
+            channels = min(channels, capture_channels)
+    else:
+        rate, channels = sample_rate, 1
+    stream = sd.InputStream(samplerate=rate, channels=channels, dtype=np.int16, callback=callback)
+    return stream, rate, channels
+
+
+def capture_main(
+    name: str,
+    capacity: int,
+    mirror: int,
+    sample_rate: int,
+    capture_native: bool,
+    capture_channels: int,
+    open_stream: StreamOpener = open_input,
+) -> None:
+    """Entry point of the capture process: device callback -> shared ring."""
+    ring = SharedAudioRing(capacity, mirror, name=name)
+    stream = None
+    converter: Optional[CaptureConverter] = None
+
+    def _callback(indata: np.ndarray, frames: int, time_info: Any, status: Any) -> None:
+        if status is not None and getattr(status, "input_overflow", False):
+            ring.count_xrun()
+        ring.write(converter.process(indata))
+
+    try:
+        stream, device_rate, channels = open_stream(sample_rate, capture_native, capture_channels, _callback)
+        converter = CaptureConverter(device_rate, channels, sample_rate)
+        ring.mark_started(time.time())
+        stream.start()
+        while not ring.stop_requested:
+            time.sleep(0.05)
+            ring.beat()
+    except Exception:
+        ring.mark_failed()
+    finally:
+        if stream is not None:
+            stream.stop()
+            stream.close()
+        ring.close()
+
+
+class ProcessAudioRecorder:
+    """AudioRecorder whose device stream lives in a separate process.
+
+    The capture process only runs the driver callback: it converts each
+    block to mono int16 at `sample_rate` and copies it into a
+    SharedAudioRing. This process polls the ring and yields chunks as
+    read-only views of the shared memory, so GIL and CPU contention here
+    (rendering, prompt building, Whisper) cannot delay the callback.
+
+    Ring overruns (this process fell behind) and driver input overflows
+    are counted in `stats()` and the capture_overruns/capture_xruns
+    metrics.
+
+    Args:
+        config: Sample rate, chunk duration and device format settings.
+        open_stream: Opens the input stream inside the capture process;
+            must be picklable (a module-level function).
+    """
+
+    POLL_INTERVAL = 0.02  # Seconds between checks for a complete chunk
+    RING_SECONDS = 120.0
+    MAX_CHUNK_SECONDS = 30.0  # Whisper's window; longer chunks are capped
+    START_TIMEOUT = 10.0
+
+    def __init__(self, config: Config, open_stream: StreamOpener = open_input):
+        self.sample_rate = config.sample_rate
+        self.chunk_duration = min(config.chunk_duration, self.MAX_CHUNK_SECONDS)
+        self.capture_native = config.capture_native
+        self.capture_channels = config.capture_channels
+        self.open_stream = open_stream
+        self.ring: Optional[SharedAudioRing] = None
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self._last_stats: dict = {}
+        self._running = False
+
+    def reconfigure(self, config: Config) -> None:
+        """Use a new chunk duration from the next chunk on."""
+        self.chunk_duration = min(config.chunk_duration, self.MAX_CHUNK_SECONDS)
+
+    @property
+    def samples_per_chunk(self) -> int:
+        """Number of samples in each audio chunk."""
+        return int(self.sample_rate * self.chunk_duration)
+
+    def stats(self) -> dict:
+        """Ring counters plus whether the capture process is alive."""
+        stats = self.ring.stats() if self.ring is not None else dict(self._last_stats)
+        stats["alive"] = self.process is not None and self.process.is_alive()
+        return stats
+
+    def _start_process(self) -> SharedAudioRing:
+        capacity = int(self.RING_SECONDS * self.sample_rate)
+        mirror = int(self.MAX_CHUNK_SECONDS * self.sample_rate)
+        ring = SharedAudioRing(capacity, mirror)
+        # spawn: the child starts from a clean interpreter instead of a fork
+        # of this one (threads, event loop, loaded models)
+        context = multiprocessing.get_context("spawn")
+        self.process = context.Process(
+            target=capture_main,
+            args=(ring.name, capacity, mirror, self.sample_rate,
+                  self.capture_native, self.capture_channels, self.open_stream),
+            name="speakwith-capture",
+            daemon=True,
+        )
+        self.process.start()
+        return ring
+
+    def _stop_process(self, ring: SharedAudioRing) -> None:
+        ring.request_stop()
+        if self.process is not None:
+            self.process.join(timeout=2.0)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+        self._last_stats = ring.stats()
+        ring.close()
+        ring.unlink()
+
+    async def stream(self) -> AsyncIterator[AudioChunk]:
+        """Continuously yield audio chunks from the capture process.
+
+        Raises:
+            RuntimeError: If the capture process fails to open the device
+                or exits while recording.
+        """
+        loop = asyncio.get_event_loop()
+        metrics = get_metrics()
+        self.ring = ring = await loop.run_in_executor(None, self._start_process)
+        self._running = True
+        samples_yielded = 0
+        seen = {"overruns": 0, "xruns": 0}
+        try:
+            deadline = time.monotonic() + self.START_TIMEOUT
+            while ring.state != RUNNING:
+                if ring.state == FAILED or not self.process.is_alive() or time.monotonic() > deadline:
+                    raise RuntimeError("capture process failed to start")
+                await asyncio.sleep(self.POLL_INTERVAL)
+            started = ring.started
+
+            while self._running:
+                data = ring.read(self.samples_per_chunk)
+                if data is None:
+                    if ring.state == FAILED or not self.process.is_alive():
+                        raise RuntimeError("capture process exited")
+                    await asyncio.sleep(self.POLL_INTERVAL)
+                    continue
+
+                stats = ring.stats()
+                for name in seen:
+                    if stats[name] > seen[name]:
+                        metrics.incr(f"capture_{name}", stats[name] - seen[name])
+                        seen[name] = stats[name]
+                yield AudioChunk(
+                    data=data,
+                    sample_rate=self.sample_rate,
+                    timestamp=started + samples_yielded / self.sample_rate,
+                    duration=len(data) / self.sample_rate,
+                )
+                samples_yielded += len(data)
+        finally:
+            self._running = False
+            self.ring = None
+            await loop.run_in_executor(None, self._stop_process, ring)
+
+    def stop(self) -> None:
+        """Stop yielding chunks; the capture process exits after the current poll."""
+        self._running = False
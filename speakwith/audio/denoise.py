@@ -0,0 +1,168 @@
+"""Streaming STFT noise suppression, DC removal and AGC for speech chunks."""
+
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from speakwith.audio.resample import to_int16
+from speakwith.config import Config
+from speakwith.models import AudioChunk
+
+
+def _smooth(values: np.ndarray, width: int, axis: int) -> np.ndarray:
+    """Moving average along one axis (same length, edges use fewer values)."""
+    if width <= 1 or values.shape[axis] < 2:
+        return values
+    kernel = np.ones(width, dtype=values.dtype) / width
+    pad = [(0, 0)] * values.ndim
+    pad[axis] = (width // 2, width - 1 - width // 2)
+    padded = np.pad(values, pad, mode="edge")
+    windows = sliding_window_view(padded, width, axis=axis)
+    return windows @ kernel
+
+
+class NoiseSuppressor:
+    """Spectral gating with a running noise profile, one chunk at a time.
+
+    Audio is analysed in 50%-overlapping sqrt-Hann frames; overlap-add
+    state is carried across chunks, so output is continuous and each chunk
+    comes back with the same length, delayed by `hop` samples.
+
+    Per chunk, all frames are processed at once:
+        - bins below `highpass_hz` (DC and rumble) are removed;
+        - the noise power per bin is the `noise_percentile` of the chunk's
+          frames, blended into a running profile (faster when it drops, so
+          the profile tracks the quietest recent background);
+        - each bin gets a Wiener-style gain `1 - over * noise / power`,
+          smoothed over time and frequency against musical noise and floored
+          at `-reduction_db`;
+        - AGC scales speech frames toward `agc_target_dbfs`, ramping the
+          gain across the chunk and never above `agc_max_gain_db`.
+
+    Args:
+        sample_rate: Rate of the mono int16 input.
+        frame: STFT frame length in samples (hop is half of it).
+        reduction_db: Maximum attenuation of noise-only bins.
+        agc_target_dbfs: Speech level to aim for (0 disables AGC).
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        frame: int = 512,
+        reduction_db: float = 12.0,
+        highpass_hz: float = 80.0,
+        over_subtraction: float = 1.5,
+        noise_percentile: float = 20.0,
+        noise_adapt: float = 0.3,
+        agc_target_dbfs: float = -20.0,
+        agc_max_gain_db: float = 20.0,
+        agc_adapt: float = 0.5,
+    ):
+        if frame % 2:
+            raise ValueError("frame length must be even")
+        self.sample_rate = sample_rate
+        self.frame = frame
+        self.hop = frame // 2
+        self.floor = np.float32(10 ** (-reduction_db / 20))
+        self.over_subtraction = over_subtraction
+        self.noise_percentile = noise_percentile
+        self.noise_adapt = noise_adapt
+        self.agc_target = 10 ** (agc_target_dbfs / 20) if agc_target_dbfs < 0 else 0.0
+        self.agc_max_gain = 10 ** (agc_max_gain_db / 20)
+        self.agc_adapt = agc_adapt
+
+        # Periodic sqrt-Hann: analysis x synthesis windows sum to 1 at 50% overlap
+        self.window = np.sqrt(np.hanning(frame + 1)[:-1]).astype(np.float32)
+        freqs = np.fft.rfftfreq(frame, 1.0 / sample_rate)
+        self.passband = (freqs >= highpass_hz).astype(np.float32)
+        self.reset()
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["NoiseSuppressor"]:
+        """A suppressor per the config, or None when disabled."""
+        if not config.noise_suppression:
+            return None
+        return cls(
+            config.sample_rate,
+            reduction_db=config.noise_reduction_db,
+            agc_target_dbfs=config.agc_target_dbfs,
+        )
+
+    def reset(self) -> None:
+        """Forget the stream (noise profile, overlap and AGC state)."""
+        self.noise: Optional[np.ndarray] = None
+        self.agc_gain = 1.0
+        self._pending = np.zeros(self.hop, dtype=np.float32)  # Input not framed yet
+        self._overlap = np.zeros(self.hop, dtype=np.float32)  # Second half of the last frame
+
+    def _update_noise(self, power: np.ndarray) -> np.ndarray:
+        # Noise power in a bin is roughly exponential, so its p-th percentile
+        # is -ln(1 - p) times the mean
+        estimate = np.percentile(power, self.noise_percentile, axis=0).astype(np.float32)
+        estimate /= -np.log1p(-self.noise_percentile / 100.0)
+        if self.noise is None:
+            self.noise = estimate
+        else:
+            # Follow drops quickly and rises slowly
+            rate = np.where(estimate < self.noise, 0.8, self.noise_adapt).astype(np.float32)
+            self.noise = self.noise + rate * (estimate - self.noise)
+        return self.noise
+
+    def _agc(self, out: np.ndarray, speech: np.ndarray) -> np.ndarray:
+        # A few loud frames are more likely a bump than speech
+        if not self.agc_target or speech.sum() < max(1, len(speech) // 10):
+            return out
+        frames = out[: len(speech) * self.hop].reshape(len(speech), self.hop)
+        level = float(np.sqrt(np.mean(frames[speech] ** 2)))
+        if level <= 1e-6:
+            return out
+        wanted = min(self.agc_target / level, self.agc_max_gain)
+        previous = self.agc_gain
+        self.agc_gain = previous + self.agc_adapt * (wanted - previous)
+        ramp = np.linspace(previous, self.agc_gain, len(out), dtype=np.float32)
+        return out * ramp
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Suppress noise in one block of mono samples (int16, or float32 in [-1, 1])."""
+        if samples.dtype == np.float32:
+            x = samples
+        else:
+            x = np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32)
+        buffer = np.concatenate((self._pending, x))
+        count = (len(buffer) - self.frame) // self.hop + 1 if len(buffer) >= self.frame else 0
+        if count <= 0:
+            self._pending = buffer
+            return np.zeros(0, dtype=np.int16)
+
+        frames = sliding_window_view(buffer, self.frame)[:: self.hop][:count]
+        spectrum = np.fft.rfft(frames * self.window, axis=1)
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+
+        noise = self._update_noise(power)
+        gain = 1.0 - self.over_subtraction * noise / np.maximum(power, 1e-12)
+        gain = _smooth(_smooth(gain.astype(np.float32), 3, axis=0), 3, axis=1)
+        gain = np.maximum(gain, self.floor) * self.passband
+
+        y = np.fft.irfft(spectrum * gain, n=self.frame, axis=1).astype(np.float32) * self.window
+        # Overlap-add: each output hop is this frame's first half plus the
+        # previous frame's second half
+        second = np.concatenate((self._overlap[None, :], y[:-1, self.hop:]))
+        out = (y[:, : self.hop] + second).reshape(-1)
+        self._overlap = y[-1, self.hop:].copy()
+        self._pending = buffer[count * self.hop:].copy()
+
+        # Frames clearly above the noise floor count as speech for the AGC
+        speech = power @ self.passband > 4.0 * float(noise @ self.passband)
+        return to_int16(self._agc(out, speech))
+
+    def process_chunk(self, chunk: AudioChunk) -> AudioChunk:
+        """Process a chunk; timing fields are kept (output lags by `hop`)."""
+        data = self.process(chunk.data)
+        return AudioChunk(
+            data=data,
+            sample_rate=chunk.sample_rate,
+            timestamp=chunk.timestamp,
+            duration=len(data) / chunk.sample_rate,
+        )
@@ -1,11 +1,14 @@
 """Async audio recorder that captures 10-second batches."""
 
 import asyncio
-from typing import AsyncIterator
+import time
+from typing import AsyncIterator, Optional
 
 import numpy as np
 import sounddevice as sd
 
+from speakwith.audio.resample import CaptureConverter
+from speakwith.audio.ring import AudioRing
 from speakwith.config import Config
 from speakwith.models import AudioChunk
 
@@ -15,48 +18,52 @@ class AudioRecorder:
 
     Yields AudioChunk objects containing numpy arrays of audio data.
     Designed to run continuously, producing one chunk every `chunk_duration` seconds.
+
+    Capture runs in a PortAudio callback that writes int16 samples into an
+    AudioRing; chunks are views into the ring, so recording never pauses
+    between chunks and no float copies are made on the capture side.
+
+    The device is opened at its native rate and channel count; blocks are
+    mixed down and resampled to `sample_rate` in NumPy (CaptureConverter)
+    instead of relying on the host API's resampling.
     """
 
+    # Chunks the ring holds; must exceed the chunks in flight downstream
+    RING_SLOTS = 16
+
     def __init__(self, config: Config):
         self.sample_rate = config.sample_rate
         self.chunk_duration = config.chunk_duration
+        self.capture_native = config.capture_native
+        self.capture_channels = config.capture_channels
+        self.converter: Optional[CaptureConverter] = None
+        self.ring: Optional[AudioRing] = None
+        self.xruns = 0  # Input overflows reported by the driver
+        self._ready: Optional[asyncio.Event] = None
         self._running = False
 
+    def reconfigure(self, config: Config) -> None:
+        """Use a new chunk duration from the next chunk on."""
+        self.chunk_duration = config.chunk_duration
+
+    def stats(self) -> dict:
+        """Samples dropped by the ring and driver input overflows."""
+        return {"overruns": self.ring.overruns if self.ring else 0, "xruns": self.xruns}
+
     @property
     def samples_per_chunk(self) -> int:
         """Number of samples in each audio chunk."""
         return int(self.sample_rate * self.chunk_duration)
 
-    async def record_chunk(self) -> AudioChunk:
-        """Record a single audio chunk.
-
-        Returns:
-            AudioChunk containing the recorded audio data.
-        """
-        import time
-
-        loop = asyncio.get_event_loop()
-
-        # Run blocking recording in executor
-        def _record() -> np.ndarray:
-            recording = sd.rec(
-                self.samples_per_chunk,
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype=np.float32,
-            )
-            sd.wait()
-            return recording.flatten()
-
-        timestamp = time.time()
-        data = await loop.run_in_executor(None, _record)
-
-        return AudioChunk(
-            data=data,
-            sample_rate=self.sample_rate,
-            timestamp=timestamp,
-            duration=self.chunk_duration,
-        )
+    def _device_format(self) -> tuple[int, int]:
+        """(sample rate, channels) to open the input device with."""
+        if not self.capture_native:
+            return self.sample_rate, 1
+        info = sd.query_devices(kind="input")
+        channels = int(info["max_input_channels"]) or 1
+        if self.capture_channels:
+            channels = min(channels, self.capture_channels)
+        return int(info["default_samplerate"]), channels
 
     async def stream(self) -> AsyncIterator[AudioChunk]:
         """Continuously record and yield audio chunks.
@@ -64,14 +71,54 @@ class AudioRecorder:
         Yields:
             AudioChunk objects, one every chunk_duration seconds.
         """
+        loop = asyncio.get_event_loop()
+        self._ready = ready = asyncio.Event()
+        self.ring = ring = AudioRing(self.samples_per_chunk, self.RING_SLOTS)
+        device_rate, channels = self._device_format()
+        self.converter = converter = CaptureConverter(device_rate, channels, self.sample_rate)
+
+        def _callback(indata: np.ndarray, frames: int, time_info, status) -> None:
+            if status.input_overflow:
+                self.xruns += 1
+            if self.ring.write(converter.process(indata)):
+                loop.call_soon_threadsafe(ready.set)
+
         self._running = True
+        started = time.time()
+        samples_yielded = 0
+        stream = sd.InputStream(
+            samplerate=device_rate,
+            channels=channels,
+            dtype=np.int16,
+            callback=_callback,
+        )
+        stream.start()
         try:
             while self._running:
-                chunk = await self.record_chunk()
-                yield chunk
+                await ready.wait()
+                ready.clear()
+                while self._running and (data := ring.read()) is not None:
+                    yield AudioChunk(
+                        data=data,
+                        sample_rate=self.sample_rate,
+                        timestamp=started + samples_yielded / self.sample_rate,
+                        duration=len(data) / self.sample_rate,
+                    )
+                    samples_yielded += len(data)
+
+                # A new chunk duration starts a new ring, carrying over the
+                # partly filled chunk; views into the old ring stay valid
+                if self.samples_per_chunk != ring.chunk_samples:
+                    new_ring = AudioRing(self.samples_per_chunk, self.RING_SLOTS)
+                    new_ring.write(ring.partial())
+                    self.ring = ring = new_ring
         finally:
             self._running = False
+            stream.stop()
+            stream.close()
 
     def stop(self) -> None:
         """Stop the recording stream."""
         self._running = False
+        if self._ready is not None:
+            self._ready.set()
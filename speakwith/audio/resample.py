@@ -0,0 +1,165 @@
+"""Streaming channel mixdown and polyphase resampling for device-native capture."""
+
+from math import ceil, gcd
+from typing import Optional, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def taps_per_phase(up: int, down: int, zero_crossings: int = 12) -> int:
+    """Filter taps per polyphase branch for a sinc with `zero_crossings` per side."""
+    return ceil(2 * zero_crossings * max(up, down) / up)
+
+
+def design_lowpass(up: int, down: int, taps_per_phase: int, beta: float = 8.6) -> np.ndarray:
+    """Kaiser-windowed sinc anti-aliasing filter for an up/down ratio.
+
+    Returns `up * taps_per_phase` taps at the upsampled rate, with unity
+    passband gain after zero-stuffing.
+    """
+    length = up * taps_per_phase
+    cutoff = 0.5 / max(up, down) * 0.9  # Fraction of the upsampled rate
+    n = np.arange(length) - (length - 1) / 2.0
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, beta)
+    return (taps * (up / taps.sum())).astype(np.float32)
+
+
+class PolyphaseResampler:
+    """Rational-ratio resampler that keeps its state across blocks.
+
+    Feeding a signal in arbitrary blocks gives the same output as feeding
+    it at once. Each block is processed with one vectorized gather and
+    dot product per output sample; no Python loop runs per sample.
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, zero_crossings: int = 12):
+        divisor = gcd(in_rate, out_rate)
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.up = out_rate // divisor
+        self.down = in_rate // divisor
+        self.taps_per_phase = taps_per_phase(self.up, self.down, zero_crossings)
+
+        taps = design_lowpass(self.up, self.down, self.taps_per_phase)
+        # phases[p, k] = taps[p + k * up], reversed along k to match the
+        # oldest-first windows taken from the input
+        self.phases = np.ascontiguousarray(
+            taps.reshape(self.taps_per_phase, self.up).T[:, ::-1]
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget previous input (start of a new stream)."""
+        self._history = np.zeros(self.taps_per_phase - 1, dtype=np.float32)
+        self._consumed = 0  # Input samples seen before the current block
+        self._next = 0  # Upsampled-domain index of the next output sample
+
+    @property
+    def delay(self) -> float:
+        """Group delay of the filter, in output samples."""
+        return (self.up * self.taps_per_phase - 1) / 2.0 / self.down
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample one block of mono float32 samples."""
+        samples = np.asarray(samples, dtype=np.float32)
+        total = self._consumed + len(samples)
+        last = total * self.up - 1  # Last upsampled index covered by input
+        count = max(0, (last - self._next) // self.down + 1)
+
+        extended = np.concatenate((self._history, samples))
+        if count:
+            positions = self._next + self.down * np.arange(count, dtype=np.int64)
+            starts = positions // self.up - self._consumed
+            windows = sliding_window_view(extended, self.taps_per_phase)[starts]
+            out = np.einsum("nk,nk->n", windows, self.phases[positions % self.up])
+        else:
+            out = np.zeros(0, dtype=np.float32)
+
+        self._history = extended[len(extended) - (self.taps_per_phase - 1):]
+        self._consumed = total
+        self._next += count * self.down
+        return out
+
+
+class ChannelMixer:
+    """Weighted, optionally delayed sum of input channels (delay-and-sum).
+
+    With no weights or delays this is a plain average. Per-channel
+    integer delays steer a microphone array; the last samples of each
+    block are kept so delays work across block boundaries.
+    """
+
+    def __init__(
+        self,
+        channels: int,
+        weights: Optional[Sequence[float]] = None,
+        delays: Optional[Sequence[int]] = None,
+    ):
+        self.channels = channels
+        if weights is None:
+            weights = [1.0 / channels] * channels
+        if len(weights) != channels:
+            raise ValueError(f"expected {channels} weights, got {len(weights)}")
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.delays = np.asarray(delays if delays is not None else [0] * channels, dtype=np.int64)
+        if len(self.delays) != channels or (self.delays < 0).any():
+            raise ValueError("delays must be one non-negative integer per channel")
+        self._max_delay = int(self.delays.max()) if channels else 0
+        self._tail = np.zeros((self._max_delay, channels), dtype=np.float32)
+
+    def process(self, frames: np.ndarray) -> np.ndarray:
+        """Mix (frames, channels) int16 or float input to mono float32 in [-1, 1]."""
+        scale = np.float32(1.0 / 32768.0) if frames.dtype == np.int16 else np.float32(1.0)
+        if frames.ndim == 1:
+            return np.multiply(frames, scale, dtype=np.float32)
+        if self._max_delay == 0:
+            return frames @ (self.weights * scale)
+
+        block = np.concatenate((self._tail, np.multiply(frames, scale, dtype=np.float32)))
+        n = len(frames)
+        out = np.zeros(n, dtype=np.float32)
+        for channel in range(self.channels):
+            start = self._max_delay - int(self.delays[channel])
+            out += self.weights[channel] * block[start:start + n, channel]
+        self._tail = block[len(block) - self._max_delay:]
+        return out
+
+
+def to_int16(samples: np.ndarray) -> np.ndarray:
+    """Round float samples in [-1, 1] to clipped int16."""
+    return np.clip(np.rint(samples * 32768.0), -32768, 32767).astype(np.int16)
+
+
+class CaptureConverter:
+    """Turns device-native blocks into mono int16 at the pipeline rate.
+
+    Mono input at the target rate passes through untouched.
+    """
+
+    def __init__(
+        self,
+        in_rate: int,
+        channels: int,
+        out_rate: int,
+        weights: Optional[Sequence[float]] = None,
+        delays: Optional[Sequence[int]] = None,
+    ):
+        self.in_rate = in_rate
+        self.channels = channels
+        self.out_rate = out_rate
+        self.mixer = ChannelMixer(channels, weights, delays)
+        self.resampler = PolyphaseResampler(in_rate, out_rate) if in_rate != out_rate else None
+
+    @property
+    def passthrough(self) -> bool:
+        return self.resampler is None and self.channels == 1
+
+    def process(self, frames: np.ndarray) -> np.ndarray:
+        """Convert one (frames, channels) block."""
+        if self.passthrough:
+            return frames[:, 0] if frames.ndim == 2 else frames
+        mono = self.mixer.process(frames)
+        if self.resampler is not None:
+            mono = self.resampler.process(mono)
+        return to_int16(mono)
@@ -0,0 +1,88 @@
+"""Preallocated int16 ring buffer handing out whole chunks as views."""
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+
+class AudioRing:
+    """Chunk-aligned ring of int16 samples.
+
+    The capture callback copies each block from the audio driver into
+    the ring (the only copy on the capture side). Completed chunks are
+    read back as views into the ring, so nothing is copied on the way
+    to the transcriber.
+
+    A view stays valid while fewer than `slots - 1` newer chunks have been
+    written after it. The writer never overwrites a slot that has not been
+    read yet; if the reader falls that far behind, incoming audio is
+    dropped and counted in `overruns` instead.
+    """
+
+    def __init__(self, chunk_samples: int, slots: int = 8):
+        if chunk_samples <= 0 or slots < 2:
+            raise ValueError("need a positive chunk size and at least two slots")
+        self.chunk_samples = chunk_samples
+        self.slots = slots
+        self.buffer = np.zeros((slots, chunk_samples), dtype=np.int16)
+        self.overruns = 0  # Samples dropped because the reader fell behind
+
+        self._lock = threading.Lock()
+        self._write_slot = 0
+        self._write_pos = 0  # Samples filled in the current write slot
+        self._written = 0  # Completed chunks
+        self._read = 0  # Chunks handed to the reader
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the ring."""
+        return self.buffer.nbytes
+
+    @property
+    def available(self) -> int:
+        """Completed chunks not read yet."""
+        with self._lock:
+            return self._written - self._read
+
+    def write(self, samples: np.ndarray) -> int:
+        """Append samples (any length); returns how many chunks completed.
+
+        Safe to call from the audio driver's callback thread.
+        """
+        completed = 0
+        offset = 0
+        total = len(samples)
+        with self._lock:
+            while offset < total:
+                if self._written - self._read >= self.slots - 1:
+                    self.overruns += total - offset
+                    break
+                room = self.chunk_samples - self._write_pos
+                take = min(room, total - offset)
+                row = self.buffer[self._write_slot]
+                row[self._write_pos:self._write_pos + take] = samples[offset:offset + take]
+                self._write_pos += take
+                offset += take
+                if self._write_pos == self.chunk_samples:
+                    self._write_pos = 0
+                    self._write_slot = (self._write_slot + 1) % self.slots
+                    self._written += 1
+                    completed += 1
+        return completed
+
+    def read(self) -> Optional[np.ndarray]:
+        """Oldest unread chunk as a read-only view, or None if none is ready."""
+        with self._lock:
+            if self._read == self._written:
+                return None
+            view = self.buffer[self._read % self.slots]
+            self._read += 1
+        view = view.view()
+        view.flags.writeable = False
+        return view
+
+    def partial(self) -> np.ndarray:
+        """Copy of the samples in the chunk being filled (used when stopping)."""
+        with self._lock:
+            return self.buffer[self._write_slot, :self._write_pos].copy()
@@ -0,0 +1,166 @@
+"""Shared-memory int16 sample ring between a capture process and its reader."""
+
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+# Header slots (int64). Each one has a single writer, so a plain aligned
+# 8-byte store is enough to publish it.
+WRITTEN = 0  # Samples written in total (capture process)
+READ = 1  # Samples handed to the reader in total (reader)
+OVERRUNS = 2  # Samples dropped because the reader fell behind (capture process)
+XRUNS = 3  # Input overflows reported by the audio driver (capture process)
+HEARTBEAT = 4  # Capture loop iterations (capture process)
+STOP = 5  # Non-zero asks the capture process to exit (reader)
+STARTED = 6  # Wall-clock time of the first sample, float64 bits (capture process)
+STATE = 7  # STARTING, RUNNING or FAILED (capture process)
+HEADER_SLOTS = 8
+
+STARTING, RUNNING, FAILED = 0, 1, 2
+
+
+class SharedAudioRing:
+    """Single-producer, single-consumer sample ring in shared memory.
+
+    The capture process copies each driver block in and then publishes the
+    new WRITTEN cursor; the reader checks WRITTEN, hands out views of the
+    samples below it and publishes READ. Data is always stored before the
+    cursor that makes it visible (on weakly ordered CPUs this relies on the
+    cursor store not being reordered ahead of the copy, which holds for
+    x86 and for the separate NumPy calls used here in practice).
+
+    The first `mirror` samples are duplicated past the end of the buffer,
+    so any read of up to `mirror` samples is one contiguous view, even
+    across the wrap. The writer keeps `reserve` samples behind READ
+    untouched: a view stays valid until about `reserve` more samples have
+    been read after it. Audio that would overwrite them is dropped and
+    counted in OVERRUNS.
+
+    Args:
+        capacity: Samples in the ring.
+        mirror: Longest read, in samples.
+        name: Shared memory block to attach to (None creates one).
+    """
+
+    def __init__(self, capacity: int, mirror: int, name: Optional[str] = None):
+        if mirror <= 0 or mirror > capacity // 2:
+            raise ValueError("mirror must be positive and at most half the capacity")
+        self.capacity = capacity
+        self.mirror = mirror
+        self.reserve = capacity // 2
+        size = HEADER_SLOTS * 8 + (capacity + mirror) * 2
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        self.header = np.ndarray((HEADER_SLOTS,), dtype=np.int64, buffer=self.shm.buf)
+        self.samples = np.ndarray(
+            (capacity + mirror,), dtype=np.int16, buffer=self.shm.buf, offset=HEADER_SLOTS * 8
+        )
+        if self.owner:
+            self.header[:] = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    # ----- capture process side ---------------------------------------------
+
+    def write(self, samples: np.ndarray) -> int:
+        """Append samples and publish them; returns how many fit."""
+        written = int(self.header[WRITTEN])
+        room = int(self.header[READ]) + self.capacity - self.reserve - written
+        n = len(samples)
+        if n > room:
+            self.header[OVERRUNS] += n - max(room, 0)
+            n = max(room, 0)
+        if n == 0:
+            return 0
+
+        pos = written % self.capacity
+        first = min(n, self.capacity - pos)
+        self.samples[pos:pos + first] = samples[:first]
+        if first < n:
+            self.samples[:n - first] = samples[first:n]
+        # Keep the mirror of the buffer's head up to date
+        for start, end in ((pos, pos + first), (0, n - first)):
+            if start < self.mirror and end > start:
+                stop = min(end, self.mirror)
+                self.samples[self.capacity + start:self.capacity + stop] = self.samples[start:stop]
+
+        self.header[WRITTEN] = written + n
+        return n
+
+    def count_xrun(self) -> None:
+        self.header[XRUNS] += 1
+
+    def beat(self) -> None:
+        self.header[HEARTBEAT] += 1
+
+    def mark_started(self, timestamp: float) -> None:
+        self.header[STARTED:STARTED + 1].view(np.float64)[0] = timestamp
+        self.header[STATE] = RUNNING
+
+    def mark_failed(self) -> None:
+        self.header[STATE] = FAILED
+
+    @property
+    def stop_requested(self) -> bool:
+        return bool(self.header[STOP])
+
+    # ----- reader side ------------------------------------------------------
+
+    @property
+    def available(self) -> int:
+        """Samples written but not read yet."""
+        return int(self.header[WRITTEN]) - int(self.header[READ])
+
+    @property
+    def started(self) -> float:
+        return float(self.header[STARTED:STARTED + 1].view(np.float64)[0])
+
+    @property
+    def state(self) -> int:
+        return int(self.header[STATE])
+
+    def read(self, n: int) -> Optional[np.ndarray]:
+        """The next `n` samples as a read-only view, or None until they are written."""
+        if n > self.mirror:
+            raise ValueError(f"reads are limited to {self.mirror} samples")
+        read = int(self.header[READ])
+        if int(self.header[WRITTEN]) - read < n:
+            return None
+        offset = read % self.capacity
+        view = self.samples[offset:offset + n].view()
+        view.flags.writeable = False
+        self.header[READ] = read + n
+        return view
+
+    def request_stop(self) -> None:
+        self.header[STOP] = 1
+
+    def stats(self) -> dict:
+        return {
+            "written": int(self.header[WRITTEN]),
+            "read": int(self.header[READ]),
+            "overruns": int(self.header[OVERRUNS]),
+            "xruns": int(self.header[XRUNS]),
+            "heartbeat": int(self.header[HEARTBEAT]),
+        }
+
+    # ----- lifetime ---------------------------------------------------------
+
+    def close(self) -> None:
+        """Unmap the block (left mapped while chunk views are still alive)."""
+        self.header = self.samples = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass
+
+    def unlink(self) -> None:
+        """Free the block once every process has closed it (owner only)."""
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
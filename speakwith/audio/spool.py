@@ -0,0 +1,274 @@
+"""On-disk, memory-mapped spool of session audio with a time index."""
+
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+import wave
+from bisect import bisect_right
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from speakwith.config import Config
+from speakwith.models import AudioChunk
+
+AUDIO_FILENAME = "audio.pcm"
+INDEX_FILENAME = "index.json"
+
+
+@dataclass(frozen=True)
+class SpoolEntry:
+    """One spooled chunk: where its samples start and when it was captured."""
+
+    start: int  # Absolute sample position (counts every sample ever written)
+    length: int
+    timestamp: float  # Wall-clock capture time of the first sample
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+
+class AudioSpool:
+    """Preallocated, memory-mapped int16 ring file of recent session audio.
+
+    Chunks are appended in capture order. The file holds `retention`
+    seconds; once full, the oldest audio is overwritten and its index
+    entries are evicted first. Any retained time range can be read back
+    as a NumPy view into the mapping (a copy when the range wraps around
+    the end of the file or is about to be overwritten; see `read_samples`).
+
+    `append()` never blocks: each chunk is copied and queued for a writer
+    thread, and dropped (counted in `dropped_samples`) if that queue is
+    full. The copy is needed because chunks are usually views into a
+    capture ring, which may reuse their slots before a stalled writer
+    gets to them.
+
+    Args:
+        directory: Directory for the audio file and its index.
+        sample_rate: Sample rate of the spooled audio.
+        retention: Seconds of audio kept on disk.
+    """
+
+    QUEUE_CHUNKS = 64
+    GUARD_SECONDS = 30.0  # Live reads this close to being overwritten are copied
+
+    def __init__(self, directory: Path, sample_rate: int, retention: float = 900.0):
+        directory.mkdir(parents=True, exist_ok=True)
+        # Never truncate another spool's audio (raises FileExistsError)
+        (directory / AUDIO_FILENAME).touch(exist_ok=False)
+        self._setup(directory, sample_rate, max(1, int(retention * sample_rate)), "w+")
+
+    def _setup(self, directory: Path, sample_rate: int, capacity: int, mode: str) -> None:
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.capacity = capacity
+        self._map = np.memmap(directory / AUDIO_FILENAME, dtype="<i2", mode=mode, shape=(capacity,))
+        self._readonly = mode == "r"
+        self._entries: deque[SpoolEntry] = deque()
+        self._written = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_CHUNKS)
+        self._thread: Optional[threading.Thread] = None
+        self.dropped_samples = 0
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["AudioSpool"]:
+        """A spool in a new per-session directory, or None when disabled."""
+        if not config.audio_spool:
+            return None
+        # Sessions can start within the same second (e.g. on the server)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        return cls(config.user_data_dir / "spool" / name, config.sample_rate, config.spool_retention)
+
+    @classmethod
+    def open(cls, directory: Path) -> "AudioSpool":
+        """Open a closed spool read-only (for replay or corpus building)."""
+        index = json.loads((directory / INDEX_FILENAME).read_text())
+        spool = cls.__new__(cls)
+        spool._setup(directory, index["sample_rate"], index["capacity"], "r")
+        spool._entries.extend(SpoolEntry(**entry) for entry in index["entries"])
+        spool._written = index["written"]
+        spool.dropped_samples = index.get("dropped_samples", 0)
+        return spool
+
+    # ----- writing ----------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._readonly or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._writer, name="audio-spool", daemon=True)
+        self._thread.start()
+
+    def append(self, chunk: AudioChunk) -> bool:
+        """Queue a chunk for writing; returns False if it had to be dropped."""
+        try:
+            # Copy now: the capture ring reuses its slots after a few chunks
+            self._queue.put_nowait((np.array(chunk.data, copy=True), chunk.timestamp))
+        except queue.Full:
+            self.dropped_samples += len(chunk.data)
+            return False
+        return True
+
+    def _write(self, samples: np.ndarray, timestamp: float) -> None:
+        samples = samples[-self.capacity:]
+        n = len(samples)
+        with self._lock:
+            start = self._written
+        offset = start % self.capacity
+        first = min(n, self.capacity - offset)
+        self._map[offset:offset + first] = samples[:first]
+        if first < n:
+            self._map[:n - first] = samples[first:]
+
+        with self._lock:
+            self._written = start + n
+            self._entries.append(SpoolEntry(start, n, timestamp))
+            oldest = self._written - self.capacity
+            while self._entries and self._entries[0].start < oldest:
+                self._entries.popleft()
+
+    def _writer(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self._write(*item)
+
+    def close(self) -> None:
+        """Write out queued chunks, flush the file and save the index."""
+        if self._readonly:
+            return
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self._map.flush()
+        with self._lock:
+            index = {
+                "sample_rate": self.sample_rate,
+                "capacity": self.capacity,
+                "written": self._written,
+                "dropped_samples": self.dropped_samples,
+                "entries": [asdict(entry) for entry in self._entries],
+            }
+        (self.directory / INDEX_FILENAME).write_text(json.dumps(index))
+
+    # ----- reading ----------------------------------------------------------
+
+    @property
+    def entries(self) -> list[SpoolEntry]:
+        """Retained chunks, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def written(self) -> int:
+        """Samples appended so far (the end position of the newest audio)."""
+        with self._lock:
+            return self._written
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio currently retained."""
+        with self._lock:
+            return min(self._written, self.capacity) / self.sample_rate
+
+    def time_range(self) -> Optional[tuple[float, float]]:
+        """Wall-clock (start, end) of the retained audio."""
+        with self._lock:
+            if not self._entries:
+                return None
+            first, last = self._entries[0], self._entries[-1]
+        return first.timestamp, last.timestamp + last.length / self.sample_rate
+
+    def _position(self, entries: list[SpoolEntry], t: float) -> int:
+        """Absolute sample position of wall-clock time `t` (clamped to the index)."""
+        i = max(bisect_right([e.timestamp for e in entries], t) - 1, 0)
+        entry = entries[i]
+        offset = round((t - entry.timestamp) * self.sample_rate)
+        return entry.start + min(max(offset, 0), entry.length)
+
+    def read_samples(self, start: int, end: int) -> np.ndarray:
+        """Samples between absolute positions, clipped to what is retained.
+
+        Returns a read-only view into the file unless the range wraps, or,
+        while the spool is being written, starts within `GUARD_SECONDS` of
+        the oldest retained sample: the writer overwrites that audio next,
+        so such ranges are copied, and samples overwritten during the copy
+        are cut from its start. A view is valid until the writer has
+        appended `capacity` samples past its start.
+        """
+        with self._lock:
+            oldest = max(self._written - self.capacity, 0)
+            start = max(start, oldest)
+            end = min(end, self._written)
+        if end <= start:
+            return np.zeros(0, dtype=np.int16)
+        offset = start % self.capacity
+        n = end - start
+        near_head = not self._readonly and start - oldest < self.GUARD_SECONDS * self.sample_rate
+        if offset + n <= self.capacity and not near_head:
+            view = self._map[offset:offset + n].view(np.ndarray)
+        else:
+            if offset + n <= self.capacity:
+                view = np.array(self._map[offset:offset + n])
+            else:
+                view = np.concatenate((self._map[offset:], self._map[:n - (self.capacity - offset)]))
+            if not self._readonly:
+                with self._lock:
+                    overwritten = self._written - self.capacity - start
+                view = view[max(overwritten, 0):]
+        view.flags.writeable = False
+        return view
+
+    def retained(self) -> np.ndarray:
+        """All indexed audio, oldest first."""
+        with self._lock:
+            if not self._entries:
+                return np.zeros(0, dtype=np.int16)
+            start, end = self._entries[0].start, self._entries[-1].end
+        return self.read_samples(start, end)
+
+    def read(self, start_time: float, end_time: float) -> np.ndarray:
+        """Retained audio between two wall-clock times."""
+        entries = self.entries
+        if not entries:
+            return np.zeros(0, dtype=np.int16)
+        return self.read_samples(self._position(entries, start_time), self._position(entries, end_time))
+
+    def chunk(self, start_time: float, end_time: float) -> AudioChunk:
+        """Retained audio between two times as an AudioChunk (for re-transcription)."""
+        data = self.read(start_time, end_time)
+        return AudioChunk(
+            data=data,
+            sample_rate=self.sample_rate,
+            timestamp=start_time,
+            duration=len(data) / self.sample_rate,
+        )
+
+    def write_wav(self, path: Path, start_time: Optional[float] = None, end_time: Optional[float] = None) -> float:
+        """Export a time range (default: everything retained) as 16-bit mono WAV.
+
+        Returns:
+            Seconds written.
+        """
+        span = self.time_range()
+        if span is None or (start_time is None and end_time is None):
+            data = self.retained()
+        else:
+            data = self.read(span[0] if start_time is None else start_time,
+                             span[1] if end_time is None else end_time)
+        with wave.open(str(path), "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(self.sample_rate)
+            out.writeframes(np.ascontiguousarray(data, dtype="<i2").tobytes())
+        return len(data) / self.sample_rate
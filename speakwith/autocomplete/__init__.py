@@ -0,0 +1,12 @@
+"""Predictive text for composing custom responses."""
+
+from speakwith._lazy import lazy_exports
+
+__all__ = ["HISTORY_FILENAME", "PredictiveText", "strip_markdown", "write_history"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "HISTORY_FILENAME": "speakwith.autocomplete.predictor",
+    "PredictiveText": "speakwith.autocomplete.predictor",
+    "strip_markdown": "speakwith.autocomplete.predictor",
+    "write_history": "speakwith.autocomplete.predictor",
+})
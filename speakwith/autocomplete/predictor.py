@@ -0,0 +1,257 @@
+"""Local predictive text trained on the user's own responses."""
+
+import gzip
+import json
+import re
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Number of candidates cached on every trie node
+TOP_PER_NODE = 8
+
+# How much a committed response counts compared to seed text
+RESPONSE_WEIGHT = 3
+
+# File under user_data_dir holding the learned responses
+HISTORY_FILENAME = "autocomplete.json.gz"
+
+# Sentence-start marker used as n-gram context for an empty draft
+BOS = "<s>"
+
+_WORD_RE = re.compile(r"[A-Za-z0-9']+")
+_SENTENCE_RE = re.compile(r"[.!?\n]+")
+_PLACEHOLDER_RE = re.compile(r"\([^)]*\)")
+
+
+def tokenize(text: str) -> list[list[str]]:
+    """Split text into sentences of words (original casing kept)."""
+    sentences = []
+    for sentence in _SENTENCE_RE.split(text):
+        words = _WORD_RE.findall(sentence)
+        if words:
+            sentences.append(words)
+    return sentences
+
+
+def strip_markdown(text: str) -> str:
+    """Drop headings, list markers and template placeholders from markdown."""
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        line = _PLACEHOLDER_RE.sub("", line.lstrip("-*> ")).strip()
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+class _TrieNode:
+    """Prefix trie node caching its most frequent completions."""
+
+    __slots__ = ("children", "top")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_TrieNode"] = {}
+        self.top: list[tuple[int, str]] = []  # (count, word), best first
+
+
+class _NGramCounts:
+    """Unigram, bigram and trigram counts over lowercase words."""
+
+    def __init__(self) -> None:
+        self.unigrams: dict[str, int] = {}
+        self.bigrams: dict[str, dict[str, int]] = {}
+        self.trigrams: dict[str, dict[str, int]] = {}  # key: "w1 w2"
+
+    def add(self, words: list[str], weight: int) -> None:
+        """Count one sentence of lowercase words."""
+        context = [BOS] + words
+        for i, word in enumerate(words):
+            self.unigrams[word] = self.unigrams.get(word, 0) + weight
+            prev = context[i]
+            followers = self.bigrams.setdefault(prev, {})
+            followers[word] = followers.get(word, 0) + weight
+            if i >= 1:
+                key = f"{context[i - 1]} {prev}"
+                followers = self.trigrams.setdefault(key, {})
+                followers[word] = followers.get(word, 0) + weight
+
+    def to_dict(self) -> dict:
+        return {"u": self.unigrams, "b": self.bigrams, "t": self.trigrams}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "_NGramCounts":
+        counts = cls()
+        counts.unigrams = dict(data.get("u", {}))
+        counts.bigrams = {k: dict(v) for k, v in data.get("b", {}).items()}
+        counts.trigrams = {k: dict(v) for k, v in data.get("t", {}).items()}
+        return counts
+
+
+class PredictiveText:
+    """Prefix trie plus n-gram model for completing custom responses.
+
+    Seed text (background, mode phrases) and the user's committed
+    responses are counted together for prediction, but only the learned
+    responses are persisted, so seeds can change between sessions without
+    being counted twice.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._combined = _NGramCounts()
+        self._learned = _NGramCounts()
+        self._forms: dict[str, str] = {}  # lowercase -> preferred surface form
+
+    # ----- training -------------------------------------------------------
+
+    def _count(self, counts: list[_NGramCounts], text: str, weight: int) -> None:
+        for sentence in tokenize(text):
+            lowered = [w.lower() for w in sentence]
+            for word, surface in zip(lowered, sentence):
+                if surface == word or word not in self._forms:
+                    self._forms[word] = surface
+            for target in counts:
+                target.add(lowered, weight)
+            for word in set(lowered):
+                self._index(word, self._combined.unigrams[word])
+
+    def _index(self, word: str, count: int) -> None:
+        """Refresh the cached top lists along the word's trie path."""
+        node = self._root
+        self._update_top(node, word, count)
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            self._update_top(node, word, count)
+
+    @staticmethod
+    def _update_top(node: _TrieNode, word: str, count: int) -> None:
+        top = [entry for entry in node.top if entry[1] != word]
+        top.append((count, word))
+        top.sort(key=lambda entry: -entry[0])
+        node.top = top[:TOP_PER_NODE]
+
+    def seed(self, text: str, weight: int = 1) -> None:
+        """Count background text without persisting it."""
+        self._count([self._combined], text, weight)
+
+    def seed_phrases(self, phrases: Iterable[str], weight: int = 1) -> None:
+        """Count a set of canned phrases without persisting them."""
+        for phrase in phrases:
+            self.seed(phrase, weight)
+
+    def learn(self, response: str) -> None:
+        """Learn from a response the user committed."""
+        self._count([self._combined, self._learned], response, RESPONSE_WEIGHT)
+
+    # ----- prediction -----------------------------------------------------
+
+    def complete(self, text: str, k: int = 3) -> list[str]:
+        """Return up to k words that complete or follow the draft.
+
+        If the draft ends mid-word the candidates complete that word,
+        otherwise they predict the next word.
+        """
+        words = _WORD_RE.findall(text.lower())
+        mid_word = bool(text) and bool(_WORD_RE.match(text[-1]))
+        prefix = words.pop() if mid_word and words else ""
+
+        context = [BOS] + words if not _ends_sentence(text) else [BOS]
+        prev = context[-1]
+        bigram = self._combined.bigrams.get(prev, {})
+        trigram = (
+            self._combined.trigrams.get(f"{context[-2]} {prev}", {})
+            if len(context) >= 2
+            else {}
+        )
+
+        candidates: set[str] = set()
+        if prefix:
+            node = self._find(prefix)
+            if node is not None:
+                candidates.update(word for _, word in node.top)
+            candidates.update(w for w in bigram if w.startswith(prefix))
+            candidates.update(w for w in trigram if w.startswith(prefix))
+            candidates.discard(prefix)
+        else:
+            candidates.update(bigram)
+            candidates.update(trigram)
+            if not candidates:
+                candidates.update(word for _, word in self._root.top)
+
+        unigrams = self._combined.unigrams
+        ranked = sorted(
+            candidates,
+            key=lambda w: -(
+                trigram.get(w, 0) * 100 + bigram.get(w, 0) * 10 + unigrams.get(w, 0)
+            ),
+        )
+        return [self._forms.get(word, word) for word in ranked[:k]]
+
+    def _find(self, prefix: str) -> Optional[_TrieNode]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    @staticmethod
+    def accept(text: str, completion: str) -> str:
+        """Return the draft with the completion applied and a trailing space."""
+        if text and _WORD_RE.match(text[-1]):
+            start = len(text)
+            while start > 0 and _WORD_RE.match(text[start - 1]):
+                start -= 1
+            text = text[:start]
+        elif text and not text.endswith(" "):
+            text += " "
+        return f"{text}{completion} "
+
+    # ----- persistence ----------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Serialize the learned responses as compact gzipped JSON."""
+        payload = {"v": 1, "counts": self._learned.to_dict(), "forms": {
+            word: form for word, form in self._forms.items() if form != word
+        }}
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return gzip.compress(raw)
+
+    def save(self, path: Path) -> None:
+        """Write the learned responses to disk."""
+        write_history(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path) -> "PredictiveText":
+        """Load learned responses from disk (empty model if missing or corrupt)."""
+        model = cls()
+        if not path.exists():
+            return model
+        try:
+            payload = json.loads(gzip.decompress(path.read_bytes()))
+        except (OSError, ValueError):
+            return model
+
+        learned = _NGramCounts.from_dict(payload.get("counts", {}))
+        model._learned = learned
+        model._combined = _NGramCounts.from_dict(learned.to_dict())
+        model._forms.update(payload.get("forms", {}))
+        for word, count in learned.unigrams.items():
+            model._index(word, count)
+        return model
+
+
+def write_history(path: Path, data: bytes) -> None:
+    """Atomically write serialized history (safe to call from an executor)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _ends_sentence(text: str) -> bool:
+    """True if the draft's last non-space character ends a sentence."""
+    stripped = text.rstrip()
+    return bool(stripped) and stripped[-1] in ".!?"
@@ -0,0 +1,19 @@
+"""Benchmark harness for end-to-end pipeline latency."""
+
+from speakwith._lazy import lazy_exports
+
+__all__ = [
+    "BenchmarkResult",
+    "BenchmarkRunner",
+    "ReplayAudioSource",
+    "ScriptedLLMClient",
+    "StandInLLMServer",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "BenchmarkResult": "speakwith.bench.runner",
+    "BenchmarkRunner": "speakwith.bench.runner",
+    "ReplayAudioSource": "speakwith.bench.replay",
+    "ScriptedLLMClient": "speakwith.bench.fake_llm",
+    "StandInLLMServer": "speakwith.bench.llm_server",
+})
@@ -0,0 +1,96 @@
+"""Run the end-to-end latency benchmark.
+
+Usage:
+    python -m speakwith.bench corpus/ --out results.json
+
+    # Record the real provider's replies once, then replay them offline
+    python -m speakwith.bench corpus/ --record-cassette llm.jsonl
+    python -m speakwith.bench corpus/ --cassette llm.jsonl --cassette-latency zero
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from speakwith.bench.fake_llm import ScriptedLLMClient
+from speakwith.bench.replay import ReplayAudioSource
+from speakwith.bench.runner import BenchmarkRunner, collect_corpus
+from speakwith.config import CASSETTE_LATENCIES, Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.llm.cassette import CassetteLLMClient
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m speakwith.bench",
+        description="Replay WAV files through the pipeline and report latency as JSON.",
+    )
+    parser.add_argument("corpus", nargs="+", type=Path, help="WAV files or directories of WAV files")
+    parser.add_argument("--out", type=Path, help="Write the JSON report here instead of stdout")
+    parser.add_argument("--whisper-model", default="base")
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--chunk-duration", type=float, default=10.0)
+    parser.add_argument("--realtime", action="store_true", help="Release chunks at recording pace")
+    parser.add_argument("--denoise", action="store_true", help="Run noise suppression before Whisper")
+    parser.add_argument("--suggestion-latency", type=float, nargs="+", default=[0.8],
+                        help="Scripted suggestion latencies in seconds (cycled)")
+    parser.add_argument("--summary-latency", type=float, nargs="+", default=[1.2],
+                        help="Scripted summary latencies in seconds (cycled)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- jitter on LLM latency")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--cassette", type=Path, help="Replay LLM responses from this cassette")
+    cassette.add_argument("--record-cassette", type=Path,
+                          help="Call the configured provider (.env) and record its responses here")
+    parser.add_argument("--cassette-latency", choices=CASSETTE_LATENCIES, default="recorded",
+                        help="Replay each recorded latency or answer at once")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    files = collect_corpus(args.corpus)
+    if not files:
+        raise SystemExit("No WAV files found in corpus")
+
+    config = Config(
+        openai_api_key="benchmark",
+        whisper_model=args.whisper_model,
+        sample_rate=args.sample_rate,
+        chunk_duration=args.chunk_duration,
+        noise_suppression=args.denoise,
+        # The command line wins over the mode's performance profile
+        explicit=frozenset({"whisper_model", "sample_rate", "chunk_duration", "noise_suppression"}),
+    )
+    source = ReplayAudioSource(files, config.sample_rate, config.chunk_duration, realtime=args.realtime)
+    llm: BaseLLMClient
+    if args.cassette:
+        llm = CassetteLLMClient(None, args.cassette, "replay", args.cassette_latency)
+    elif args.record_cassette:
+        from speakwith.llm.openai_client import OpenAIClient
+
+        llm = CassetteLLMClient(OpenAIClient(Config.load()), args.record_cassette, "record")
+    else:
+        llm = ScriptedLLMClient(
+            suggestion_latency=args.suggestion_latency,
+            summary_latency=args.summary_latency,
+            jitter=args.jitter,
+        )
+
+    runner = BenchmarkRunner(config, source, llm)
+    result = await runner.run()
+    return result.to_dict(runner.metadata())
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
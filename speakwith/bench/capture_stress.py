@@ -0,0 +1,230 @@
+"""Capture stress test: in-process vs. capture-process under a CPU hog.
+
+Usage:
+    python -m speakwith.bench.capture_stress [--seconds 8] [--hog-threads 4]
+
+A synthetic input stream stands in for the microphone: a thread paced
+like a driver delivers ramp samples in small blocks, and when its
+callback runs later than the host buffer allows, the overdue audio is
+dropped and reported as an input overflow, as PortAudio would. Each
+capture mode runs idle and next to CPU-hog threads in this process
+(pure-Python loops contending for the GIL, plus NumPy work); the ramp is
+checked for gaps in every chunk. Results are printed as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Optional
+
+import numpy as np
+
+from speakwith.audio.capture_process import ProcessAudioRecorder
+from speakwith.audio.resample import CaptureConverter
+from speakwith.audio.ring import AudioRing
+from speakwith.config import Config
+from speakwith.models import AudioChunk
+
+RAMP = 32768  # Ramp period in samples (int16 range)
+
+
+class SyntheticInputStream:
+    """Driver-paced ramp source with the sounddevice InputStream interface.
+
+    Args:
+        sample_rate: Frames per second delivered.
+        channels: Channels per frame (all carry the same ramp).
+        callback: Called as callback(indata, frames, time_info, status).
+        blocksize: Frames per callback.
+        host_buffer: Seconds of audio the "driver" holds for a late callback.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int,
+        callback: Callable,
+        blocksize: int = 512,
+        host_buffer: float = 0.05,
+    ):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.callback = callback
+        self.blocksize = blocksize
+        self.buffer_frames = max(blocksize, int(host_buffer * sample_rate))
+        self.overflows = 0
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self) -> None:
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="synthetic-input", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        pass
+
+    def _run(self) -> None:
+        started = time.monotonic()
+        produced = 0
+        overflow = False
+        while self._running:
+            target = started + (produced + self.blocksize) / self.sample_rate
+            delay = target - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            due = int((time.monotonic() - started) * self.sample_rate)
+            backlog = due - produced
+            if backlog > self.buffer_frames:
+                # The host buffer overflowed while the callback was late
+                produced += -(-(backlog - self.buffer_frames) // self.blocksize) * self.blocksize
+                self.overflows += 1
+                overflow = True
+            while produced + self.blocksize <= due and self._running:
+                ramp = (np.arange(produced, produced + self.blocksize) % RAMP).astype(np.int16)
+                block = np.repeat(ramp[:, None], self.channels, axis=1)
+                self.callback(block, self.blocksize, None, SimpleNamespace(input_overflow=overflow))
+                overflow = False
+                produced += self.blocksize
+
+
+def open_synthetic(sample_rate: int, capture_native: bool, capture_channels: int, callback: Callable) -> tuple[Any, int, int]:
+    """StreamOpener for ProcessAudioRecorder (picklable, needs no PortAudio)."""
+    return SyntheticInputStream(sample_rate, 1, callback), sample_rate, 1
+
+
+class InProcessCapture:
+    """AudioRecorder's in-process path (callback -> AudioRing) on the synthetic stream."""
+
+    def __init__(self, config: Config):
+        self.sample_rate = config.sample_rate
+        self.chunk_samples = int(config.sample_rate * config.chunk_duration)
+        self.xruns = 0
+        self.ring: Optional[AudioRing] = None
+        self._running = False
+
+    def stats(self) -> dict:
+        return {"overruns": self.ring.overruns if self.ring else 0, "xruns": self.xruns}
+
+    async def stream(self) -> AsyncIterator[AudioChunk]:
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        self.ring = ring = AudioRing(self.chunk_samples, 16)
+        converter = CaptureConverter(self.sample_rate, 1, self.sample_rate)
+
+        def _callback(indata: np.ndarray, frames: int, time_info: Any, status: Any) -> None:
+            if status.input_overflow:
+                self.xruns += 1
+            if ring.write(converter.process(indata)):
+                loop.call_soon_threadsafe(ready.set)
+
+        stream, _, _ = open_synthetic(self.sample_rate, False, 0, _callback)
+        self._running = True
+        started = time.time()
+        yielded = 0
+        stream.start()
+        try:
+            while self._running:
+                await ready.wait()
+                ready.clear()
+                while self._running and (data := ring.read()) is not None:
+                    yield AudioChunk(data, self.sample_rate, started + yielded / self.sample_rate, len(data) / self.sample_rate)
+                    yielded += len(data)
+        finally:
+            self._running = False
+            stream.stop()
+
+    def stop(self) -> None:
+        self._running = False
+
+
+def _hog(stop: threading.Event) -> None:
+    """Pure-Python busy work (holds the GIL) with some NumPy in between."""
+    matrix = np.random.default_rng(0).standard_normal((128, 128))
+    while not stop.is_set():
+        total = 0
+        for i in range(20000):
+            total += i * i
+        matrix = np.tanh(matrix @ matrix.T / 128)
+
+
+async def run_mode(mode: str, seconds: float, hog_threads: int, chunk_duration: float) -> dict:
+    config = Config(openai_api_key="benchmark", chunk_duration=chunk_duration)
+    source = ProcessAudioRecorder(config, open_stream=open_synthetic) if mode == "process" else InProcessCapture(config)
+
+    stop_hog = threading.Event()
+    hogs = [threading.Thread(target=_hog, args=(stop_hog,), daemon=True) for _ in range(hog_threads)]
+
+    chunks = gaps = 0
+    expected: Optional[int] = None
+    late: list[float] = []
+    started = time.monotonic()
+    for thread in hogs:
+        thread.start()
+    stream = source.stream()
+    try:
+        async for chunk in stream:
+            data = chunk.data.astype(np.int32)
+            # Discontinuities inside the chunk and against the previous one
+            gaps += int(np.count_nonzero((np.diff(data) - 1) % RAMP))
+            if expected is not None and data[0] != expected:
+                gaps += 1
+            expected = int((data[-1] + 1) % RAMP)
+            chunks += 1
+            late.append(max(0.0, time.time() - (chunk.timestamp + chunk.duration)))
+            if time.monotonic() - started >= seconds:
+                break
+    finally:
+        source.stop()
+        await stream.aclose()
+        stop_hog.set()
+        for thread in hogs:
+            thread.join()
+    stats = source.stats()
+
+    return {
+        "chunks": chunks,
+        "gaps": gaps,
+        "xruns": stats["xruns"],
+        "ring_overruns": stats["overruns"],
+        "delivery_lag_max_ms": max(late, default=0.0) * 1000,
+    }
+
+
+async def run(seconds: float, hog_threads: int, chunk_duration: float, modes: list[str]) -> dict:
+    results: dict[str, dict] = {}
+    for mode in modes:
+        results[mode] = {
+            "idle": await run_mode(mode, seconds, 0, chunk_duration),
+            "cpu_hog": await run_mode(mode, seconds, hog_threads, chunk_duration),
+        }
+    return {
+        "seconds": seconds,
+        "hog_threads": hog_threads,
+        "chunk_duration": chunk_duration,
+        "modes": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m speakwith.bench.capture_stress", description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=8.0, help="Capture time per run")
+    parser.add_argument("--hog-threads", type=int, default=4, help="CPU-hog threads in the main process")
+    parser.add_argument("--chunk-duration", type=float, default=1.0)
+    parser.add_argument("--modes", nargs="+", default=["in_process", "process"], choices=["in_process", "process"])
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    print(json.dumps(asyncio.run(run(args.seconds, args.hog_threads, args.chunk_duration, args.modes)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
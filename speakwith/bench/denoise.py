@@ -0,0 +1,220 @@
+"""Noise suppression A/B benchmark: decode time and spurious transcripts.
+
+Usage:
+    python -m speakwith.bench.denoise corpus/ [--snr 5] [--noise-chunks 2]
+    python -m speakwith.bench.denoise corpus/ --noise-file cafe.wav
+    python -m speakwith.bench.denoise corpus/ --no-transcribe
+
+Background noise (a WAV recording, or synthetic pink noise with mains hum
+and a DC offset) is mixed into every corpus chunk at `--snr` dB, and
+`--noise-chunks` noise-only chunks are inserted before each file. The
+same stream is transcribed with and without NoiseSuppressor. A
+transcript that passes the transcript filter on a noise-only chunk
+counts as spurious. The report covers decode time, spurious transcripts
+and the suppressor's own cost, as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from speakwith.audio.denoise import NoiseSuppressor
+from speakwith.audio.resample import to_int16
+from speakwith.bench.replay import ReplayAudioSource, open_source
+from speakwith.bench.runner import collect_corpus, summarize
+from speakwith.config import Config
+from speakwith.models import AudioChunk
+from speakwith.transcription import TranscriptFilter, WhisperClient
+
+
+def pink_noise(samples: int, sample_rate: int, seed: int = 0) -> np.ndarray:
+    """Pink noise with 50 Hz hum and a DC offset, float32 at unit RMS."""
+    rng = np.random.default_rng(seed)
+    spectrum = np.fft.rfft(rng.standard_normal(samples))
+    freqs = np.fft.rfftfreq(samples, 1.0 / sample_rate)
+    spectrum /= np.sqrt(np.maximum(freqs, 20.0))
+    noise = np.fft.irfft(spectrum, n=samples)
+    noise /= np.sqrt(np.mean(noise ** 2))
+    t = np.arange(samples) / sample_rate
+    noise += 0.5 * np.sin(2 * np.pi * 50 * t) + 0.3
+    return (noise / np.sqrt(np.mean(noise ** 2))).astype(np.float32)
+
+
+def _rms(x: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(np.square(x, dtype=np.float64)))) if len(x) else 0.0
+
+
+def _db(x: np.ndarray) -> float:
+    return 20 * np.log10(max(_rms(x), 1e-9))
+
+
+class NoisyStream:
+    """Corpus chunks with noise mixed in, plus labelled noise-only chunks."""
+
+    def __init__(
+        self,
+        files: list[Path],
+        sample_rate: int,
+        chunk_duration: float,
+        snr_db: float,
+        noise_chunks: int,
+        noise: Optional[np.ndarray] = None,
+    ):
+        self.files = files
+        self.sample_rate = sample_rate
+        self.chunk_samples = int(sample_rate * chunk_duration)
+        self.snr_db = snr_db
+        self.noise_chunks = noise_chunks
+        self.noise = noise if noise is not None else pink_noise(sample_rate * 60, sample_rate)
+        self._noise_pos = 0
+
+    def _noise(self, samples: int) -> np.ndarray:
+        idx = (self._noise_pos + np.arange(samples)) % len(self.noise)
+        self._noise_pos += samples
+        return self.noise[idx]
+
+    def chunks(self) -> Iterator[tuple[AudioChunk, bool]]:
+        """(chunk, is_noise_only) in stream order."""
+        self._noise_pos = 0
+        offset = 0.0
+        for path in self.files:
+            sample_rate, frames = open_source(path)
+            if sample_rate != self.sample_rate:
+                raise ValueError(f"{path} is {sample_rate} Hz, expected {self.sample_rate} Hz")
+            speech = ReplayAudioSource._to_mono(frames).astype(np.float32) / 32768.0
+            # Noise level relative to the file's speech level
+            level = _rms(speech) * 10 ** (-self.snr_db / 20)
+            pieces = [(np.zeros(self.chunk_samples, dtype=np.float32), True)] * self.noise_chunks
+            pieces += [
+                (speech[i:i + self.chunk_samples], False)
+                for i in range(0, len(speech), self.chunk_samples)
+            ]
+            for clean, noise_only in pieces:
+                data = to_int16(clean + level * self._noise(len(clean)))
+                duration = len(data) / self.sample_rate
+                yield AudioChunk(data=data, sample_rate=self.sample_rate, timestamp=offset, duration=duration), noise_only
+                offset += duration
+
+
+async def run_variant(
+    stream: NoisyStream,
+    config: Config,
+    transcriber: Optional[WhisperClient],
+    denoise: bool,
+) -> dict:
+    """Push the stream through (optional) suppression and Whisper."""
+    suppressor = NoiseSuppressor.from_config(config) if denoise else None
+    transcript_filter = TranscriptFilter.from_config(config)
+    denoise_times: list[float] = []
+    decode_times: list[float] = []
+    noise_db: list[float] = []
+    audio_seconds = 0.0
+    spurious = accepted = empty = 0
+    filtered: dict[str, int] = {}
+
+    for chunk, noise_only in stream.chunks():
+        audio_seconds += chunk.duration
+        if suppressor is not None:
+            started = time.perf_counter()
+            chunk = suppressor.process_chunk(chunk)
+            denoise_times.append(time.perf_counter() - started)
+        if noise_only:
+            noise_db.append(_db(chunk.data.astype(np.float32) / 32768.0))
+        if transcriber is None:
+            continue
+
+        started = time.perf_counter()
+        transcript = await transcriber.transcribe(chunk, language=config.language or None)
+        decode_times.append(time.perf_counter() - started)
+        if transcript.is_empty:
+            empty += 1
+            continue
+        if transcript_filter is not None:
+            reason = transcript_filter.apply(transcript)
+            if reason is not None:
+                filtered[reason] = filtered.get(reason, 0) + 1
+                continue
+        accepted += 1
+        if noise_only:
+            spurious += 1
+
+    report = {
+        "audio_seconds": audio_seconds,
+        "noise_only_level_dbfs": float(np.mean(noise_db)) if noise_db else None,
+        "denoise": summarize(denoise_times),
+        "denoise_rtf": sum(denoise_times) / audio_seconds if audio_seconds else 0.0,
+    }
+    if transcriber is not None:
+        report.update({
+            "transcribe": summarize(decode_times),
+            "transcribe_rtf": sum(decode_times) / audio_seconds if audio_seconds else 0.0,
+            "empty": empty,
+            "filtered": filtered,
+            "accepted": accepted,
+            "spurious": spurious,
+        })
+    return report
+
+
+async def run(args: argparse.Namespace) -> dict:
+    files = collect_corpus(args.corpus)
+    if not files:
+        raise SystemExit("No WAV files found in corpus")
+
+    config = Config(
+        openai_api_key="benchmark",
+        whisper_model=args.whisper_model,
+        chunk_duration=args.chunk_duration,
+        noise_suppression=True,
+        noise_reduction_db=args.reduction_db,
+    )
+    noise = None
+    if args.noise_file is not None:
+        _, frames = open_source(args.noise_file)
+        noise = frames.mean(axis=1).astype(np.float32)
+        noise /= max(_rms(noise), 1e-9)
+    stream = NoisyStream(files, config.sample_rate, config.chunk_duration, args.snr, args.noise_chunks, noise)
+
+    transcriber = None
+    if not args.no_transcribe:
+        transcriber = WhisperClient(config)
+        await transcriber.initialize()
+
+    return {
+        "files": [str(p) for p in files],
+        "snr_db": args.snr,
+        "noise": str(args.noise_file) if args.noise_file else "synthetic pink + hum + DC",
+        "noise_chunks_per_file": args.noise_chunks,
+        "whisper_model": None if transcriber is None else config.whisper_model,
+        "baseline": await run_variant(stream, config, transcriber, denoise=False),
+        "denoised": await run_variant(stream, config, transcriber, denoise=True),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m speakwith.bench.denoise", description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", nargs="+", type=Path, help="WAV files, spools or directories of them")
+    parser.add_argument("--snr", type=float, default=5.0, help="Speech-to-noise ratio in dB")
+    parser.add_argument("--noise-chunks", type=int, default=2, help="Noise-only chunks before each file")
+    parser.add_argument("--noise-file", type=Path, help="Background noise recording (16-bit WAV)")
+    parser.add_argument("--reduction-db", type=float, default=12.0)
+    parser.add_argument("--whisper-model", default="base")
+    parser.add_argument("--chunk-duration", type=float, default=10.0)
+    parser.add_argument("--no-transcribe", action="store_true", help="Only measure the suppressor")
+    parser.add_argument("--out", type=Path, help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    text = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
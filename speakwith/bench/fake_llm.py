@@ -0,0 +1,62 @@
+"""Local LLM stand-in with scripted latency for benchmarks."""
+
+import asyncio
+import itertools
+import random
+from typing import Iterable, Optional
+
+from speakwith.llm.base import BaseLLMClient
+from speakwith.models import ConversationContext, Suggestions
+
+
+class ScriptedLLMClient(BaseLLMClient):
+    """BaseLLMClient that answers instantly after a scripted delay.
+
+    Latencies are cycled per call type, with optional uniform jitter, so
+    runs exercise the pipeline's timing without a network dependency.
+    """
+
+    def __init__(
+        self,
+        suggestion_latency: Iterable[float] = (0.8,),
+        summary_latency: Iterable[float] = (1.2,),
+        jitter: float = 0.0,
+        seed: Optional[int] = 0,
+    ):
+        self._suggestion_latency = itertools.cycle(list(suggestion_latency))
+        self._summary_latency = itertools.cycle(list(summary_latency))
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self.calls: dict[str, int] = {"generate": 0, "suggestions": 0, "summary": 0}
+
+    async def _delay(self, latency: float) -> None:
+        if self.jitter:
+            latency += self._random.uniform(-self.jitter, self.jitter)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+    async def generate(self, prompt: str, system: str = "") -> str:
+        """Echo the prompt's first line after the summary latency."""
+        self.calls["generate"] += 1
+        await self._delay(next(self._summary_latency))
+        return prompt.splitlines()[0] if prompt else ""
+
+    async def generate_suggestions(self, context: ConversationContext) -> Suggestions:
+        """Return canned suggestions after the suggestion latency."""
+        self.calls["suggestions"] += 1
+        await self._delay(next(self._suggestion_latency))
+        last = context.recent_transcripts[-1].text if context.recent_transcripts else ""
+        return Suggestions(
+            reactions=["Yes", "No", "Really?"],
+            followups=[
+                f"About \"{last[:40]}\" - tell me more.",
+                "Could you repeat that?",
+                "That makes sense.",
+            ],
+        )
+
+    async def generate_summary(self, transcripts: list[str], previous_summary: str) -> str:
+        """Return the latest transcript as the summary after the summary latency."""
+        self.calls["summary"] += 1
+        await self._delay(next(self._summary_latency))
+        return transcripts[-1] if transcripts else previous_summary
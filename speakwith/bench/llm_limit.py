@@ -0,0 +1,110 @@
+"""Burst benchmark for the LLM concurrency limiter against a local stand-in.
+
+Usage:
+    python -m speakwith.bench.llm_limit [--sessions 8] [--rounds 5] [--capacity 4]
+
+Starts StandInLLMServer, then has every simulated session fire a
+suggestion and a summary request at once, `rounds` times. The run is
+repeated with the limiter off (OpenAI SDK retries only) and on, and the
+per-call-type latency, 429s and failures are reported as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from speakwith.bench.llm_server import StandInLLMServer
+from speakwith.bench.runner import summarize
+from speakwith.config import Config
+from speakwith.llm.limiter import LimitedLLMClient
+from speakwith.llm.openai_client import OpenAIClient
+from speakwith.models import ConversationContext, ConversationMode, UserProfile
+
+
+def _context() -> ConversationContext:
+    return ConversationContext(
+        recent_transcripts=[],
+        summary="",
+        profile=UserProfile.empty(),
+        mode=ConversationMode.FRIENDLY,
+        user_last_response=None,
+    )
+
+
+async def run_scenario(config: Config, server: StandInLLMServer, sessions: int, rounds: int, gap: float) -> dict:
+    """Run one configuration against a fresh server."""
+    openai = OpenAIClient(config)
+    llm = LimitedLLMClient.wrap(openai, config)
+    latencies: dict[str, list[float]] = {"suggestions": [], "summary": []}
+    failures: dict[str, int] = {"suggestions": 0, "summary": 0}
+
+    async def timed(kind: str, call) -> None:
+        started = time.perf_counter()
+        try:
+            await call
+        except Exception:
+            failures[kind] += 1
+            return
+        latencies[kind].append(time.perf_counter() - started)
+
+    async def session(index: int) -> None:
+        client = llm.for_session(f"s{index}") if isinstance(llm, LimitedLLMClient) else llm
+        for _ in range(rounds):
+            await asyncio.gather(
+                timed("summary", client.generate_summary(["Hi there", "How are you?"], "")),
+                timed("suggestions", client.generate_suggestions(_context())),
+            )
+            await asyncio.sleep(gap)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session(i) for i in range(sessions)))
+    await openai.client.close()
+    report = {
+        "wall_seconds": time.perf_counter() - started,
+        "latency": {kind: summarize(values) for kind, values in latencies.items()},
+        "failures": failures,
+        "server": server.stats(),
+    }
+    if isinstance(llm, LimitedLLMClient):
+        report.update(llm.stats())
+    return report
+
+
+async def run(sessions: int, rounds: int, capacity: int, latency: float, reject_rate: float, gap: float) -> dict:
+    results = {}
+    for label, limited in (("sdk_retries", False), ("adaptive_limiter", True)):
+        async with StandInLLMServer(capacity=capacity, latency=latency, reject_rate=reject_rate) as server:
+            config = Config(
+                openai_api_key="stand-in",
+                openai_base_url=server.base_url,
+                llm_limiter=limited,
+                llm_timeout=10.0,
+            )
+            results[label] = await run_scenario(config, server, sessions, rounds, gap)
+    return {
+        "sessions": sessions,
+        "rounds": rounds,
+        "server_capacity": capacity,
+        "server_latency": latency,
+        "reject_rate": reject_rate,
+        "scenarios": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m speakwith.bench.llm_limit", description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent simulated sessions")
+    parser.add_argument("--rounds", type=int, default=5, help="Bursts per session")
+    parser.add_argument("--capacity", type=int, default=4, help="Concurrent requests the stand-in serves")
+    parser.add_argument("--latency", type=float, default=0.2, help="Stand-in seconds per request")
+    parser.add_argument("--reject-rate", type=float, default=0.05, help="Random 429 probability")
+    parser.add_argument("--gap", type=float, default=0.5, help="Seconds between a session's bursts")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    report = asyncio.run(run(args.sessions, args.rounds, args.capacity, args.latency, args.reject_rate, args.gap))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Local OpenAI-compatible stand-in server that injects rate limits.
+
+Serves POST /v1/chat/completions over plain HTTP/1.1 so the real
+OpenAIClient (with OPENAI_BASE_URL pointed here) can be exercised without
+network access. Requests beyond `capacity` concurrent ones, and a random
+`reject_rate` share of the rest, get a 429 with a Retry-After header.
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Optional
+
+SUGGESTIONS_REPLY = json.dumps({
+    "reactions": ["Oh nice!", "Really?", "Tell me more"],
+    "followups": [
+        "How did that go?",
+        "What happened next?",
+        "That sounds great, when was it?",
+    ],
+})
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+class StandInLLMServer:
+    """Minimal chat-completions endpoint with scripted latency and 429s.
+
+    Args:
+        capacity: Concurrent requests served; extra ones are rejected.
+        latency: Seconds each accepted request takes.
+        reject_rate: Probability of a 429 even under capacity.
+        retry_after: Seconds sent in the Retry-After header of a 429.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4,
+        latency: float = 0.2,
+        reject_rate: float = 0.0,
+        retry_after: float = 0.2,
+        seed: Optional[int] = 0,
+    ):
+        self.capacity = capacity
+        self.latency = latency
+        self.reject_rate = reject_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: set[asyncio.Task] = set()
+        self.port = 0
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.served = 0
+        self.rejected = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    async def start(self, port: int = 0) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in self._connections:
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "StandInLLMServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    def stats(self) -> dict:
+        return {
+            "served": self.served,
+            "rejected": self.rejected,
+            "peak_in_flight": self.peak_in_flight,
+            "capacity": self.capacity,
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve keep-alive requests on one connection."""
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+                if method != "POST" or not path.endswith("/chat/completions"):
+                    status, payload, extra = 404, {"error": {"message": "not found"}}, {}
+                else:
+                    status, payload, extra = await self._complete(json.loads(body or b"{}"))
+
+                data = json.dumps(payload).encode()
+                head = [f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}",
+                        "content-type: application/json",
+                        f"content-length: {len(data)}"]
+                head += [f"{name}: {value}" for name, value in extra.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _complete(self, request: dict) -> tuple[int, dict, dict]:
+        if self.in_flight >= self.capacity or self._random.random() < self.reject_rate:
+            self.rejected += 1
+            return (
+                429,
+                {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                {"retry-after-ms": str(int(self.retry_after * 1000))},
+            )
+
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        self.served += 1
+
+        messages = request.get("messages", [])
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        reply = SUGGESTIONS_REPLY if '"reactions"' in prompt else "They talked about their day."
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(reply)
+        return 200, {
+            "id": f"chatcmpl-standin-{self.served}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stand-in"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": reply},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }, {}
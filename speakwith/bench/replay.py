@@ -0,0 +1,174 @@
+"""Replay WAV files or spooled sessions as an audio source in place of the microphone."""
+
+import asyncio
+import struct
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+import numpy as np
+
+from speakwith.audio.spool import INDEX_FILENAME, AudioSpool
+from speakwith.models import AudioChunk
+
+
+@dataclass
+class WavInfo:
+    """Layout of a PCM WAV file."""
+
+    path: Path
+    sample_rate: int
+    channels: int
+    sample_width: int  # bytes per sample
+    data_offset: int
+    num_frames: int
+
+    @property
+    def duration(self) -> float:
+        """Length of the audio in seconds."""
+        return self.num_frames / self.sample_rate
+
+
+def read_wav_info(path: Path) -> WavInfo:
+    """Locate the format and data chunks of a RIFF/WAVE file.
+
+    Raises:
+        ValueError: If the file is not 16-bit PCM WAV.
+    """
+    with open(path, "rb") as f:
+        riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            raise ValueError(f"{path} is not a WAV file")
+
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                fmt = struct.unpack("<HHIIHH", f.read(16))
+                f.seek(size - 16 + (size & 1), 1)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError(f"{path} has data before fmt chunk")
+                audio_format, channels, sample_rate, _, _, bits = fmt
+                if audio_format != 1 or bits != 16:
+                    raise ValueError(f"{path} must be 16-bit PCM (got format {audio_format}, {bits} bits)")
+                return WavInfo(
+                    path=path,
+                    sample_rate=sample_rate,
+                    channels=channels,
+                    sample_width=2,
+                    data_offset=f.tell(),
+                    num_frames=size // (2 * channels),
+                )
+            else:
+                f.seek(size + (size & 1), 1)
+
+
+def open_wav(path: Path) -> tuple[WavInfo, np.ndarray]:
+    """Memory-map a WAV file's samples as an int16 (frames, channels) array."""
+    info = read_wav_info(path)
+    data = np.memmap(
+        path,
+        dtype="<i2",
+        mode="r",
+        offset=info.data_offset,
+        shape=(info.num_frames, info.channels),
+    )
+    return info, data
+
+
+def is_spool(path: Path) -> bool:
+    """Whether `path` is a saved AudioSpool directory."""
+    return path.is_dir() and (path / INDEX_FILENAME).exists()
+
+
+def open_source(path: Path) -> tuple[int, np.ndarray]:
+    """(sample rate, int16 (frames, channels) samples) of a WAV file or spool."""
+    if is_spool(path):
+        spool = AudioSpool.open(path)
+        return spool.sample_rate, spool.retained()[:, None]
+    info, data = open_wav(path)
+    return info.sample_rate, data
+
+
+class ReplayAudioSource:
+    """Yields AudioChunks from WAV files, like AudioRecorder does from a mic.
+
+    Paths may also be AudioSpool directories saved by a live session.
+    Files are memory-mapped, so only the chunk being converted is paged in.
+    With `realtime=True` each chunk is released when it would have finished
+    recording, otherwise chunks are produced as fast as they are consumed.
+    """
+
+    def __init__(
+        self,
+        paths: list[Path],
+        sample_rate: int,
+        chunk_duration: float,
+        realtime: bool = False,
+    ):
+        self.paths = paths
+        self.sample_rate = sample_rate
+        self.chunk_duration = chunk_duration
+        self.realtime = realtime
+        self._running = False
+
+    @property
+    def samples_per_chunk(self) -> int:
+        """Number of samples in each audio chunk."""
+        return int(self.sample_rate * self.chunk_duration)
+
+    def _chunks(self, path: Path) -> Iterator[np.ndarray]:
+        sample_rate, data = open_source(path)
+        if sample_rate != self.sample_rate:
+            raise ValueError(
+                f"{path} is {sample_rate} Hz, expected {self.sample_rate} Hz"
+            )
+        step = self.samples_per_chunk
+        # One view at a time, so memory stays flat however long the file is
+        for start in range(0, len(data), step):
+            yield data[start:start + step]
+
+    @staticmethod
+    def _to_mono(frames: np.ndarray) -> np.ndarray:
+        """Mono int16 as the recorder produces (a view for mono files)."""
+        if frames.shape[1] == 1:
+            return np.asarray(frames[:, 0])
+        return frames.mean(axis=1).astype(np.int16)
+
+    async def stream(self) -> AsyncIterator[AudioChunk]:
+        """Yield chunks from every file in order.
+
+        Yields:
+            AudioChunk objects; the last chunk of a file may be shorter.
+        """
+        self._running = True
+        started = time.time()
+        offset = 0.0
+        try:
+            for path in self.paths:
+                for frames in self._chunks(path):
+                    if not self._running:
+                        return
+                    duration = len(frames) / self.sample_rate
+                    if self.realtime:
+                        delay = started + offset + duration - time.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    yield AudioChunk(
+                        data=self._to_mono(frames),
+                        sample_rate=self.sample_rate,
+                        timestamp=started + offset,
+                        duration=duration,
+                    )
+                    offset += duration
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Stop replaying."""
+        self._running = False
@@ -0,0 +1,111 @@
+"""Throughput benchmark for the capture conversion stage.
+
+Usage:
+    python -m speakwith.bench.resample [--seconds 30] [--block 1024]
+
+Compares the current path (device opened at 16 kHz mono, so capture
+only forwards samples) with device-native capture converted by
+CaptureConverter, and with linear interpolation as a stand-in for a
+low-quality host-API resampler. Output is JSON.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+
+from speakwith.audio.resample import CaptureConverter, to_int16
+
+TARGET_RATE = 16000
+
+# (label, device rate, channels)
+SCENARIOS = (
+    ("16k_mono", 16000, 1),
+    ("44k1_mono", 44100, 1),
+    ("48k_mono", 48000, 1),
+    ("48k_stereo", 48000, 2),
+    ("48k_4ch", 48000, 4),
+)
+
+
+def test_signal(rate: int, channels: int, seconds: float) -> np.ndarray:
+    """Speech-band tone plus a 10 kHz tone that must not alias, as int16 frames."""
+    t = np.arange(int(rate * seconds)) / rate
+    tone = 0.3 * np.sin(2 * np.pi * 440 * t)
+    if rate > 2 * 10000:
+        tone += 0.3 * np.sin(2 * np.pi * 10000 * t)
+    frames = np.repeat(tone[:, None], channels, axis=1)
+    return to_int16(frames)
+
+
+def _linear(rate: int, channels: int) -> Callable[[np.ndarray], np.ndarray]:
+    """Per-block linear interpolation (no anti-aliasing filter)."""
+    state = {"t": 0.0}
+    step = rate / TARGET_RATE
+
+    def process(frames: np.ndarray) -> np.ndarray:
+        mono = frames.mean(axis=1) / 32768.0
+        positions = np.arange(state["t"], len(mono) - 1, step)
+        state["t"] = positions[-1] + step - len(mono) if len(positions) else state["t"] - len(mono)
+        return to_int16(np.interp(positions, np.arange(len(mono)), mono))
+
+    return process
+
+
+def _alias_db(output: np.ndarray) -> float:
+    """Level of everything except the 440 Hz tone, relative to it (dB)."""
+    x = output.astype(np.float64) / 32768.0
+    x = x[len(x) // 10:]  # Skip the filter warm-up
+    spectrum = np.abs(np.fft.rfft(x * np.hanning(len(x))))
+    freqs = np.fft.rfftfreq(len(x), 1 / TARGET_RATE)
+    tone = (freqs > 400) & (freqs < 480)
+    signal = np.sum(spectrum[tone] ** 2)
+    rest = np.sum(spectrum[~tone] ** 2)
+    return float(10 * np.log10(max(rest, 1e-20) / signal))
+
+
+def measure(process: Callable[[np.ndarray], np.ndarray], frames: np.ndarray, block: int, rate: int) -> dict:
+    """Feed frames block by block, like the audio callback would."""
+    outputs = []
+    started = time.perf_counter()
+    for start in range(0, len(frames), block):
+        outputs.append(process(frames[start:start + block]))
+    elapsed = time.perf_counter() - started
+    output = np.concatenate(outputs)
+    seconds = len(frames) / rate
+    return {
+        "seconds_per_audio_second": elapsed / seconds,
+        "realtime_factor": seconds / elapsed if elapsed else float("inf"),
+        "input_msamples_per_s": frames.size / elapsed / 1e6 if elapsed else float("inf"),
+        "per_block_us": elapsed / max(len(outputs), 1) * 1e6,
+        "output_samples": len(output),
+        "alias_db": _alias_db(output),
+    }
+
+
+def run(seconds: float, block: int) -> dict:
+    """Benchmark every scenario."""
+    results = {}
+    for label, rate, channels in SCENARIOS:
+        frames = test_signal(rate, channels, seconds)
+        entry = {"device_rate": rate, "channels": channels}
+        entry["polyphase"] = measure(CaptureConverter(rate, channels, TARGET_RATE).process, frames, block, rate)
+        if rate != TARGET_RATE:
+            entry["linear"] = measure(_linear(rate, channels), frames, block, rate)
+        results[label] = entry
+    return {"seconds": seconds, "block": block, "target_rate": TARGET_RATE, "scenarios": results}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m speakwith.bench.resample", description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=30.0, help="Audio seconds per scenario")
+    parser.add_argument("--block", type=int, default=1024, help="Frames per callback block")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    print(json.dumps(run(args.seconds, args.block), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""End-to-end latency benchmark: replayed audio to suggestions on screen."""
+
+import asyncio
+import io
+import platform
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from speakwith.bench.replay import ReplayAudioSource, is_spool
+from speakwith.config import Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.llm.cassette import CassetteLLMClient
+from speakwith.metrics import STAGES, Metrics, get_metrics, set_metrics
+from speakwith.models import (
+    AudioChunk,
+    ConversationMode,
+    PipelineStatus,
+    Suggestions,
+    Transcript,
+    UserProfile,
+)
+from speakwith.session import Session
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of a list (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: list[float]) -> dict:
+    """Latency summary in milliseconds."""
+    ms = [v * 1000.0 for v in values]
+    return {
+        "count": len(ms),
+        "mean_ms": sum(ms) / len(ms) if ms else 0.0,
+        "p50_ms": percentile(ms, 50),
+        "p95_ms": percentile(ms, 95),
+        "p99_ms": percentile(ms, 99),
+        "max_ms": max(ms) if ms else 0.0,
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_revision() -> Optional[str]:
+    """Current commit hash, if running from a git checkout."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+@dataclass
+class BenchmarkResult:
+    """Raw timings collected during a run (seconds)."""
+
+    stages: dict[str, list[float]] = field(default_factory=lambda: {s: [] for s in STAGES})
+    end_to_end: list[float] = field(default_factory=list)
+    chunks: int = 0
+    silent_chunks: int = 0  # Skipped by the silence gate
+    empty_chunks: int = 0
+    unserved: int = 0  # Transcripts no suggestions followed before the run ended
+    filtered: dict[str, int] = field(default_factory=dict)
+    decode_modes: dict[str, int] = field(default_factory=dict)
+    rtf: list[float] = field(default_factory=list)
+    audio_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+
+    def to_dict(self, meta: dict) -> dict:
+        """Machine-readable report."""
+        return {
+            "meta": meta,
+            "chunks": self.chunks,
+            "silent_chunks": self.silent_chunks,
+            "empty_chunks": self.empty_chunks,
+            "unserved": self.unserved,
+            "filtered": self.filtered,
+            "decode_modes": self.decode_modes,
+            "rtf": {
+                "mean": sum(self.rtf) / len(self.rtf) if self.rtf else 0.0,
+                "p95": percentile(self.rtf, 95),
+                "max": max(self.rtf, default=0.0),
+            },
+            "audio_seconds": self.audio_seconds,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": {name: summarize(values) for name, values in self.stages.items()},
+            "end_to_end": summarize(self.end_to_end),
+        }
+
+
+class RecordingMetrics(Metrics):
+    """Metrics that also keep every raw duration, for exact percentiles."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.samples: dict[str, list[float]] = {}
+
+    def observe_value(self, name: str, seconds: float) -> None:
+        super().observe_value(name, seconds)
+        self.samples.setdefault(name, []).append(seconds)
+
+
+class TimedSource:
+    """Wraps a ReplayAudioSource, noting when each chunk becomes available."""
+
+    def __init__(self, source: ReplayAudioSource):
+        self.source = source
+        self.ready: dict[float, float] = {}  # chunk timestamp -> perf_counter
+        self.yielded = 0
+        self.audio_seconds = 0.0
+        self.exhausted = asyncio.Event()
+
+    async def stream(self) -> AsyncIterator[AudioChunk]:
+        try:
+            async for chunk in self.source.stream():
+                self.ready[chunk.timestamp] = time.perf_counter()
+                self.yielded += 1
+                self.audio_seconds += chunk.duration
+                yield chunk
+        finally:
+            self.exhausted.set()
+
+    def stop(self) -> None:
+        self.source.stop()
+
+
+class BenchmarkRunner:
+    """Drives a real Session with replayed audio and a stand-in LLM.
+
+    The LLM is usually a ScriptedLLMClient, or a CassetteLLMClient replaying
+    recorded responses so runs on different commits see the same replies.
+
+    Chunks take the shipped path: denoise, silence gate, language,
+    transcription, filter, memory and summaries, the trigger policy's
+    debounce, suggestions and background refinement. Stage timings come
+    from the session's metrics; each published set of suggestions is
+    rendered off-screen. End-to-end latency runs from the moment a chunk
+    is available (the end of that speech) to the rendered frame with the
+    first suggestions generated after its transcript.
+
+    Args:
+        config: Settings; the mode's performance profile applies on top.
+        source: Replayed audio.
+        llm: Stand-in LLM client.
+        mode: Conversation mode.
+        settle: Seconds to wait after the last chunk for suggestions still
+            due (on top of the trigger's max staleness).
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        source: ReplayAudioSource,
+        llm: BaseLLMClient,
+        mode: ConversationMode = ConversationMode.FRIENDLY,
+        settle: float = 10.0,
+    ):
+        self.config = config
+        self.source = source
+        self.llm = llm
+        self.settle = settle
+        self.timed = TimedSource(source)
+
+        from speakwith.transcription import WhisperClient
+
+        self.session = Session(
+            config,
+            mode,
+            audio_source=self.timed,
+            transcriber=WhisperClient(config),
+            llm=llm,
+            profile=UserProfile.empty(),
+        )
+
+        from rich.console import Console
+
+        from speakwith.cli.display import Display
+
+        self.display = Display(self.session.state)
+        self.display.console = Console(file=io.StringIO(), width=100)
+
+    async def run(self) -> BenchmarkResult:
+        """Replay the whole corpus through the session and collect timings."""
+        previous = get_metrics()
+        metrics = RecordingMetrics()
+        set_metrics(metrics)
+        try:
+            return await self._run(metrics)
+        finally:
+            set_metrics(previous)
+
+    async def _run(self, metrics: RecordingMetrics) -> BenchmarkResult:
+        session = self.session
+        result = BenchmarkResult()
+        pending: list[Transcript] = []  # Accepted, waiting for suggestions
+
+        def on_transcript(transcript: Transcript) -> None:
+            if transcript.decode_mode == "refined":
+                return
+            result.rtf.append(transcript.rtf)
+            pending.append(transcript)
+
+        def on_suggestions(suggestions: Suggestions) -> None:
+            self.display.render(force=True)
+            rendered = time.perf_counter()
+            # Generated from the transcripts the trigger had seen when it fired
+            served = session.suggestion_gen.seen_seq
+            for transcript in [t for t in pending if t.seq <= served]:
+                ready = self.timed.ready.get(transcript.timestamp)
+                if ready is not None:
+                    result.end_to_end.append(rendered - ready)
+                pending.remove(transcript)
+
+        session.transcripts.add_listener(on_transcript)
+        session.suggestions.add_listener(on_suggestions)
+
+        await session.initialize()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        await session.start()
+        try:
+            await self.timed.exhausted.wait()
+            # Every chunk is either gated as silent or transcribed and handed on
+            while (
+                len(metrics.samples.get("transcribe", ())) + metrics.counters.get("silent_chunks", 0)
+                < self.timed.yielded
+                or session.state.status is not PipelineStatus.IDLE
+            ):
+                await asyncio.sleep(0.01)
+            deadline = time.perf_counter() + self.config.trigger_max_staleness + self.settle
+            while pending and time.perf_counter() < deadline:
+                await asyncio.sleep(0.01)
+        finally:
+            result.wall_seconds = time.perf_counter() - wall_start
+            result.cpu_seconds = time.process_time() - cpu_start
+            await session.stop()
+
+        result.chunks = self.timed.yielded
+        result.audio_seconds = self.timed.audio_seconds
+        result.unserved = len(pending)
+        for name in result.stages:
+            result.stages[name] = list(metrics.samples.get(name, ()))
+        counters = metrics.counters
+        result.silent_chunks = counters.get("silent_chunks", 0)
+        result.filtered = {
+            name[len("filtered_"):]: count for name, count in counters.items() if name.startswith("filtered_")
+        }
+        result.decode_modes = {
+            name[len("decode_"):]: count for name, count in counters.items() if name.startswith("decode_")
+        }
+        transcribed = len(result.stages["transcribe"])
+        result.empty_chunks = max(transcribed - len(result.rtf) - sum(result.filtered.values()), 0)
+        return result
+
+    def metadata(self) -> dict:
+        """Describe the run so reports from different commits can be compared."""
+        config = self.session.config  # With the mode's profile applied
+        return {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "mode": self.session.mode.value,
+            "whisper_model": config.whisper_model,
+            "noise_suppression": config.noise_suppression,
+            "decode_mode": config.decode_mode,
+            "beam_size": config.beam_size,
+            "refine_in_background": config.refine_in_background,
+            "chunk_duration": self.source.chunk_duration,
+            "sample_rate": config.sample_rate,
+            "silence_threshold": config.silence_threshold,
+            "trigger_debounce": config.trigger_debounce,
+            "language": self.session.language.language,
+            "language_detections": self.session.language.detections,
+            "realtime": self.source.realtime,
+            "files": [str(p) for p in self.source.paths],
+            "llm_calls": dict(getattr(self.llm, "calls", {})),
+            "llm_cassette": self.llm.stats() if isinstance(self.llm, CassetteLLMClient) else None,
+        }
+
+
+def collect_corpus(paths: list[Path]) -> list[Path]:
+    """Expand directories into their WAV files and saved spools (sorted)."""
+    files: list[Path] = []
+    for path in paths:
+        if is_spool(path):
+            files.append(path)
+        elif path.is_dir():
+            files.extend(sorted(path.glob("*.wav")))
+            files.extend(sorted(p for p in path.iterdir() if is_spool(p)))
+        else:
+            files.append(path)
+    return files
@@ -1,6 +1,25 @@
 """CLI interface components."""
 
-from speakwith.cli.display import Display
-from speakwith.cli.input_handler import InputHandler
+from speakwith._lazy import lazy_exports
 
-__all__ = ["Display", "InputHandler"]
+__all__ = [
+    "Display",
+    "DisplayStats",
+    "InputHandler",
+    "InputStats",
+    "KeyPress",
+    "KeySource",
+    "QueueKeySource",
+    "TerminalKeySource",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Display": "speakwith.cli.display",
+    "DisplayStats": "speakwith.cli.display",
+    "InputHandler": "speakwith.cli.input_handler",
+    "InputStats": "speakwith.cli.input_handler",
+    "KeyPress": "speakwith.cli.keys",
+    "KeySource": "speakwith.cli.keys",
+    "QueueKeySource": "speakwith.cli.keys",
+    "TerminalKeySource": "speakwith.cli.keys",
+})
@@ -1,45 +1,120 @@
 """Async screen renderer using rich."""
 
 import asyncio
-from typing import Optional
+import time
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional
 
-from rich.console import Console
-from rich.layout import Layout
+from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from speakwith.models import ConversationMode, PipelineStatus, SharedState
+from speakwith.metrics import Metrics, get_metrics
+from speakwith.models import ConversationMode, PipelineStatus, SharedState, StateSnapshot
 from speakwith.modes import get_mode_config
 
 
+@dataclass
+class DisplayStats:
+    """Rendering statistics for the display."""
+
+    frames_rendered: int = 0
+    frames_dropped: int = 0  # Updates coalesced into a later frame
+    frames_skipped: int = 0  # Wake-ups where no panel input had changed
+    panels_built: int = 0
+    last_frame_ms: float = 0.0
+    max_frame_ms: float = 0.0
+    total_frame_ms: float = 0.0
+
+    @property
+    def avg_frame_ms(self) -> float:
+        """Average time spent building and drawing a frame."""
+        if not self.frames_rendered:
+            return 0.0
+        return self.total_frame_ms / self.frames_rendered
+
+
 class Display:
     """Async screen renderer that updates when state changes.
 
     Uses rich library for beautiful terminal rendering.
-    Redraws automatically when SharedState changes.
+    Draws into a single `rich.live.Live` region instead of clearing the
+    screen, and only rebuilds the panels whose inputs changed. Bursts of
+    state changes are coalesced so at most `max_fps` frames are drawn
+    per second, and a cheap tick keeps the header timer moving.
+
+    If `metrics` is given, a debug panel with per-stage latencies and
+    gauges is drawn below the suggestions.
     """
 
-    def __init__(self, state: SharedState):
+    def __init__(
+        self,
+        state: SharedState,
+        max_fps: float = 10.0,
+        tick_interval: float = 1.0,
+        metrics: Optional[Metrics] = None,
+    ):
         self.state = state
         self.console = Console()
+        self.max_fps = max_fps
+        self.tick_interval = tick_interval
+        self.stats = DisplayStats()
+        self.metrics = metrics
         self._running = False
+        self._live: Optional[Live] = None
+        self._panel_cache: dict[str, tuple[Hashable, Panel]] = {}
+        self._last_keys: Optional[tuple] = None
+        self._seen_version = -1  # Latest state version rendered or folded into a frame
+        self._last_frame_at = 0.0
+
+    @property
+    def frame_interval(self) -> float:
+        """Minimum seconds between two frames."""
+        return 1.0 / self.max_fps if self.max_fps > 0 else 0.0
 
-    def _build_header(self) -> Panel:
+    def _memo(self, name: str, key: Hashable, builder: Callable[[], Panel]) -> Panel:
+        """Return the cached panel for `name` unless its input key changed."""
+        cached = self._panel_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        panel = builder()
+        self._panel_cache[name] = (key, panel)
+        self.stats.panels_built += 1
+        return panel
+
+    def _panel_keys(self, snapshot: StateSnapshot) -> tuple:
+        """Every input the panels are built from.
+
+        Snapshot fields are immutable, so each key is the field object
+        itself and comparing unchanged keys is an identity check.
+        """
+        return (
+            (snapshot.mode, snapshot.elapsed_formatted, snapshot.status),
+            snapshot.summary,
+            snapshot.transcripts,
+            snapshot.user_response,
+            snapshot.suggestions,
+            (snapshot.draft, snapshot.completions),
+            # Debug panel follows the metrics, refreshed at most once per tick
+            (self.metrics.version, snapshot.elapsed_formatted) if self.metrics else None,
+        )
+
+    def _build_header(self, snapshot: StateSnapshot) -> Panel:
         """Build the header panel with mode and timer."""
-        mode_config = get_mode_config(self.state.mode)
-        status_icon = self._get_status_icon()
+        mode_config = get_mode_config(snapshot.mode)
+        status_icon = self._get_status_icon(snapshot.status)
 
         header_text = Text()
         header_text.append("SPEAKWITH", style="bold cyan")
         header_text.append(f" - {mode_config.display_name}", style="white")
-        header_text.append(f"  [{self.state.elapsed_formatted}]", style="dim")
+        header_text.append(f"  [{snapshot.elapsed_formatted}]", style="dim")
         header_text.append(f"  {status_icon}", style="bold")
 
         return Panel(header_text, style="cyan")
 
-    def _get_status_icon(self) -> str:
+    def _get_status_icon(self, status: PipelineStatus) -> str:
         """Get status indicator icon."""
         status_icons = {
             PipelineStatus.IDLE: "[green]Ready[/green]",
@@ -47,20 +122,20 @@ class Display:
             PipelineStatus.TRANSCRIBING: "[yellow]Processing...[/yellow]",
             PipelineStatus.GENERATING: "[yellow]Thinking...[/yellow]",
         }
-        return status_icons.get(self.state.status, "")
+        return status_icons.get(status, "")
 
-    def _build_summary(self) -> Panel:
+    def _build_summary(self, snapshot: StateSnapshot) -> Panel:
         """Build the summary panel."""
-        summary = self.state.summary or "(Listening for conversation...)"
+        summary = snapshot.summary or "(Listening for conversation...)"
         return Panel(summary, title="Summary", border_style="blue")
 
-    def _build_transcripts(self) -> Panel:
+    def _build_transcripts(self, snapshot: StateSnapshot) -> Panel:
         """Build the recent transcripts panel."""
-        if not self.state.transcripts:
+        if not snapshot.transcripts:
             content = "(No transcripts yet - listening...)"
         else:
             lines = []
-            for t in self.state.transcripts:
+            for t in snapshot.transcripts:
                 # Format timestamp as MM:SS
                 minutes = int(t.timestamp) // 60
                 seconds = int(t.timestamp) % 60
@@ -70,14 +145,14 @@ class Display:
 
         return Panel(content, title="Recent Transcript", border_style="green")
 
-    def _build_last_response(self) -> Panel:
+    def _build_last_response(self, snapshot: StateSnapshot) -> Panel:
         """Build the user's last response panel."""
-        response = self.state.user_response or "(No response yet)"
+        response = snapshot.user_response or "(No response yet)"
         return Panel(f'"{response}"', title="Your Last Response", border_style="magenta")
 
-    def _build_suggestions(self) -> Panel:
+    def _build_suggestions(self, snapshot: StateSnapshot) -> Panel:
         """Build the suggestions panel."""
-        suggestions = self.state.suggestions
+        suggestions = snapshot.suggestions
 
         # Build reactions row
         reactions_text = Text()
@@ -104,28 +179,137 @@ class Display:
 
         return Panel(combined, title="Suggestions", border_style="yellow")
 
-    def render(self) -> None:
-        """Render the current state to the console."""
-        self.console.clear()
+    def _build_debug(self) -> Panel:
+        """Build the debug panel with pipeline metrics."""
+        snapshot = self.metrics.snapshot() if self.metrics else {"stages": {}, "gauges": {}}
+
+        table = Table(box=None, padding=(0, 2), show_edge=False)
+        table.add_column("stage", style="cyan")
+        for column in ("n", "p50 ms", "p95 ms", "max ms"):
+            table.add_column(column, justify="right")
+        for name, stage in snapshot["stages"].items():
+            if not stage["count"]:
+                continue
+            table.add_row(
+                name,
+                str(stage["count"]),
+                f"{stage['p50'] * 1000:.1f}",
+                f"{stage['p95'] * 1000:.1f}",
+                f"{stage['max'] * 1000:.1f}",
+            )
+
+        gauges = "  ".join(f"{name}={value:.3g}" for name, value in snapshot["gauges"].items())
+        frames = (
+            f"frames={self.stats.frames_rendered} dropped={self.stats.frames_dropped} "
+            f"avg_frame={self.stats.avg_frame_ms:.1f}ms"
+        )
+        return Panel(Group(table, Text(gauges, style="dim"), Text(frames, style="dim")),
+                     title="Debug", border_style="red")
+
+    def _build_prompt(self, snapshot: StateSnapshot) -> Text:
+        """Build the input prompt line, showing the custom response being typed."""
+        prompt = Text("> ")
+        if snapshot.draft is not None:
+            prompt.append("Your response: ", style="bold magenta")
+            prompt.append(snapshot.draft)
+            prompt.append("_", style="blink")
+            if snapshot.completions:
+                prompt.append("    Tab: ", style="dim")
+                prompt.append(" | ".join(snapshot.completions), style="dim cyan")
+        return prompt
+
+    def _compose(self, snapshot: StateSnapshot, keys: tuple) -> Group:
+        """Assemble the frame, reusing panels whose inputs are unchanged."""
+        header_key, summary_key, transcripts_key, response_key, suggestions_key, _, debug_key = keys
+        panels = [
+            self._memo("header", header_key, lambda: self._build_header(snapshot)),
+            self._memo("summary", summary_key, lambda: self._build_summary(snapshot)),
+            self._memo("transcripts", transcripts_key, lambda: self._build_transcripts(snapshot)),
+            self._memo("last_response", response_key, lambda: self._build_last_response(snapshot)),
+            self._memo("suggestions", suggestions_key, lambda: self._build_suggestions(snapshot)),
+        ]
+        if debug_key is not None:
+            panels.append(self._memo("debug", debug_key, self._build_debug))
+        panels.append(self._build_prompt(snapshot))
+        return Group(*panels)
+
+    def render(self, force: bool = False) -> bool:
+        """Render the current state to the console.
+
+        Args:
+            force: Draw even if no panel input changed since the last frame.
+
+        Returns:
+            True if a frame was drawn, False if it was skipped.
+        """
+        snapshot = self.state.snapshot()
+        self._seen_version = snapshot.version
+        keys = self._panel_keys(snapshot)
+        if not force and keys == self._last_keys:
+            self.stats.frames_skipped += 1
+            return False
+
+        started = time.perf_counter()
+        frame = self._compose(snapshot, keys)
+        if self._live is not None:
+            self._live.update(frame, refresh=True)
+        else:
+            self.console.clear()
+            self.console.print(frame, end="")
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self._last_keys = keys
+        self._last_frame_at = time.monotonic()
+        self.stats.frames_rendered += 1
+        self.stats.last_frame_ms = elapsed_ms
+        self.stats.total_frame_ms += elapsed_ms
+        self.stats.max_frame_ms = max(self.stats.max_frame_ms, elapsed_ms)
+        get_metrics().observe_value("render", elapsed_ms / 1000.0)
+        return True
+
+    async def _wait_for_change(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for a state version not yet seen."""
+        try:
+            snapshot = await asyncio.wait_for(
+                self.state.wait_for_change(self._seen_version), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return False
+        self._seen_version = snapshot.version
+        return True
+
+    async def _coalesce(self) -> None:
+        """Hold the next frame until the frame interval has elapsed.
 
-        # Build layout
-        self.console.print(self._build_header())
-        self.console.print(self._build_summary())
-        self.console.print(self._build_transcripts())
-        self.console.print(self._build_last_response())
-        self.console.print(self._build_suggestions())
-        self.console.print("\n> ", end="")
+        Any changes arriving in the meantime are folded into that frame.
+        """
+        while True:
+            delay = self._last_frame_at + self.frame_interval - time.monotonic()
+            if delay <= 0:
+                return
+            if await self._wait_for_change(delay):
+                self.stats.frames_dropped += 1
 
     async def run(self) -> None:
         """Background task that re-renders on state changes."""
         self._running = True
         try:
-            while self._running:
-                self.render()
-                await self.state.wait_for_change()
+            with Live(
+                console=self.console,
+                auto_refresh=False,
+                transient=False,
+            ) as live:
+                self._live = live
+                self.render(force=True)
+                while self._running:
+                    # A timeout is the tick: only the header's timer moved
+                    await self._wait_for_change(self.tick_interval)
+                    await self._coalesce()
+                    self.render()
         except asyncio.CancelledError:
             pass
         finally:
+            self._live = None
             self._running = False
 
     def stop(self) -> None:
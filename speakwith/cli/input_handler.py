@@ -1,68 +1,148 @@
 """Non-blocking user input handler."""
 
 import asyncio
-from typing import Callable, Optional, Awaitable
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
 
-from aioconsole import ainput
+from speakwith.autocomplete import PredictiveText
+from speakwith.cli.keys import BACKSPACE, ENTER, ESCAPE, TAB, KeyPress, KeySource, default_key_source
+from speakwith.models import SharedState
 
-from speakwith.models import SharedState, Suggestions
+
+@dataclass
+class InputStats:
+    """Keystroke and latency statistics for committed responses."""
+
+    keystrokes: int = 0
+    commits: int = 0
+    last_commit_ms: float = 0.0
+    max_commit_ms: float = 0.0
+    total_commit_ms: float = 0.0
+
+    @property
+    def avg_commit_ms(self) -> float:
+        """Average time from the committing key press to the recorded response."""
+        if not self.commits:
+            return 0.0
+        return self.total_commit_ms / self.commits
 
 
 class InputHandler:
     """Non-blocking input handler for user responses.
 
     Handles:
-    - Number selection (1-6) for suggestions
-    - 'c' for custom response
+    - Number selection (1-6) for suggestions on a single key press
+    - 'c' (or any other character) for an inline custom response editor
+    - Tab to accept the top autocomplete candidate while editing
     - Graceful cancellation
+
+    Keys come from a pluggable KeySource; by default a raw-mode terminal
+    reader, or a LineKeySource when stdin is not a terminal. If a predictor is
+    given, it is queried on every edit and learns from every committed
+    response.
     """
 
-    def __init__(self, state: SharedState, on_response: Optional[Callable[[str], Awaitable[None]]] = None):
+    def __init__(
+        self,
+        state: SharedState,
+        on_response: Optional[Callable[[str], Awaitable[None]]] = None,
+        key_source: Optional[KeySource] = None,
+        predictor: Optional[PredictiveText] = None,
+    ):
         self.state = state
         self.on_response = on_response
+        self.key_source = key_source
+        self.predictor = predictor
+        self.stats = InputStats()
+        self._draft: Optional[str] = None  # None when the editor is closed
         self._running = False
 
-    async def _handle_input(self, user_input: str) -> Optional[str]:
-        """Process user input and return the selected response."""
-        user_input = user_input.strip().lower()
-
-        if not user_input:
-            return None
+    @property
+    def editing(self) -> bool:
+        """True while the inline custom response editor is open."""
+        return self._draft is not None
 
+    def _select(self, num: int) -> Optional[str]:
+        """Return the suggestion shown as [num], if any."""
         suggestions = self.state.suggestions
+        if 1 <= num <= 3 and num <= len(suggestions.reactions):
+            return suggestions.reactions[num - 1]
+        elif 4 <= num <= 6 and (num - 4) < len(suggestions.followups):
+            return suggestions.followups[num - 4]
+        return None
+
+    async def _set_draft(self, draft: Optional[str]) -> None:
+        """Update the editor buffer and mirror it into shared state."""
+        self._draft = draft
+        completions: tuple[str, ...] = ()
+        if draft is not None and self.predictor is not None:
+            completions = tuple(self.predictor.complete(draft))
+        await self.state.set_draft(draft, completions)
+
+    async def _handle_key(self, press: KeyPress) -> Optional[str]:
+        """Process one key press and return a response if it commits one."""
+        key = press.key
+
+        if self._draft is None:
+            # Handle number selection
+            if key.isdigit():
+                return self._select(int(key))
+
+            # Handle custom response
+            if key == "c":
+                await self._set_draft("")
+            elif press.is_printable and not key.isspace():
+                # Start typing a direct response
+                await self._set_draft(key)
+            return None
 
-        # Handle number selection
-        if user_input.isdigit():
-            num = int(user_input)
-            if 1 <= num <= 3 and num <= len(suggestions.reactions):
-                return suggestions.reactions[num - 1]
-            elif 4 <= num <= 6 and (num - 4) < len(suggestions.followups):
-                return suggestions.followups[num - 4]
-
-        # Handle custom response
-        if user_input == "c":
-            try:
-                custom = await ainput("Your response: ")
-                return custom.strip() if custom.strip() else None
-            except (EOFError, asyncio.CancelledError):
-                return None
-
-        # Treat any other input as a direct response
-        return user_input if len(user_input) > 1 else None
+        # Inline editor
+        if key == ENTER:
+            response = self._draft.strip()
+            await self._set_draft(None)
+            return response or None
+        if key == ESCAPE:
+            await self._set_draft(None)
+        elif key == BACKSPACE:
+            await self._set_draft(self._draft[:-1])
+        elif key == TAB:
+            if self.state.completions:
+                await self._set_draft(PredictiveText.accept(self._draft, self.state.completions[0]))
+        elif press.is_printable:
+            await self._set_draft(self._draft + key)
+        return None
+
+    async def _commit(self, response: str, press: KeyPress) -> None:
+        """Record a response and its key-to-commit latency."""
+        await self.state.set_user_response(response)
+
+        latency_ms = (time.perf_counter() - press.timestamp) * 1000.0
+        self.stats.commits += 1
+        self.stats.last_commit_ms = latency_ms
+        self.stats.total_commit_ms += latency_ms
+        self.stats.max_commit_ms = max(self.stats.max_commit_ms, latency_ms)
+
+        if self.predictor is not None:
+            self.predictor.learn(response)
+
+        if self.on_response:
+            await self.on_response(response)
 
     async def run(self) -> None:
         """Background task that listens for user input."""
         self._running = True
+        source = self.key_source or default_key_source()
+        source.start()
         try:
             while self._running:
                 try:
-                    user_input = await ainput("")
-                    response = await self._handle_input(user_input)
+                    press = await source.read_key()
+                    self.stats.keystrokes += 1
+                    response = await self._handle_key(press)
 
                     if response:
-                        await self.state.set_user_response(response)
-                        if self.on_response:
-                            await self.on_response(response)
+                        await self._commit(response, press)
 
                 except EOFError:
                     break
@@ -70,6 +150,7 @@ class InputHandler:
                     break
 
         finally:
+            source.close()
             self._running = False
 
     def stop(self) -> None:
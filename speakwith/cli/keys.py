@@ -0,0 +1,197 @@
+"""Single-keystroke input sources for the CLI."""
+
+import asyncio
+import codecs
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+# Named keys (everything else is delivered as the typed character)
+ENTER = "enter"
+BACKSPACE = "backspace"
+ESCAPE = "escape"
+TAB = "tab"
+UNKNOWN = "unknown"  # Unhandled escape sequences (arrows, function keys)
+
+_CONTROL_KEYS = {
+    "\r": ENTER,
+    "\n": ENTER,
+    "\x7f": BACKSPACE,
+    "\x08": BACKSPACE,
+    "\t": TAB,
+}
+_EOF = "\x04"
+
+
+@dataclass
+class KeyPress:
+    """A single key press with the time it was read."""
+
+    key: str
+    timestamp: float = field(default_factory=time.perf_counter)
+
+    @property
+    def is_printable(self) -> bool:
+        """True for a single printable character."""
+        return len(self.key) == 1 and self.key.isprintable()
+
+
+def parse_keys(text: str) -> list[str]:
+    """Split raw terminal input into key names.
+
+    Escape sequences (e.g. arrow keys) collapse into a single UNKNOWN key,
+    a lone ESC becomes ESCAPE and Ctrl+D is passed through for EOF handling.
+    """
+    keys: list[str] = []
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == "\x1b":
+            if i + 1 < len(text) and text[i + 1] in "[O":
+                # CSI / SS3 sequence: runs until a final byte in @..~
+                j = i + 2
+                while j < len(text) and not ("@" <= text[j] <= "~"):
+                    j += 1
+                keys.append(UNKNOWN)
+                i = j + 1
+                continue
+            keys.append(ESCAPE)
+        elif char in _CONTROL_KEYS:
+            keys.append(_CONTROL_KEYS[char])
+        elif char == _EOF or char.isprintable():
+            keys.append(char)
+        i += 1
+    return keys
+
+
+class KeySource(ABC):
+    """Abstract source of key presses.
+
+    Implementations deliver one KeyPress per physical key so the input
+    handler can react without waiting for a full line.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[KeyPress] = asyncio.Queue()
+
+    def start(self) -> None:
+        """Begin delivering keys."""
+
+    def close(self) -> None:
+        """Stop delivering keys and release resources."""
+
+    def _push(self, text: str, timestamp: Optional[float] = None) -> None:
+        """Queue the keys contained in raw input text."""
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        for key in parse_keys(text):
+            self._queue.put_nowait(KeyPress(key, timestamp))
+
+    async def read_key(self) -> KeyPress:
+        """Wait for the next key press.
+
+        Raises:
+            EOFError: If the input reached end of file (Ctrl+D or closed stream).
+        """
+        press = await self._read()
+        if press.key == _EOF:
+            raise EOFError
+        return press
+
+    @abstractmethod
+    async def _read(self) -> KeyPress:
+        """Return the next queued key press."""
+        pass
+
+
+class QueueKeySource(KeySource):
+    """Key source fed programmatically, for headless use and tests."""
+
+    def feed(self, text: str) -> None:
+        """Queue raw input as if it had been typed."""
+        self._push(text)
+
+    def feed_key(self, key: str) -> None:
+        """Queue a single named key such as ENTER or ESCAPE."""
+        self._queue.put_nowait(KeyPress(key))
+
+    def feed_eof(self) -> None:
+        """Signal end of input."""
+        self._queue.put_nowait(KeyPress(_EOF))
+
+    async def _read(self) -> KeyPress:
+        return await self._queue.get()
+
+
+class TerminalKeySource(KeySource):
+    """Reads keys from a TTY in cbreak mode without blocking the event loop.
+
+    The terminal is switched to cbreak mode (no line buffering, no echo,
+    signals still delivered) and stdin is watched with the event loop's
+    selector, so each key press is queued the moment it arrives.
+    """
+
+    def __init__(self, fd: Optional[int] = None):
+        super().__init__()
+        self.fd = sys.stdin.fileno() if fd is None else fd
+        self._saved_attrs: Optional[list] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def start(self) -> None:
+        """Switch the terminal to cbreak mode and register the reader."""
+        import termios
+        import tty
+
+        self._saved_attrs = termios.tcgetattr(self.fd)
+        tty.setcbreak(self.fd, termios.TCSANOW)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self.fd, self._on_readable)
+
+    def _on_readable(self) -> None:
+        """Selector callback: drain whatever bytes are available."""
+        timestamp = time.perf_counter()
+        try:
+            data = os.read(self.fd, 1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        if not data:
+            self._queue.put_nowait(KeyPress(_EOF, timestamp))
+            return
+        self._push(self._decoder.decode(data), timestamp)
+
+    def close(self) -> None:
+        """Unregister the reader and restore the terminal settings."""
+        if self._loop is not None:
+            self._loop.remove_reader(self.fd)
+            self._loop = None
+        if self._saved_attrs is not None:
+            import termios
+
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved_attrs)
+            self._saved_attrs = None
+
+    async def _read(self) -> KeyPress:
+        return await self._queue.get()
+
+
+class LineKeySource(KeySource):
+    """Fallback for non-TTY stdin: reads whole lines and replays them as keys."""
+
+    async def _read(self) -> KeyPress:
+        if self._queue.empty():
+            from aioconsole import ainput
+
+            line = await ainput("")
+            self._push(line + "\n")
+        return await self._queue.get()
+
+
+def default_key_source() -> KeySource:
+    """Pick the best key source for the current stdin."""
+    if sys.stdin.isatty() and os.name == "posix":
+        return TerminalKeySource()
+    return LineKeySource()
@@ -1,12 +1,32 @@
 """Configuration management for SpeakWith."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 from dotenv import load_dotenv
 
+DECODE_MODES = ("beam", "greedy", "adaptive")
+CASSETTE_MODES = ("record", "replay")
+CASSETTE_LATENCIES = ("recorded", "zero")
+
+# Environment variables not named after their field in upper case
+_ENV_NAMES = {"refine_in_background": "REFINE_BACKGROUND"}
+
+
+def env_name(field_name: str) -> str:
+    """Environment variable that sets a Config field."""
+    return _ENV_NAMES.get(field_name, field_name.upper())
+
+
+def _env_bool(env: Mapping[str, str], name: str, default: bool) -> bool:
+    """Read a boolean environment variable (1/true/yes/on)."""
+    value = env.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
 
 @dataclass
 class Config:
@@ -17,46 +37,218 @@ class Config:
 
     # Whisper
     whisper_model: str = "base"
+    beam_size: int = 5
+    decode_mode: str = "adaptive"  # beam, greedy, or adaptive (greedy + beam on weak segments)
+    redecode_logprob: float = -0.7  # Segments below this avg_logprob are re-decoded
+    redecode_compression: float = 2.0  # ...or above this compression ratio
+    refine_in_background: bool = False  # Publish greedy text first, refine it afterwards
+    language: str = ""  # Language code such as "en"; empty detects it per session
 
     # Audio
     sample_rate: int = 16000
     chunk_duration: float = 10.0
+    capture_native: bool = True  # Open the mic at its own rate/channels and convert in NumPy
+    capture_channels: int = 0  # Channels to capture and mix down (0 = all the device has)
+    capture_process: bool = False  # Own the device in a separate process (shared-memory ring)
+    noise_suppression: bool = False  # Spectral gating, DC removal and AGC before Whisper
+    noise_reduction_db: float = 12.0  # Maximum attenuation of noise-only frequency bins
+    agc_target_dbfs: float = -20.0  # Speech level the AGC aims for (0 = no AGC)
+    audio_spool: bool = False  # Keep recent session audio in user_data/spool for replay
+    spool_retention: float = 900.0  # Seconds of audio the spool keeps (oldest evicted first)
 
     # Paths
     user_data_dir: Path = Path("user_data")
 
+    # Profile digest sent in prompts (0 = send the raw files)
+    profile_digest_tokens: int = 250
+    profile_summarize: bool = False  # Condense with the LLM instead of extraction
+    profile_poll_interval: float = 2.0  # Seconds between checks for edits
+
     # LLM
     llm_model: str = "gpt-4o-mini"
     llm_temperature: float = 0.7
+    llm_max_tokens: int = 0  # Cap on suggestion/summary replies (0 = no cap)
+    openai_base_url: str = ""  # Alternative endpoint (proxy, local stand-in); empty = OpenAI
+    llm_limiter: bool = True  # Adaptive concurrency limit, priority lanes, usage accounting
+    llm_concurrency: int = 4  # Starting concurrency limit
+    llm_max_concurrency: int = 16
+    llm_timeout: float = 30.0  # Seconds per call before it counts as overload
+    llm_max_retries: int = 3  # Retries after a 429 or timeout
+    llm_cassette: str = ""  # Record/replay LLM responses to this file (empty = off)
+    llm_cassette_mode: str = "replay"  # "record" or "replay"
+    llm_cassette_latency: str = "recorded"  # Replay delay: "recorded" or "zero"
+
+    # Apply each mode's performance profile on top of these settings
+    mode_profiles: bool = True
+
+    # Step down a quality ladder (decoding, model, silence gate) when transcription
+    # falls behind, and back up when there is headroom again
+    quality_control: bool = False
+    target_latency: float = 4.0  # Seconds from end of a chunk's audio to its transcript
 
     # Memory
     max_transcripts: int = 3
     summary_update_interval: int = 3  # Update summary every N transcripts
 
+    # Suggestion trigger: end-of-turn score needed, quiet period before
+    # generating, and the longest a transcript may wait unanswered (seconds)
+    trigger_threshold: float = 0.5
+    trigger_debounce: float = 0.5
+    trigger_max_staleness: float = 6.0
+
+    # Audio chunks with RMS below this are skipped before transcription (0 = off)
+    silence_threshold: float = 0.0
+
+    # Transcripts failing these checks never reach memory or the LLM
+    transcript_filter: bool = True
+    max_no_speech_prob: float = 0.6
+    min_avg_logprob: float = -1.0
+
+    # Display
+    display_max_fps: float = 10.0
+    debug_panel: bool = False
+
+    # Instrumentation
+    metrics_enabled: bool = False
+    metrics_export_interval: float = 10.0
+
+    # Apply .env edits (or a SIGHUP) to the running session
+    config_reload: bool = True
+
+    # Diagnostics (loop stall watchdog; sampling profiler when interval > 0)
+    diagnostics: bool = False
+    stall_threshold_ms: float = 100.0
+    profile_sample_ms: float = 0.0
+
+    # Fields set explicitly in the environment; mode profiles leave them alone
+    explicit: frozenset[str] = field(default=frozenset(), compare=False, repr=False)
+
     @classmethod
     def load(cls, env_file: Optional[Path] = None) -> "Config":
-        """Load configuration from environment variables."""
+        """Load and validate configuration from environment variables.
+
+        Raises:
+            ValueError: If a value is missing, does not parse or fails validation.
+        """
         if env_file:
             load_dotenv(env_file)
         else:
             load_dotenv()
+        config = cls.from_env(os.environ)
+        config.validate()
+        return config
 
-        openai_key = os.getenv("OPENAI_API_KEY")
-        if not openai_key:
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "Config":
+        """Build a configuration from environment-style key/value pairs.
+
+        Raises:
+            ValueError: If OPENAI_API_KEY is missing (it is optional while
+                replaying an LLM cassette) or a value does not parse.
+        """
+        openai_key = env.get("OPENAI_API_KEY", "")
+        replay = bool(env.get("LLM_CASSETTE")) and env.get("LLM_CASSETTE_MODE", "replay").lower() == "replay"
+        if not openai_key and not replay:
             raise ValueError("OPENAI_API_KEY environment variable is required")
 
+        explicit = frozenset(f.name for f in fields(cls) if env_name(f.name) in env)
         return cls(
             openai_api_key=openai_key,
-            whisper_model=os.getenv("WHISPER_MODEL", "base"),
-            sample_rate=int(os.getenv("SAMPLE_RATE", "16000")),
-            chunk_duration=float(os.getenv("CHUNK_DURATION", "10.0")),
-            user_data_dir=Path(os.getenv("USER_DATA_DIR", "user_data")),
-            llm_model=os.getenv("LLM_MODEL", "gpt-4o-mini"),
-            llm_temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
-            max_transcripts=int(os.getenv("MAX_TRANSCRIPTS", "3")),
-            summary_update_interval=int(os.getenv("SUMMARY_UPDATE_INTERVAL", "3")),
+            whisper_model=env.get("WHISPER_MODEL", "base"),
+            beam_size=int(env.get("BEAM_SIZE", "5")),
+            decode_mode=env.get("DECODE_MODE", "adaptive").strip().lower(),
+            redecode_logprob=float(env.get("REDECODE_LOGPROB", "-0.7")),
+            redecode_compression=float(env.get("REDECODE_COMPRESSION", "2.0")),
+            refine_in_background=_env_bool(env, "REFINE_BACKGROUND", False),
+            language=env.get("LANGUAGE", "").strip().lower(),
+            sample_rate=int(env.get("SAMPLE_RATE", "16000")),
+            chunk_duration=float(env.get("CHUNK_DURATION", "10.0")),
+            capture_native=_env_bool(env, "CAPTURE_NATIVE", True),
+            capture_channels=int(env.get("CAPTURE_CHANNELS", "0")),
+            capture_process=_env_bool(env, "CAPTURE_PROCESS", False),
+            noise_suppression=_env_bool(env, "NOISE_SUPPRESSION", False),
+            noise_reduction_db=float(env.get("NOISE_REDUCTION_DB", "12.0")),
+            agc_target_dbfs=float(env.get("AGC_TARGET_DBFS", "-20.0")),
+            audio_spool=_env_bool(env, "AUDIO_SPOOL", False),
+            spool_retention=float(env.get("SPOOL_RETENTION", "900")),
+            user_data_dir=Path(env.get("USER_DATA_DIR", "user_data")),
+            profile_digest_tokens=int(env.get("PROFILE_DIGEST_TOKENS", "250")),
+            profile_summarize=_env_bool(env, "PROFILE_SUMMARIZE", False),
+            profile_poll_interval=float(env.get("PROFILE_POLL_INTERVAL", "2.0")),
+            llm_model=env.get("LLM_MODEL", "gpt-4o-mini"),
+            llm_temperature=float(env.get("LLM_TEMPERATURE", "0.7")),
+            llm_max_tokens=int(env.get("LLM_MAX_TOKENS", "0")),
+            openai_base_url=env.get("OPENAI_BASE_URL", ""),
+            llm_limiter=_env_bool(env, "LLM_LIMITER", True),
+            llm_concurrency=int(env.get("LLM_CONCURRENCY", "4")),
+            llm_max_concurrency=int(env.get("LLM_MAX_CONCURRENCY", "16")),
+            llm_timeout=float(env.get("LLM_TIMEOUT", "30.0")),
+            llm_max_retries=int(env.get("LLM_MAX_RETRIES", "3")),
+            llm_cassette=env.get("LLM_CASSETTE", ""),
+            llm_cassette_mode=env.get("LLM_CASSETTE_MODE", "replay").lower(),
+            llm_cassette_latency=env.get("LLM_CASSETTE_LATENCY", "recorded").lower(),
+            mode_profiles=_env_bool(env, "MODE_PROFILES", True),
+            quality_control=_env_bool(env, "QUALITY_CONTROL", False),
+            target_latency=float(env.get("TARGET_LATENCY", "4.0")),
+            max_transcripts=int(env.get("MAX_TRANSCRIPTS", "3")),
+            summary_update_interval=int(env.get("SUMMARY_UPDATE_INTERVAL", "3")),
+            trigger_threshold=float(env.get("TRIGGER_THRESHOLD", "0.5")),
+            trigger_debounce=float(env.get("TRIGGER_DEBOUNCE", "0.5")),
+            trigger_max_staleness=float(env.get("TRIGGER_MAX_STALENESS", "6.0")),
+            silence_threshold=float(env.get("SILENCE_THRESHOLD", "0.0")),
+            transcript_filter=_env_bool(env, "TRANSCRIPT_FILTER", True),
+            max_no_speech_prob=float(env.get("MAX_NO_SPEECH_PROB", "0.6")),
+            min_avg_logprob=float(env.get("MIN_AVG_LOGPROB", "-1.0")),
+            display_max_fps=float(env.get("DISPLAY_MAX_FPS", "10.0")),
+            debug_panel=_env_bool(env, "DEBUG_PANEL", False),
+            metrics_enabled=_env_bool(env, "METRICS_ENABLED", False),
+            metrics_export_interval=float(env.get("METRICS_EXPORT_INTERVAL", "10.0")),
+            config_reload=_env_bool(env, "CONFIG_RELOAD", True),
+            diagnostics=_env_bool(env, "DIAGNOSTICS", False),
+            stall_threshold_ms=float(env.get("STALL_THRESHOLD_MS", "100")),
+            profile_sample_ms=float(env.get("PROFILE_SAMPLE_MS", "0")),
+            explicit=explicit,
         )
 
+    def validate(self) -> None:
+        """Check that the settings make sense together.
+
+        Raises:
+            ValueError: Listing every invalid setting.
+        """
+        problems = []
+        if self.decode_mode not in DECODE_MODES:
+            problems.append(f"DECODE_MODE must be one of {', '.join(DECODE_MODES)}")
+        if self.beam_size < 1:
+            problems.append("BEAM_SIZE must be at least 1")
+        if self.sample_rate <= 0 or self.chunk_duration <= 0:
+            problems.append("SAMPLE_RATE and CHUNK_DURATION must be positive")
+        if not 0.0 <= self.llm_temperature <= 2.0:
+            problems.append("LLM_TEMPERATURE must be between 0 and 2")
+        if self.llm_concurrency < 1 or self.llm_max_concurrency < self.llm_concurrency:
+            problems.append("LLM_CONCURRENCY must be at least 1 and at most LLM_MAX_CONCURRENCY")
+        if self.llm_cassette_mode not in CASSETTE_MODES:
+            problems.append(f"LLM_CASSETTE_MODE must be one of {', '.join(CASSETTE_MODES)}")
+        if self.llm_cassette_latency not in CASSETTE_LATENCIES:
+            problems.append(f"LLM_CASSETTE_LATENCY must be one of {', '.join(CASSETTE_LATENCIES)}")
+        if self.max_transcripts < 1 or self.summary_update_interval < 1:
+            problems.append("MAX_TRANSCRIPTS and SUMMARY_UPDATE_INTERVAL must be at least 1")
+        if self.target_latency <= 0:
+            problems.append("TARGET_LATENCY must be positive")
+        if problems:
+            raise ValueError("; ".join(problems))
+
+    def diff(self, other: "Config") -> dict[str, tuple[Any, Any]]:
+        """Fields whose value differs in `other`, as (old, new) pairs."""
+        changes = {}
+        for f in fields(self):
+            if not f.compare:
+                continue
+            old, new = getattr(self, f.name), getattr(other, f.name)
+            if old != new:
+                changes[f.name] = (old, new)
+        return changes
+
 
 # Global config instance (initialized on first access)
 _config: Optional[Config] = None
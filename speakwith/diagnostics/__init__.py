@@ -0,0 +1,12 @@
+"""Runtime diagnostics: event-loop stall detection and stack sampling."""
+
+from speakwith._lazy import lazy_exports
+
+__all__ = ["Diagnostics", "LoopWatchdog", "StackSampler", "StallReport"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Diagnostics": "speakwith.diagnostics.collector",
+    "LoopWatchdog": "speakwith.diagnostics.watchdog",
+    "StackSampler": "speakwith.diagnostics.sampler",
+    "StallReport": "speakwith.diagnostics.watchdog",
+})
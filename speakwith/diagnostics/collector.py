@@ -0,0 +1,48 @@
+"""Diagnostics mode: watchdog plus optional sampler, written to user_data."""
+
+import time
+from pathlib import Path
+from typing import Optional
+
+from speakwith.diagnostics.sampler import StackSampler
+from speakwith.diagnostics.watchdog import LoopWatchdog
+
+
+class Diagnostics:
+    """Runs the loop watchdog and, optionally, the stack sampler.
+
+    Output goes to `directory`, one pair of files per run:
+    `stalls-<stamp>.log` with the blocking stack of every stall and
+    `profile-<stamp>.folded` with flamegraph-compatible folded stacks.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        stall_threshold: float = 0.1,
+        sample_interval: float = 0.0,
+    ):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.directory = directory
+        self.stall_log = directory / f"stalls-{stamp}.log"
+        self.profile_path = directory / f"profile-{stamp}.folded"
+        self.watchdog = LoopWatchdog(threshold=stall_threshold, log_path=self.stall_log)
+        self.sampler: Optional[StackSampler] = (
+            StackSampler(sample_interval) if sample_interval > 0 else None
+        )
+
+    def start(self) -> None:
+        """Start watching; must be called from the event loop thread."""
+        self.watchdog.start()
+        if self.sampler:
+            self.sampler.start()
+
+    def stop(self) -> None:
+        """Stop watching and write the profile."""
+        self.watchdog.stop()
+        if self.sampler:
+            self.sampler.stop()
+            try:
+                self.sampler.write(self.profile_path)
+            except OSError:
+                pass
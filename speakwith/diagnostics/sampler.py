@@ -0,0 +1,73 @@
+"""Stack-sampling profiler writing flamegraph folded stacks."""
+
+import os
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def fold_stack(thread_name: str, frame: Optional[FrameType]) -> str:
+    """Collapse a stack into `thread;outer;...;inner` form."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+class StackSampler:
+    """Samples the stacks of every thread at a fixed interval.
+
+    Covers the event loop thread as well as executor workers running
+    Whisper or file I/O. Counts are kept per collapsed stack and written
+    in the folded format understood by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self.total = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                name = names.get(thread_id, f"thread-{thread_id}").replace(";", "_").replace(" ", "_")
+                self.samples[fold_stack(name, frame)] += 1
+            self.total += 1
+
+    def start(self) -> None:
+        """Begin sampling on a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="speakwith-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def folded(self) -> str:
+        """Samples as `stack count` lines, heaviest first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def write(self, path: Path) -> None:
+        """Write folded stacks to a file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.folded(), encoding="utf-8")
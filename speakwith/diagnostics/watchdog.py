@@ -0,0 +1,114 @@
+"""Event-loop stall detector that captures the blocking stack."""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class StallReport:
+    """A period where the event loop did not run its heartbeat."""
+
+    started_at: float  # wall clock
+    duration: float  # seconds, updated until the stall ends
+    stack: str  # stack of the loop thread when the stall was detected
+
+    def format(self) -> str:
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.started_at))
+        return f"[{stamp}] loop blocked for {self.duration * 1000:.0f} ms\n{self.stack}"
+
+
+class LoopWatchdog:
+    """Detects callbacks that block the event loop longer than a threshold.
+
+    A heartbeat coroutine on the loop stamps the time every `interval`;
+    a monitor thread notices when the stamp goes stale and records the
+    loop thread's current stack, which is the code that is blocking it.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: float = 0.02,
+        log_path: Optional[Path] = None,
+        max_reports: int = 100,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self.log_path = log_path
+        self.reports: deque[StallReport] = deque(maxlen=max_reports)
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    async def _heartbeat(self) -> None:
+        try:
+            while True:
+                self._beat = time.monotonic()
+                await asyncio.sleep(self.interval)
+        except asyncio.CancelledError:
+            pass
+
+    def _monitor(self) -> None:
+        current: Optional[StallReport] = None
+        while not self._stop.wait(self.interval / 2):
+            stale = time.monotonic() - self._beat
+            if stale < self.threshold:
+                if current is not None:
+                    self._finish(current)
+                    current = None
+                continue
+            if current is None:
+                current = StallReport(
+                    started_at=time.time() - stale,
+                    duration=stale,
+                    stack=self._loop_stack(),
+                )
+                self.reports.append(current)
+            else:
+                current.duration = stale
+        if current is not None:
+            self._finish(current)
+
+    def _loop_stack(self) -> str:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return "(loop thread stack unavailable)\n"
+        return "".join(traceback.format_stack(frame))
+
+    def _finish(self, report: StallReport) -> None:
+        if self.log_path is None:
+            return
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(report.format() + "\n")
+        except OSError:
+            pass
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._monitor, name="speakwith-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching (flushes an ongoing stall to the log)."""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
@@ -0,0 +1,255 @@
+"""Live configuration: reload the .env file into a running session."""
+
+import asyncio
+import inspect
+import json
+import os
+import signal
+import time
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+from dotenv import dotenv_values, find_dotenv
+
+from speakwith.config import Config
+from speakwith.metrics import get_metrics
+
+ConfigListener = Callable[[Config], Union[None, Awaitable[None]]]
+ConfigResolver = Callable[[Config], Config]
+
+# Values never written to the reload log
+SECRET_KEYS = frozenset({"openai_api_key"})
+
+
+@dataclass
+class ConfigChange:
+    """Outcome of one reload."""
+
+    timestamp: float  # wall clock
+    applied: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    restart_required: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    # Applied, but the effective value is unchanged (a mode profile or
+    # quality rung overrides the key)
+    shadowed: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    error: str = ""  # Why the new settings were rejected as a whole
+
+    def to_dict(self) -> dict:
+        def _masked(changes: dict[str, tuple[Any, Any]]) -> dict:
+            return {k: ("***", "***") if k in SECRET_KEYS else v for k, v in changes.items()}
+
+        data = asdict(self)
+        data["applied"] = _masked(self.applied)
+        data["restart_required"] = _masked(self.restart_required)
+        data["shadowed"] = _masked(self.shadowed)
+        return data
+
+
+class LiveConfig:
+    """The current Config, re-read when the .env file changes or on SIGHUP.
+
+    Components subscribe to the keys they can apply while running. A reload
+    parses and validates the whole file first (a bad value rejects the
+    reload and keeps the current settings), then applies the changed keys
+    somebody subscribed to and calls those subscribers once each with the
+    new Config. Changed keys nobody subscribed to are reported as needing a
+    restart and keep their current value.
+
+    Variables set in the process environment win over the file, as they do
+    at startup. Adding or removing a key counts as a change even when its
+    value stays the same, since it decides whether a mode profile may
+    override the key.
+
+    When given, `resolve` maps a config to the one the pipeline actually
+    runs with (mode profile and quality rung applied); applied keys whose
+    resolved value did not change are reported as shadowed.
+
+    Args:
+        config: The settings the session started with.
+        env_file: File to watch (None only reloads on SIGHUP, from the
+            process environment).
+        poll_interval: Seconds between checks of the file's mtime.
+        log_path: File every reload is appended to (JSON lines).
+        resolve: Maps a config to the effective one (None: used as is).
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        env_file: Optional[Path] = None,
+        poll_interval: float = 2.0,
+        log_path: Optional[Path] = None,
+        resolve: Optional[ConfigResolver] = None,
+    ):
+        self._config = config
+        self.resolve = resolve
+        self.env_file = env_file
+        self.poll_interval = poll_interval
+        self.log_path = log_path
+        self.changes: list[ConfigChange] = []
+        self._listeners: list[tuple[frozenset[str], ConfigListener]] = []
+        self._mtime = self._stat()
+        # Keys load_dotenv copied from the file are the file's to change
+        startup = self._read_file()
+        self._process_env = {k: v for k, v in os.environ.items() if startup.get(k) != v}
+        self._wake = asyncio.Event()
+        self._running = False
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Config,
+        env_file: Optional[Path] = None,
+        resolve: Optional[ConfigResolver] = None,
+    ) -> Optional["LiveConfig"]:
+        """Watch `env_file` (default: the .env load_dotenv found), or None when disabled."""
+        if not config.config_reload:
+            return None
+        if env_file is None:
+            found = find_dotenv(usecwd=True)
+            env_file = Path(found) if found else None
+        return cls(config, env_file, log_path=config.user_data_dir / "config" / "reloads.jsonl", resolve=resolve)
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @property
+    def live_keys(self) -> frozenset[str]:
+        """Every key some subscriber applies while running."""
+        return frozenset().union(*(keys for keys, _ in self._listeners))
+
+    def subscribe(self, keys: Iterable[str], listener: ConfigListener) -> None:
+        """Call `listener(config)` (sync or async) when any of `keys` changes."""
+        self._listeners.append((frozenset(keys), listener))
+
+    # ----- reading ----------------------------------------------------------
+
+    def _stat(self) -> int:
+        try:
+            return self.env_file.stat().st_mtime_ns if self.env_file else 0
+        except OSError:
+            return 0
+
+    def _read_file(self) -> dict[str, str]:
+        if self.env_file is None or not self.env_file.exists():
+            return {}
+        return {k: v for k, v in dotenv_values(self.env_file).items() if v is not None}
+
+    def read(self) -> Config:
+        """Parse and validate the current file plus process environment.
+
+        Raises:
+            ValueError: If a value does not parse or fails validation.
+        """
+        config = Config.from_env({**self._read_file(), **self._process_env})
+        config.validate()
+        return config
+
+    # ----- applying ---------------------------------------------------------
+
+    async def update(self, new: Config) -> ConfigChange:
+        """Apply the live-changeable differences between `new` and the current config."""
+        live = self.live_keys
+        old = self._config
+        change = ConfigChange(timestamp=time.time())
+        changes = old.diff(new)
+        for key in old.explicit ^ new.explicit:
+            changes.setdefault(key, (getattr(old, key), getattr(new, key)))
+        for key, values in changes.items():
+            (change.applied if key in live else change.restart_required)[key] = values
+        if change.applied:
+            explicit = (old.explicit - change.applied.keys()) | (new.explicit & change.applied.keys())
+            effective = self.resolve(old) if self.resolve is not None else None
+            self._config = replace(
+                old, explicit=explicit, **{k: value for k, (_, value) in change.applied.items()}
+            )
+            await self._notify(frozenset(change.applied))
+            if effective is not None:
+                resolved = self.resolve(self._config)
+                for key in list(change.applied):
+                    if getattr(effective, key) == getattr(resolved, key):
+                        change.shadowed[key] = change.applied.pop(key)
+        await self._record(change)
+        return change
+
+    async def reload(self) -> ConfigChange:
+        """Re-read the settings and apply them (keeping everything on error)."""
+        loop = asyncio.get_running_loop()
+        try:
+            new = await loop.run_in_executor(None, self.read)
+        except (ValueError, OSError) as e:
+            change = ConfigChange(timestamp=time.time(), error=str(e))
+            await self._record(change)
+            return change
+        return await self.update(new)
+
+    async def _notify(self, changed: frozenset[str]) -> None:
+        metrics = get_metrics()
+        for keys, listener in self._listeners:
+            if not keys & changed:
+                continue
+            try:
+                result = listener(self._config)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                metrics.incr("config_listener_errors")
+
+    async def _record(self, change: ConfigChange) -> None:
+        if not (change.applied or change.restart_required or change.shadowed or change.error):
+            return
+        self.changes.append(change)
+        get_metrics().incr("config_rejected" if change.error else "config_reloads")
+        if self.log_path is not None:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._log, change)
+            except OSError:
+                pass
+
+    def _log(self, change: ConfigChange) -> None:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(change.to_dict(), default=str) + "\n")
+
+    # ----- watching ---------------------------------------------------------
+
+    def _install_signal(self, loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self._wake.set)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            # No SIGHUP (Windows) or not on the main thread
+            return False
+        return True
+
+    async def run(self) -> None:
+        """Poll the file's mtime (and wait for SIGHUP), reloading on change."""
+        self._running = True
+        loop = asyncio.get_running_loop()
+        handled = self._install_signal(loop)
+        try:
+            while self._running:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                if not self._running:
+                    break
+                signalled = self._wake.is_set()
+                self._wake.clear()
+                mtime = await loop.run_in_executor(None, self._stat)
+                if mtime == self._mtime and not signalled:
+                    continue
+                self._mtime = mtime
+                await self.reload()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._running = False
+            if handled:
+                loop.remove_signal_handler(signal.SIGHUP)
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._running = False
+        self._wake.set()
@@ -1,6 +1,27 @@
 """LLM integration module with provider abstraction."""
 
-from speakwith.llm.base import BaseLLMClient
-from speakwith.llm.openai_client import OpenAIClient
+from speakwith._lazy import lazy_exports
 
-__all__ = ["BaseLLMClient", "OpenAIClient"]
+__all__ = [
+    "AdaptiveLimiter",
+    "BaseLLMClient",
+    "CassetteLLMClient",
+    "CassetteMiss",
+    "LimitedLLMClient",
+    "OpenAIClient",
+    "Priority",
+    "UsageTracker",
+    "create_client",
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "AdaptiveLimiter": "speakwith.llm.limiter",
+    "BaseLLMClient": "speakwith.llm.base",
+    "CassetteLLMClient": "speakwith.llm.cassette",
+    "CassetteMiss": "speakwith.llm.cassette",
+    "LimitedLLMClient": "speakwith.llm.limiter",
+    "OpenAIClient": "speakwith.llm.openai_client",
+    "Priority": "speakwith.llm.limiter",
+    "UsageTracker": "speakwith.llm.usage",
+    "create_client": "speakwith.llm.factory",
+})
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 
+from speakwith.config import Config
 from speakwith.models import ConversationContext, Suggestions
 
 
@@ -51,3 +52,9 @@ class BaseLLMClient(ABC):
             Updated summary string.
         """
         pass
+
+    def reconfigure(self, config: Config) -> None:
+        """Apply changed settings (model, token budget) to later calls.
+
+        Providers without tunable settings can keep this default no-op.
+        """
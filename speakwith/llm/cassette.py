@@ -0,0 +1,204 @@
+"""Record and replay LLM responses for deterministic benchmark runs."""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Optional
+
+from speakwith.config import CASSETTE_LATENCIES, CASSETTE_MODES, Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.llm.usage import current_call, record_usage
+from speakwith.metrics import get_metrics
+from speakwith.models import ConversationContext, Suggestions
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: Optional[str]) -> str:
+    """Collapse whitespace runs so formatting-only changes keep their key."""
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+def prompt_key(call_type: str, *parts: Any) -> str:
+    """Short stable hash of a call type and its normalized inputs."""
+    normalized = [normalize_prompt(p) if isinstance(p, str) or p is None else p for p in parts]
+    payload = json.dumps([call_type, normalized], ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+def context_key(context: ConversationContext) -> str:
+    """Key of a suggestion request: what the prompt is built from.
+
+    Transcript timestamps and decoder statistics are left out, so the same
+    replayed audio maps onto the same key in every run.
+    """
+    return prompt_key(
+        "suggestions",
+        context.mode.value,
+        context.profile.background,
+        context.profile.mood_board,
+        context.profile.digest,
+        context.summary,
+        [normalize_prompt(t.text) for t in context.recent_transcripts],
+        context.user_last_response,
+        context.language,
+    )
+
+
+class CassetteMiss(LookupError):
+    """A replayed call that the cassette has no recording of."""
+
+
+class CassetteLLMClient(BaseLLMClient):
+    """Records an LLM's responses to a file, or serves them back offline.
+
+    In "record" mode every call goes to `inner`; its response, latency and
+    token usage are appended to the cassette (JSON lines, one per call)
+    under a hash of the normalized inputs. In "replay" mode calls are
+    answered from the cassette without touching the network, after the
+    recorded latency or none at all. Together with replayed audio this
+    makes benchmark runs repeatable across commits.
+
+    A key recorded several times is replayed in recording order; once only
+    its last response is left, that one is repeated. A key that was never
+    recorded raises CassetteMiss.
+
+    Args:
+        inner: Client to record (may be None for replay).
+        path: Cassette file.
+        mode: "record" (starts a new cassette) or "replay".
+        latency: "recorded" sleeps each call's recorded latency, "zero" answers at once.
+    """
+
+    def __init__(
+        self,
+        inner: Optional[BaseLLMClient],
+        path: Path,
+        mode: str = "replay",
+        latency: str = "recorded",
+    ):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"cassette mode must be one of {', '.join(CASSETTE_MODES)}")
+        if latency not in CASSETTE_LATENCIES:
+            raise ValueError(f"cassette latency must be one of {', '.join(CASSETTE_LATENCIES)}")
+        if mode == "record" and inner is None:
+            raise ValueError("recording needs a client to record")
+        self.inner = inner
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.calls: dict[str, int] = {"generate": 0, "suggestions": 0, "summary": 0}
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._entries: dict[str, deque[dict]] = {}
+        self._started = False
+        self._write_lock = asyncio.Lock()
+        if mode == "replay":
+            self._load()
+
+    @classmethod
+    def wrap(cls, inner: BaseLLMClient, config: Config) -> BaseLLMClient:
+        """Wrap a client per the config (the client itself without a cassette)."""
+        if not config.llm_cassette:
+            return inner
+        return cls(inner, Path(config.llm_cassette), config.llm_cassette_mode, config.llm_cassette_latency)
+
+    # ----- BaseLLMClient ----------------------------------------------------
+
+    async def generate(self, prompt: str, system: str = "") -> str:
+        self.calls["generate"] += 1
+        key = prompt_key("generate", prompt, system)
+        if self.mode == "replay":
+            return await self._replay(key)
+        return await self._record(key, "generate", self.inner.generate(prompt, system))
+
+    async def generate_suggestions(self, context: ConversationContext) -> Suggestions:
+        self.calls["suggestions"] += 1
+        key = context_key(context)
+        if self.mode == "replay":
+            data = await self._replay(key)
+            return Suggestions(reactions=list(data["reactions"]), followups=list(data["followups"]))
+        return await self._record(key, "suggestions", self.inner.generate_suggestions(context))
+
+    async def generate_summary(self, transcripts: list[str], previous_summary: str) -> str:
+        self.calls["summary"] += 1
+        key = prompt_key("summary", [normalize_prompt(t) for t in transcripts], previous_summary)
+        if self.mode == "replay":
+            return await self._replay(key)
+        return await self._record(key, "summary", self.inner.generate_summary(transcripts, previous_summary))
+
+    def reconfigure(self, config: Config) -> None:
+        if self.inner is not None:
+            self.inner.reconfigure(config)
+
+    # ----- replay -----------------------------------------------------------
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(entry["k"], deque()).append(entry)
+
+    async def _replay(self, key: str) -> Any:
+        queue = self._entries.get(key)
+        if not queue:
+            self.misses += 1
+            get_metrics().incr("cassette_misses")
+            raise CassetteMiss(f"no recorded response for {key} in {self.path}")
+        entry = queue.popleft() if len(queue) > 1 else queue[0]
+        self.hits += 1
+        if self.latency == "recorded" and entry["l"] > 0:
+            await asyncio.sleep(entry["l"])
+        prompt_tokens, completion_tokens = entry.get("u", (0, 0))
+        record_usage(prompt_tokens, completion_tokens)
+        return entry["r"]
+
+    # ----- record -----------------------------------------------------------
+
+    async def _record(self, key: str, call_type: str, call: Any) -> Any:
+        usage = current_call()
+        before = (usage.prompt_tokens, usage.completion_tokens) if usage is not None else (0, 0)
+        started = time.perf_counter()
+        result = await call
+        latency = time.perf_counter() - started
+
+        response: Any = result
+        if isinstance(result, Suggestions):
+            response = {"reactions": list(result.reactions), "followups": list(result.followups)}
+        entry = {"k": key, "t": call_type, "l": round(latency, 4), "r": response}
+        if usage is not None:
+            entry["u"] = [usage.prompt_tokens - before[0], usage.completion_tokens - before[1]]
+
+        async with self._write_lock:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._append, entry)
+                self.recorded += 1
+            except OSError:
+                get_metrics().incr("cassette_errors")
+        return result
+
+    def _append(self, entry: dict) -> None:
+        if not self._started:
+            # A recording starts a new cassette
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+            self._started = True
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "latency": self.latency,
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+        }
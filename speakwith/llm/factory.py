@@ -0,0 +1,23 @@
+"""The configured LLM client stack."""
+
+from pathlib import Path
+
+from speakwith.config import Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.llm.cassette import CassetteLLMClient
+from speakwith.llm.limiter import LimitedLLMClient
+
+
+def create_client(config: Config) -> BaseLLMClient:
+    """Provider client wrapped in the cassette and limiter the config asks for.
+
+    Replaying a cassette builds no provider client, so it needs neither an
+    API key nor the network.
+    """
+    if config.llm_cassette and config.llm_cassette_mode == "replay":
+        cassette = CassetteLLMClient(None, Path(config.llm_cassette), "replay", config.llm_cassette_latency)
+        return LimitedLLMClient.wrap(cassette, config)
+
+    from speakwith.llm.openai_client import OpenAIClient
+
+    return LimitedLLMClient.wrap(CassetteLLMClient.wrap(OpenAIClient(config), config), config)
@@ -0,0 +1,294 @@
+"""Adaptive (AIMD) concurrency limiting with priority lanes for LLM calls."""
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+from speakwith.config import Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.llm.usage import UsageTracker
+from speakwith.models import ConversationContext, Suggestions
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Lanes served in order: a waiting interactive call always goes first."""
+
+    INTERACTIVE = 0  # Suggestions the user is waiting for
+    BACKGROUND = 1  # Summaries, profile digests, other generate() calls
+
+
+def is_rate_limit(exc: BaseException) -> bool:
+    """Whether a provider error means "slow down" (HTTP 429)."""
+    return getattr(exc, "status_code", None) == 429 or type(exc).__name__ == "RateLimitError"
+
+
+def is_timeout(exc: BaseException) -> bool:
+    return isinstance(exc, TimeoutError) or type(exc).__name__ == "APITimeoutError"
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait, if the error carries a response."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000.0
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease concurrency limit.
+
+    Every successful call raises the limit by 1/limit (about +1 per full
+    window of calls); a 429 or timeout multiplies it by `backoff`, at most
+    once per `cooldown` seconds so one burst of rejections counts once.
+    Free slots go to the highest-priority waiter, and background calls
+    leave `reserved` slots for interactive ones.
+
+    Args:
+        initial: Starting concurrency.
+        min_limit: Floor for the limit (at least one call always runs).
+        max_limit: Ceiling for the limit.
+        backoff: Factor applied on overload.
+        cooldown: Minimum seconds between two decreases.
+        reserved: Slots background calls may not take (when limit allows).
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+        reserved: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.reserved = reserved
+        self._clock = clock
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.decreases = 0
+        self._last_decrease = float("-inf")
+        self._waiters: dict[Priority, deque[asyncio.Future]] = {p: deque() for p in Priority}
+
+    @classmethod
+    def from_config(cls, config: Config) -> "AdaptiveLimiter":
+        return cls(initial=config.llm_concurrency, max_limit=config.llm_max_concurrency)
+
+    @property
+    def capacity(self) -> int:
+        """Current whole-number concurrency limit."""
+        return int(self.limit)
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(q) for q in self._waiters.values())
+
+    def _can_start(self, priority: Priority) -> bool:
+        capacity = self.capacity
+        if priority is Priority.BACKGROUND and capacity > self.reserved:
+            capacity -= self.reserved
+        return self.in_flight < capacity
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters, best lane first."""
+        for priority in Priority:
+            queue = self._waiters[priority]
+            while queue and self._can_start(priority):
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                waiter.set_result(None)
+            if queue:
+                # A blocked lane keeps lower lanes from jumping ahead
+                return
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.BACKGROUND) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of the block."""
+        higher_waiting = any(self._waiters[p] for p in Priority if p <= priority)
+        if not higher_waiting and self._can_start(priority):
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[priority].append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was granted just as we were cancelled
+                    self.in_flight -= 1
+                    self._wake()
+                raise
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._wake()
+
+    def on_success(self) -> None:
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def on_overload(self) -> None:
+        now = self._clock()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self.decreases += 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "waiting": self.waiting,
+            "decreases": self.decreases,
+        }
+
+
+class LimitedLLMClient(BaseLLMClient):
+    """BaseLLMClient wrapper that runs every call through an AdaptiveLimiter.
+
+    Suggestions use the interactive lane; summaries and plain generate()
+    calls (profile digests) use the background lane. Rate-limited and
+    timed-out calls shrink the limit and are retried with jittered
+    exponential backoff (or the server's Retry-After). Token usage is
+    recorded per call type and per session in a UsageTracker.
+
+    Clients made with `for_session` share the limiter and tracker, so many
+    sessions on one API key adapt to the same limit.
+    """
+
+    def __init__(
+        self,
+        inner: BaseLLMClient,
+        limiter: Optional[AdaptiveLimiter] = None,
+        usage: Optional[UsageTracker] = None,
+        session: str = "",
+        timeout: float = 30.0,
+        max_retries: int = 3,
+        retry_base: float = 0.5,
+    ):
+        self.inner = inner
+        self.limiter = limiter or AdaptiveLimiter()
+        self.usage = usage or UsageTracker()
+        self.session = session
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+
+    @classmethod
+    def wrap(cls, inner: BaseLLMClient, config: Config) -> BaseLLMClient:
+        """Wrap a client per the config (the client itself if limiting is off)."""
+        if not config.llm_limiter:
+            return inner
+        return cls(
+            inner,
+            AdaptiveLimiter.from_config(config),
+            timeout=config.llm_timeout,
+            max_retries=config.llm_max_retries,
+        )
+
+    def for_session(self, session: str) -> "LimitedLLMClient":
+        """A client for one session sharing this limiter and tracker."""
+        return LimitedLLMClient(
+            self.inner,
+            self.limiter,
+            self.usage,
+            session=session,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_base=self.retry_base,
+        )
+
+    def reconfigure(self, config: Config) -> None:
+        """Apply new model, timeout and retry settings; the learned limit is kept."""
+        self.inner.reconfigure(config)
+        self.timeout = config.llm_timeout
+        self.max_retries = config.llm_max_retries
+        self.limiter.max_limit = max(self.limiter.min_limit, config.llm_max_concurrency)
+        self.limiter.limit = min(self.limiter.limit, self.limiter.max_limit)
+
+    async def _call(
+        self,
+        call_type: str,
+        priority: Priority,
+        make_call: Callable[[], Awaitable[T]],
+    ) -> T:
+        attempt = 0
+        while True:
+            call = self.usage.begin(call_type, self.session)
+            wait: Optional[float] = None
+            try:
+                async with self.limiter.slot(priority):
+                    if self.timeout > 0:
+                        result = await asyncio.wait_for(make_call(), self.timeout)
+                    else:
+                        result = await make_call()
+            except Exception as e:
+                if is_rate_limit(e):
+                    self.usage.rate_limited(call)
+                    wait = retry_after(e)
+                elif is_timeout(e):
+                    self.usage.timed_out(call)
+                else:
+                    self.usage.finish(call, ok=False)
+                    raise
+                self.limiter.on_overload()
+                if attempt >= self.max_retries:
+                    self.usage.finish(call, ok=False)
+                    raise
+            else:
+                self.limiter.on_success()
+                self.usage.finish(call)
+                return result
+
+            # Retry after backoff; the slot is released while waiting
+            if wait is None:
+                wait = self.retry_base * (2 ** attempt) * random.uniform(0.5, 1.5)
+            attempt += 1
+            await asyncio.sleep(wait)
+
+    async def generate(self, prompt: str, system: str = "") -> str:
+        return await self._call(
+            "generate", Priority.BACKGROUND, lambda: self.inner.generate(prompt, system)
+        )
+
+    async def generate_suggestions(self, context: ConversationContext) -> Suggestions:
+        return await self._call(
+            "suggestions", Priority.INTERACTIVE, lambda: self.inner.generate_suggestions(context)
+        )
+
+    async def generate_summary(self, transcripts: list[str], previous_summary: str) -> str:
+        return await self._call(
+            "summary",
+            Priority.BACKGROUND,
+            lambda: self.inner.generate_summary(transcripts, previous_summary),
+        )
+
+    def stats(self) -> dict:
+        """Limiter state and token usage."""
+        return {"limiter": self.limiter.stats(), "usage": self.usage.snapshot()}
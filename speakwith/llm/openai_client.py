@@ -1,5 +1,6 @@
 """OpenAI implementation of the LLM client."""
 
+import asyncio
 import json
 from typing import Any
 
@@ -7,16 +8,61 @@ from openai import AsyncOpenAI
 
 from speakwith.config import Config
 from speakwith.llm.base import BaseLLMClient
+from speakwith.llm.usage import record_usage
 from speakwith.models import ConversationContext, Suggestions
+from speakwith.transcription.language import language_name
 
 
 class OpenAIClient(BaseLLMClient):
-    """OpenAI API client for generating suggestions and summaries."""
+    """OpenAI API client for generating suggestions and summaries.
+
+    With the LLM limiter enabled, the SDK's own retries are turned off so
+    429s reach LimitedLLMClient, which backs off for every caller at once.
+    """
 
     def __init__(self, config: Config):
-        self.client = AsyncOpenAI(api_key=config.openai_api_key)
+        self._connection = self._connection_settings(config)
+        self.client = self._connect(config)
+        self._closing: set[asyncio.Task] = set()
+        self.model = config.llm_model
+        self.temperature = config.llm_temperature
+        self.max_tokens = config.llm_max_tokens
+
+    @staticmethod
+    def _connection_settings(config: Config) -> tuple:
+        return (config.openai_api_key, config.openai_base_url, config.llm_timeout, config.llm_limiter)
+
+    @staticmethod
+    def _connect(config: Config) -> AsyncOpenAI:
+        return AsyncOpenAI(
+            api_key=config.openai_api_key,
+            base_url=config.openai_base_url or None,
+            timeout=config.llm_timeout,
+            max_retries=0 if config.llm_limiter else 2,
+        )
+
+    def reconfigure(self, config: Config) -> None:
+        """Switch model, temperature and token budget.
+
+        The HTTP client (and its connection pool) is only replaced when the
+        key, endpoint or timeout changed; calls in flight finish on the old
+        one before it is closed.
+        """
         self.model = config.llm_model
         self.temperature = config.llm_temperature
+        self.max_tokens = config.llm_max_tokens
+
+        connection = self._connection_settings(config)
+        if connection == self._connection:
+            return
+        old, self.client = self.client, self._connect(config)
+        self._connection = connection
+        try:
+            task = asyncio.get_running_loop().create_task(old.close())
+        except RuntimeError:
+            return
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
 
     async def generate(self, prompt: str, system: str = "") -> str:
         """Generate a text response using OpenAI."""
@@ -25,11 +71,18 @@ class OpenAIClient(BaseLLMClient):
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
 
+        options: dict[str, Any] = {}
+        if self.max_tokens:
+            options["max_tokens"] = self.max_tokens
+
         response = await self.client.chat.completions.create(
             model=self.model,
             messages=messages,
             temperature=self.temperature,
+            **options,
         )
+        if response.usage is not None:
+            record_usage(response.usage.prompt_tokens, response.usage.completion_tokens)
 
         return response.choices[0].message.content or ""
 
@@ -64,16 +117,27 @@ Provide an updated summary in 2-3 sentences."""
 
     def _build_system_prompt(self, context: ConversationContext) -> str:
         """Build the system prompt for suggestion generation."""
-        return f"""You are helping a person who cannot speak communicate in a conversation.
-
-USER BACKGROUND:
+        if context.profile.digest:
+            profile_text = f"""USER PROFILE:
+{context.profile.digest}"""
+        else:
+            profile_text = f"""USER BACKGROUND:
 {context.profile.background or "(No background provided)"}
 
 TODAY'S MOOD:
-{context.profile.mood_board or "(No mood board provided)"}
+{context.profile.mood_board or "(No mood board provided)"}"""
 
-MODE: {context.mode.value}
+        language_text = ""
+        if context.language and context.language != "en":
+            name = language_name(context.language)
+            language_text = f"\nLANGUAGE: The conversation is in {name}. Write every suggestion in {name}.\n"
 
+        return f"""You are helping a person who cannot speak communicate in a conversation.
+
+{profile_text}
+
+MODE: {context.mode.value}
+{language_text}
 Generate natural, contextually appropriate responses the user might want to say.
 - Quick reactions should be 1-5 words (emotional for friendly mode, practical for shopping)
 - Follow-ups should be complete sentences that continue the conversation naturally
@@ -0,0 +1,109 @@
+"""Token and call accounting per call type and per session."""
+
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+@dataclass
+class UsageTotals:
+    """Counters for one call type or one session."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    rate_limited: int = 0  # 429s seen (including retried ones)
+    timeouts: int = 0
+    errors: int = 0  # Calls that failed after all retries
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "total_tokens": self.total_tokens}
+
+
+@dataclass
+class CallUsage:
+    """Usage of the call in progress, filled in by the provider client."""
+
+    call_type: str
+    session: str = ""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+_current_call: ContextVar[Optional[CallUsage]] = ContextVar("speakwith_llm_call", default=None)
+
+
+def record_usage(prompt_tokens: int, completion_tokens: int) -> None:
+    """Report tokens used by an API response (no-op outside a tracked call).
+
+    Providers call this after every response; LimitedLLMClient opens the
+    tracked call around each request, so usage lands on the right call
+    type and session even when one request makes several API calls.
+    """
+    call = _current_call.get()
+    if call is not None:
+        call.prompt_tokens += prompt_tokens
+        call.completion_tokens += completion_tokens
+
+
+def current_call() -> Optional[CallUsage]:
+    """The tracked call in progress in this task, if any."""
+    return _current_call.get()
+
+
+class UsageTracker:
+    """Accumulates LLM usage by call type and by session."""
+
+    def __init__(self) -> None:
+        self.by_type: dict[str, UsageTotals] = {}
+        self.by_session: dict[str, UsageTotals] = {}
+
+    def _totals(self, call: CallUsage) -> tuple[UsageTotals, ...]:
+        totals = [self.by_type.setdefault(call.call_type, UsageTotals())]
+        if call.session:
+            totals.append(self.by_session.setdefault(call.session, UsageTotals()))
+        return tuple(totals)
+
+    def begin(self, call_type: str, session: str = "") -> CallUsage:
+        """Start tracking a call in the current task (see record_usage)."""
+        call = CallUsage(call_type, session)
+        _current_call.set(call)
+        return call
+
+    def finish(self, call: CallUsage, ok: bool = True) -> None:
+        """Add a finished call's tokens to its call type and session."""
+        for totals in self._totals(call):
+            totals.calls += 1
+            totals.prompt_tokens += call.prompt_tokens
+            totals.completion_tokens += call.completion_tokens
+            if not ok:
+                totals.errors += 1
+        _current_call.set(None)
+
+    def rate_limited(self, call: CallUsage) -> None:
+        for totals in self._totals(call):
+            totals.rate_limited += 1
+
+    def timed_out(self, call: CallUsage) -> None:
+        for totals in self._totals(call):
+            totals.timeouts += 1
+
+    def forget(self, session: str) -> Optional[UsageTotals]:
+        """Drop and return a finished session's totals."""
+        return self.by_session.pop(session, None)
+
+    def snapshot(self) -> dict:
+        """JSON-friendly view of all counters."""
+        total = UsageTotals()
+        for totals in self.by_type.values():
+            for name, value in asdict(totals).items():
+                setattr(total, name, getattr(total, name) + value)
+        return {
+            "total": total.to_dict(),
+            "by_type": {name: t.to_dict() for name, t in self.by_type.items()},
+            "by_session": {name: t.to_dict() for name, t in self.by_session.items()},
+        }
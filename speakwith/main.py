@@ -1,5 +1,6 @@
 """SpeakWith entry point."""
 
+import argparse
 import asyncio
 import sys
 
@@ -9,7 +10,7 @@ from rich.prompt import Prompt
 from speakwith.config import init_config
 from speakwith.models import ConversationMode
 from speakwith.modes import list_modes
-from speakwith.pipeline import PipelineCoordinator
+from speakwith.startup import preload_in_background
 
 
 console = Console()
@@ -35,7 +36,7 @@ def select_mode() -> ConversationMode:
         console.print("[red]Invalid choice. Please enter a number.[/red]")
 
 
-async def async_main() -> None:
+async def async_main(diagnostics: bool = False) -> None:
     """Async entry point."""
     console.print("[bold cyan]Welcome to SpeakWith[/bold cyan]")
     console.print("Communication assistant for people who cannot speak\n")
@@ -44,12 +45,17 @@ async def async_main() -> None:
     try:
         console.print("Loading configuration... ", end="")
         config = init_config()
+        if diagnostics:
+            config.diagnostics = True
         console.print("[green]Done[/green]")
     except ValueError as e:
         console.print(f"[red]Error: {e}[/red]")
-        console.print("\nPlease create a .env file with your OPENAI_API_KEY")
+        console.print("\nPlease check your .env file (see .env.example)")
         sys.exit(1)
 
+    # Load the heavy pipeline dependencies while the user is choosing
+    preload_in_background()
+
     # Select mode
     mode = select_mode()
 
@@ -57,6 +63,8 @@ async def async_main() -> None:
     console.print(f"\nStarting {mode.value} conversation mode...")
     console.print("Initializing Whisper model... ", end="")
 
+    from speakwith.pipeline import PipelineCoordinator
+
     coordinator = PipelineCoordinator(config, mode)
     await coordinator.initialize()
     console.print("[green]Done[/green]")
@@ -72,10 +80,47 @@ async def async_main() -> None:
     console.print("[bold cyan]Goodbye![/bold cyan]")
 
 
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(prog="speakwith", description="Communication assistant")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print per-import startup timings and exit",
+    )
+    parser.add_argument(
+        "--check-startup-budget",
+        action="store_true",
+        help="Exit non-zero if importing the entry point exceeds the startup budget",
+    )
+    parser.add_argument(
+        "--diagnostics",
+        action="store_true",
+        help="Log event-loop stalls (and sampled stacks if PROFILE_SAMPLE_MS is set) to user_data/diagnostics",
+    )
+    return parser.parse_args(argv)
+
+
 def main() -> None:
     """CLI entry point."""
+    args = parse_args(sys.argv[1:])
+
+    if args.profile_startup:
+        from speakwith.startup import print_startup_profile
+
+        print_startup_profile()
+        return
+
+    if args.check_startup_budget:
+        from speakwith.startup import IMPORT_BUDGET_MS, check_import_budget
+
+        ok, best_ms = check_import_budget()
+        status = "[green]OK[/green]" if ok else "[red]OVER BUDGET[/red]"
+        console.print(f"Startup import: {best_ms:.1f} ms / {IMPORT_BUDGET_MS:.0f} ms {status}")
+        sys.exit(0 if ok else 1)
+
     try:
-        asyncio.run(async_main())
+        asyncio.run(async_main(diagnostics=args.diagnostics))
     except KeyboardInterrupt:
         pass
 
@@ -1,5 +1,9 @@
 """Conversation memory management."""
 
-from speakwith.memory.conversation import ConversationMemory
+from speakwith._lazy import lazy_exports
 
 __all__ = ["ConversationMemory"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ConversationMemory": "speakwith.memory.conversation",
+})
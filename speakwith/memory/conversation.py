@@ -1,10 +1,11 @@
 """Conversation memory management with summary and transcript history."""
 
 import asyncio
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from speakwith.config import Config
 from speakwith.llm.base import BaseLLMClient
+from speakwith.metrics import get_metrics
 from speakwith.models import SharedState, Transcript
 
 
@@ -17,11 +18,21 @@ class ConversationMemory:
     - User response tracking
     """
 
-    def __init__(self, config: Config, llm: BaseLLMClient, state: SharedState):
+    def __init__(
+        self,
+        config: Config,
+        llm: BaseLLMClient,
+        state: SharedState,
+        on_summary: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_transcript: Optional[Callable[[Transcript], None]] = None,
+    ):
         self.config = config
         self.llm = llm
         self.state = state
+        self.on_summary = on_summary
+        self.on_transcript = on_transcript
         self._transcript_count = 0
+        self._summarized_seq = 0  # transcript_seq the current summary covers
         self._running = False
 
     async def add_transcript(self, transcript: Transcript) -> None:
@@ -31,6 +42,9 @@ class ConversationMemory:
 
         await self.state.add_transcript(transcript)
         self._transcript_count += 1
+        # Now carrying its seq; published before a summary update can delay it
+        if self.on_transcript:
+            self.on_transcript(transcript)
 
         # Update summary periodically
         if self._transcript_count % self.config.summary_update_interval == 0:
@@ -38,16 +52,23 @@ class ConversationMemory:
 
     async def _update_summary(self) -> None:
         """Update the conversation summary using LLM."""
-        transcripts = [t.text for t in self.state.transcripts]
+        snapshot = self.state.snapshot()
+        transcripts = [t.text for t in snapshot.transcripts]
         if not transcripts:
             return
 
+        metrics = get_metrics()
+        started = metrics.now()
         try:
             new_summary = await self.llm.generate_summary(
                 transcripts=transcripts,
-                previous_summary=self.state.summary,
+                previous_summary=snapshot.summary,
             )
+            metrics.observe("summary", started)
+            self._summarized_seq = snapshot.transcript_seq
             await self.state.set_summary(new_summary)
+            if self.on_summary:
+                await self.on_summary(new_summary)
         except Exception:
             # Don't fail the pipeline if summary update fails
             pass
@@ -66,7 +87,8 @@ class ConversationMemory:
         try:
             while self._running:
                 await asyncio.sleep(interval)
-                if self.state.transcripts:
+                # Nothing new since the last summary: skip the LLM call
+                if self.state.transcript_seq != self._summarized_seq:
                     await self._update_summary()
         except asyncio.CancelledError:
             pass
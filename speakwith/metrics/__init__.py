@@ -0,0 +1,26 @@
+"""Lightweight pipeline instrumentation."""
+
+from speakwith.metrics.export import MetricsExporter, to_prometheus
+from speakwith.metrics.histogram import Histogram
+from speakwith.metrics.registry import (
+    STAGES,
+    LoopLagMonitor,
+    Metrics,
+    NullMetrics,
+    get_metrics,
+    init_metrics,
+    set_metrics,
+)
+
+__all__ = [
+    "STAGES",
+    "Histogram",
+    "LoopLagMonitor",
+    "Metrics",
+    "MetricsExporter",
+    "NullMetrics",
+    "get_metrics",
+    "init_metrics",
+    "set_metrics",
+    "to_prometheus",
+]
@@ -0,0 +1,96 @@
+"""Prometheus text and JSON snapshot exporters."""
+
+import asyncio
+import json
+import math
+from pathlib import Path
+
+from speakwith.metrics.registry import Metrics
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+def to_prometheus(metrics: Metrics) -> str:
+    """Render metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP speakwith_stage_seconds Pipeline stage latency.",
+        "# TYPE speakwith_stage_seconds histogram",
+    ]
+    for name, histogram in metrics.histograms.items():
+        for bound, count in histogram.cumulative():
+            lines.append(
+                f'speakwith_stage_seconds_bucket{{stage="{name}",le="{_format_bound(bound)}"}} {count}'
+            )
+        lines.append(f'speakwith_stage_seconds_sum{{stage="{name}"}} {histogram.total}')
+        lines.append(f'speakwith_stage_seconds_count{{stage="{name}"}} {histogram.count}')
+
+    for name, value in metrics.gauges.items():
+        lines.append(f"# TYPE speakwith_{name} gauge")
+        lines.append(f"speakwith_{name} {value}")
+
+    for name, value in metrics.counters.items():
+        lines.append(f"# TYPE speakwith_{name}_total counter")
+        lines.append(f"speakwith_{name}_total {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+class MetricsExporter:
+    """Periodically writes metrics.prom and metrics.json to a directory.
+
+    The Prometheus file is suitable for node_exporter's textfile collector.
+    """
+
+    def __init__(self, metrics: Metrics, directory: Path, interval: float = 10.0):
+        self.metrics = metrics
+        self.directory = directory
+        self.interval = interval
+        self._running = False
+        self._last_version = -1
+
+    @property
+    def prometheus_path(self) -> Path:
+        return self.directory / "metrics.prom"
+
+    @property
+    def json_path(self) -> Path:
+        return self.directory / "metrics.json"
+
+    async def export(self) -> None:
+        """Write both files (rendered on the loop, written in an executor)."""
+        if self.metrics.version == self._last_version:
+            return
+        self._last_version = self.metrics.version
+        prom = to_prometheus(self.metrics)
+        snapshot = json.dumps(self.metrics.snapshot(), indent=2)
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, _write_atomic, self.prometheus_path, prom)
+        await loop.run_in_executor(None, _write_atomic, self.json_path, snapshot)
+
+    async def run(self) -> None:
+        """Background task exporting on an interval."""
+        self._running = True
+        try:
+            while self._running:
+                await asyncio.sleep(self.interval)
+                try:
+                    await self.export()
+                except OSError:
+                    pass
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Stop exporting."""
+        self._running = False
@@ -0,0 +1,83 @@
+"""Fixed-bucket latency histogram."""
+
+from array import array
+from bisect import bisect_left
+from typing import Sequence
+
+
+def exponential_bounds(start: float, factor: float, count: int) -> tuple[float, ...]:
+    """Bucket upper bounds growing geometrically from `start`."""
+    return tuple(start * factor ** i for i in range(count))
+
+
+# 0.5 ms .. ~67 s, doubling; covers render frames up to Whisper on slow CPUs
+DEFAULT_BOUNDS = exponential_bounds(0.0005, 2.0, 18)
+
+
+class Histogram:
+    """Histogram over preallocated arrays.
+
+    Bucket counts live in a fixed `array` sized at construction, so
+    recording an observation only bumps integers and floats in place.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        # One extra bucket for values above the last bound (+Inf)
+        self.counts = array("Q", bytes(8 * (len(self.bounds) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def reset(self) -> None:
+        """Clear all observations."""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean of all observations (0 if empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside its bucket."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, bucket in enumerate(self.counts):
+            if bucket and seen + bucket >= target:
+                low = self.bounds[i - 1] if i > 0 else 0.0
+                high = self.bounds[i] if i < len(self.bounds) else self.max
+                fraction = (target - seen) / bucket
+                estimate = low + (high - low) * fraction
+                return min(max(estimate, self.min), self.max)
+            seen += bucket
+        return self.max
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """(upper bound, cumulative count) pairs, ending with +Inf."""
+        pairs = []
+        running = 0
+        for i, bucket in enumerate(self.counts):
+            running += bucket
+            bound = self.bounds[i] if i < len(self.bounds) else float("inf")
+            pairs.append((bound, running))
+        return pairs
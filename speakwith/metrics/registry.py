@@ -0,0 +1,164 @@
+"""Pipeline metrics registry with a no-op variant for when it is disabled."""
+
+import asyncio
+import time
+from typing import Optional
+
+from speakwith.metrics.histogram import Histogram
+
+# Timed pipeline stages, in pipeline order
+STAGES = (
+    "capture",
+    "denoise",
+    "silence_gate",
+    "transcribe",
+    "filter",
+    "refine",
+    "summary",
+    "suggest",
+    "render",
+)
+
+# Sampled values (latest value wins)
+GAUGES = (
+    "audio_queue_depth",
+    "loop_lag_seconds",
+    "transcribe_rtf",
+    "quality_level",
+)
+
+
+class Metrics:
+    """Collects stage latencies, gauges and counters for the pipeline.
+
+    Usage in hot paths avoids allocating span objects:
+
+        started = metrics.now()
+        ...
+        metrics.observe("transcribe", started)
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {name: Histogram() for name in STAGES}
+        self.histograms["loop_lag"] = Histogram()
+        self.gauges: dict[str, float] = {name: 0.0 for name in GAUGES}
+        self.counters: dict[str, int] = {}
+        self.version = 0  # Bumped on every update, lets readers skip unchanged data
+
+    def now(self) -> float:
+        """Start timestamp for a span."""
+        return time.perf_counter()
+
+    def observe(self, stage: str, started: float) -> None:
+        """Record the time elapsed since `started` for a stage."""
+        self.observe_value(stage, time.perf_counter() - started)
+
+    def observe_value(self, name: str, seconds: float) -> None:
+        """Record a raw duration into a histogram."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(seconds)
+        self.version += 1
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Set a gauge to its latest value."""
+        self.gauges[name] = value
+        self.version += 1
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Increase a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+        self.version += 1
+
+    def snapshot(self) -> dict:
+        """JSON-serializable view of every metric."""
+        return {
+            "timestamp": time.time(),
+            "stages": {
+                name: {
+                    "count": h.count,
+                    "mean": h.mean,
+                    "p50": h.quantile(0.50),
+                    "p95": h.quantile(0.95),
+                    "p99": h.quantile(0.99),
+                    "max": h.max,
+                }
+                for name, h in self.histograms.items()
+            },
+            "gauges": dict(self.gauges),
+            "counters": dict(self.counters),
+        }
+
+
+class NullMetrics(Metrics):
+    """Disabled metrics: every call is a cheap no-op."""
+
+    enabled = False
+
+    def now(self) -> float:
+        return 0.0
+
+    def observe(self, stage: str, started: float) -> None:
+        pass
+
+    def observe_value(self, name: str, seconds: float) -> None:
+        pass
+
+    def set_gauge(self, name: str, value: float) -> None:
+        pass
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        pass
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag as the overshoot of a periodic sleep."""
+
+    def __init__(self, metrics: Metrics, interval: float = 0.25):
+        self.metrics = metrics
+        self.interval = interval
+        self._running = False
+
+    async def run(self) -> None:
+        """Background task sampling loop lag."""
+        self._running = True
+        loop = asyncio.get_running_loop()
+        try:
+            while self._running:
+                expected = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, loop.time() - expected)
+                self.metrics.observe_value("loop_lag", lag)
+                self.metrics.set_gauge("loop_lag_seconds", lag)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._running = False
+
+
+# Global metrics instance (disabled until init_metrics is called)
+_metrics: Metrics = NullMetrics()
+
+
+def get_metrics() -> Metrics:
+    """Get the global metrics registry."""
+    return _metrics
+
+
+def init_metrics(enabled: bool) -> Metrics:
+    """Initialize the global metrics registry."""
+    return set_metrics(Metrics() if enabled else NullMetrics())
+
+
+def set_metrics(metrics: Metrics) -> Metrics:
+    """Install a registry (e.g. a recording subclass in benchmarks)."""
+    global _metrics
+    _metrics = metrics
+    return _metrics
@@ -1,12 +1,13 @@
 """Shared data models used across all modules."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 import asyncio
 import time
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ConversationMode(Enum):
@@ -25,12 +26,46 @@ class PipelineStatus(Enum):
 
 @dataclass
 class AudioChunk:
-    """A chunk of recorded audio data."""
-    data: np.ndarray
+    """A chunk of recorded audio data.
+
+    `data` is mono int16 PCM, usually a view into a capture ring, a
+    memory-mapped file or a network buffer; float32 in [-1, 1] is also
+    accepted. Convert with `as_float32()` only where a model needs it.
+    """
+    data: "np.ndarray"
     sample_rate: int
     timestamp: float
     duration: float = 10.0
 
+    def as_float32(self) -> "np.ndarray":
+        """Samples as float32 in [-1, 1] (one pass for int16, no copy for float32)."""
+        import numpy as np
+
+        if self.data.dtype == np.float32:
+            return self.data
+        return np.multiply(self.data, np.float32(1.0 / 32768.0), dtype=np.float32)
+
+    @property
+    def rms(self) -> float:
+        """Root-mean-square level of the audio, on the [-1, 1] scale."""
+        import numpy as np
+
+        if not len(self.data):
+            return 0.0
+        scale = 32768.0 if self.data.dtype == np.int16 else 1.0
+        return float(np.sqrt(np.mean(np.square(self.data, dtype=np.float64)))) / scale
+
+
+@dataclass(frozen=True)
+class TranscriptSegment:
+    """One decoded segment with faster-whisper's confidence statistics."""
+    text: str
+    start: float  # Seconds from the start of the chunk
+    end: float
+    avg_logprob: float = 0.0
+    compression_ratio: float = 0.0
+    no_speech_prob: float = 0.0
+
 
 @dataclass
 class Transcript:
@@ -39,6 +74,24 @@ class Transcript:
     timestamp: float
     duration: float
 
+    # Decoder statistics (faster-whisper segments; neutral when unknown)
+    no_speech_prob: float = 0.0  # Highest over the segments
+    avg_logprob: float = 0.0  # Duration-weighted mean over the segments
+    compression_ratio: float = 0.0  # Highest over the segments
+    speech_end: Optional[float] = None  # Offset of the last decoded word within the chunk
+    language: Optional[str] = None  # Language decoded with (detected or requested)
+    language_probability: float = 0.0  # Detection confidence (1.0 when requested)
+
+    # How it was decoded: "greedy", "beam", "adaptive" (greedy plus beam
+    # re-decodes of weak segments) or "refined" (re-decoded in the background)
+    segments: tuple[TranscriptSegment, ...] = ()
+    decode_mode: str = ""
+    rtf: float = 0.0  # Decode time / audio duration
+    needs_refinement: bool = False  # Weak segments left for a background re-decode
+
+    # Position in the conversation, assigned by SharedState.add_transcript
+    seq: int = 0
+
     @property
     def is_empty(self) -> bool:
         """Check if transcript contains meaningful speech."""
@@ -69,6 +122,7 @@ class UserProfile:
     """User profile loaded from markdown files."""
     background: str
     mood_board: str
+    digest: str = ""  # Token-bounded condensed profile for prompts ("" = use the raw files)
 
     @classmethod
     def empty(cls) -> "UserProfile":
@@ -82,94 +136,253 @@ class ConversationContext:
     mode: ConversationMode
     profile: UserProfile
     summary: str
-    recent_transcripts: list[Transcript]
+    recent_transcripts: Sequence[Transcript]
     user_last_response: Optional[str]
+    language: Optional[str] = None  # Conversation language code, if known
 
 
-@dataclass
-class SharedState:
-    """Thread-safe shared state for the async pipeline.
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """One immutable version of the shared state.
 
-    All mutations should go through the provided methods to ensure
-    proper synchronization.
+    Readers take the current snapshot from `SharedState.snapshot()` and
+    can read any number of fields from it consistently, without locking
+    or copying. Every write publishes a new snapshot with a higher
+    `version`, so a consumer can skip work when the version is unchanged.
     """
-    # Configuration
+    version: int = 0
     mode: ConversationMode = ConversationMode.FRIENDLY
     profile: UserProfile = field(default_factory=UserProfile.empty)
 
     # Conversation state
-    transcripts: list[Transcript] = field(default_factory=list)
+    transcripts: tuple[Transcript, ...] = ()
+    transcript_seq: int = 0  # Sequence number of the latest transcript (never wraps)
     summary: str = ""
     suggestions: Suggestions = field(default_factory=Suggestions.default)
     user_response: Optional[str] = None
+    draft: Optional[str] = None  # Custom response being typed, if any
+    completions: tuple[str, ...] = ()  # Autocomplete candidates for the draft
+    language: Optional[str] = None  # Conversation language, once detected
 
     # Pipeline state
     status: PipelineStatus = PipelineStatus.IDLE
     start_time: float = field(default_factory=time.time)
 
-    # Synchronization
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
-    _state_changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    def transcripts_since(self, seq: int) -> list[Transcript]:
+        """Buffered transcripts newer than `seq` (older ones may have been dropped)."""
+        return [t for t in self.transcripts if t.seq > seq]
+
+    def get_context(self) -> ConversationContext:
+        """Conversation context for suggestion generation (shares the transcripts)."""
+        return ConversationContext(
+            mode=self.mode,
+            profile=self.profile,
+            summary=self.summary,
+            recent_transcripts=self.transcripts,
+            user_last_response=self.user_response,
+            language=self.language,
+        )
+
+    @property
+    def elapsed_time(self) -> float:
+        """Seconds since session started."""
+        return time.time() - self.start_time
+
+    @property
+    def elapsed_formatted(self) -> str:
+        """Elapsed time as MM:SS string."""
+        elapsed = int(self.elapsed_time)
+        minutes = elapsed // 60
+        seconds = elapsed % 60
+        return f"{minutes:02d}:{seconds:02d}"
+
+
+class SharedState:
+    """Copy-on-write shared state for the async pipeline.
+
+    The state is held as one immutable StateSnapshot. Writers publish a
+    new snapshot by swapping that single reference (no awaits happen in
+    between, so writes on the event loop never interleave); readers get
+    the current one in O(1) via `snapshot()`. The field properties below
+    read from the current snapshot and are kept for single-field reads.
+
+    All mutations should go through the provided methods.
+    """
+
+    def __init__(
+        self,
+        mode: ConversationMode = ConversationMode.FRIENDLY,
+        profile: Optional[UserProfile] = None,
+        max_transcripts: int = 3,
+    ):
+        self.max_transcripts = max_transcripts
+        self._snapshot = StateSnapshot(mode=mode, profile=profile or UserProfile.empty())
+        # Set (and replaced) on every publish; waiters hold the old event
+        self._changed = asyncio.Event()
+
+    def snapshot(self) -> StateSnapshot:
+        """The current state (immutable; safe to keep and read later)."""
+        return self._snapshot
 
-    # Configuration
-    max_transcripts: int = 3
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def _publish(self, **changes: Any) -> StateSnapshot:
+        """Swap in a new snapshot with `changes` and wake every waiter."""
+        current = self._snapshot
+        self._snapshot = snapshot = replace(current, version=current.version + 1, **changes)
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        return snapshot
 
     async def add_transcript(self, transcript: Transcript) -> None:
         """Add a transcript, maintaining circular buffer of last N."""
-        async with self._lock:
-            self.transcripts.append(transcript)
-            if len(self.transcripts) > self.max_transcripts:
-                self.transcripts = self.transcripts[-self.max_transcripts:]
-            self._state_changed.set()
+        current = self._snapshot
+        transcript.seq = current.transcript_seq + 1
+        transcripts = (current.transcripts + (transcript,))[-self.max_transcripts:]
+        self._publish(transcripts=transcripts, transcript_seq=transcript.seq)
+
+    async def replace_transcript(self, transcript: Transcript) -> bool:
+        """Swap in a refined version of a transcript with the same seq.
+
+        Returns:
+            False if the transcript already left the buffer.
+        """
+        transcripts = self._snapshot.transcripts
+        for i, existing in enumerate(transcripts):
+            if existing.seq == transcript.seq:
+                self._publish(transcripts=transcripts[:i] + (transcript,) + transcripts[i + 1:])
+                return True
+        return False
 
     async def set_suggestions(self, suggestions: Suggestions) -> None:
         """Update current suggestions."""
-        async with self._lock:
-            self.suggestions = suggestions
-            self._state_changed.set()
+        self._publish(suggestions=suggestions)
 
     async def set_user_response(self, response: str) -> None:
         """Record user's selected/typed response."""
-        async with self._lock:
-            self.user_response = response
-            self._state_changed.set()
+        self._publish(user_response=response)
+
+    async def set_draft(self, draft: Optional[str], completions: tuple[str, ...] = ()) -> None:
+        """Update the custom response being typed (None when not editing)."""
+        self._publish(draft=draft, completions=completions)
+
+    async def set_profile(self, profile: UserProfile) -> None:
+        """Replace the user profile (after the files were edited)."""
+        self._publish(profile=profile)
+
+    async def set_language(self, language: Optional[str]) -> None:
+        """Record the detected conversation language."""
+        self._publish(language=language)
+
+    async def set_mode(self, mode: ConversationMode) -> None:
+        """Switch the conversation mode."""
+        self._publish(mode=mode)
 
     async def set_summary(self, summary: str) -> None:
         """Update conversation summary."""
-        async with self._lock:
-            self.summary = summary
-            self._state_changed.set()
+        self._publish(summary=summary)
 
     async def set_status(self, status: PipelineStatus) -> None:
         """Update pipeline status."""
-        async with self._lock:
-            self.status = status
-            self._state_changed.set()
-
-    async def wait_for_change(self) -> None:
-        """Wait for any state change."""
-        await self._state_changed.wait()
-        self._state_changed.clear()
+        if status is not self._snapshot.status:
+            self._publish(status=status)
+
+    async def wait_for_change(self, after_version: Optional[int] = None) -> StateSnapshot:
+        """Wait for a snapshot newer than `after_version`.
+
+        Passing the version last handled means no change is ever missed,
+        however many writes happen in between. Defaults to the current
+        version (wait for the next write).
+        """
+        if after_version is None:
+            after_version = self._snapshot.version
+        while self._snapshot.version <= after_version:
+            await self._changed.wait()
+        return self._snapshot
+
+    async def wait_for_transcript(self, after_seq: int, timeout: Optional[float] = None) -> bool:
+        """Wait until a transcript newer than `after_seq` is added.
+
+        Returns:
+            False if the timeout expired first.
+        """
+
+        async def _wait() -> None:
+            while self._snapshot.transcript_seq <= after_seq:
+                await self._changed.wait()
+
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def transcripts_since(self, seq: int) -> list[Transcript]:
+        """Buffered transcripts newer than `seq` (older ones may have been dropped)."""
+        return self._snapshot.transcripts_since(seq)
 
     def get_context(self) -> ConversationContext:
         """Get current conversation context for suggestion generation."""
-        return ConversationContext(
-            mode=self.mode,
-            profile=self.profile,
-            summary=self.summary,
-            recent_transcripts=list(self.transcripts),
-            user_last_response=self.user_response,
-        )
+        return self._snapshot.get_context()
+
+    # Single-field reads of the current snapshot
+
+    @property
+    def mode(self) -> ConversationMode:
+        return self._snapshot.mode
+
+    @property
+    def profile(self) -> UserProfile:
+        return self._snapshot.profile
+
+    @property
+    def transcripts(self) -> tuple[Transcript, ...]:
+        return self._snapshot.transcripts
+
+    @property
+    def transcript_seq(self) -> int:
+        return self._snapshot.transcript_seq
+
+    @property
+    def summary(self) -> str:
+        return self._snapshot.summary
+
+    @property
+    def suggestions(self) -> Suggestions:
+        return self._snapshot.suggestions
+
+    @property
+    def user_response(self) -> Optional[str]:
+        return self._snapshot.user_response
+
+    @property
+    def draft(self) -> Optional[str]:
+        return self._snapshot.draft
+
+    @property
+    def completions(self) -> tuple[str, ...]:
+        return self._snapshot.completions
+
+    @property
+    def language(self) -> Optional[str]:
+        return self._snapshot.language
+
+    @property
+    def status(self) -> PipelineStatus:
+        return self._snapshot.status
+
+    @property
+    def start_time(self) -> float:
+        return self._snapshot.start_time
 
     @property
     def elapsed_time(self) -> float:
         """Seconds since session started."""
-        return time.time() - self.start_time
+        return self._snapshot.elapsed_time
 
     @property
     def elapsed_formatted(self) -> str:
         """Elapsed time as MM:SS string."""
-        elapsed = int(self.elapsed_time)
-        minutes = elapsed // 60
-        seconds = elapsed % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        return self._snapshot.elapsed_formatted
@@ -1,5 +1,13 @@
 """Conversation mode definitions."""
 
-from speakwith.modes.conversation_modes import ModeConfig, get_mode_config
+from speakwith._lazy import lazy_exports
 
-__all__ = ["ModeConfig", "get_mode_config"]
+__all__ = ["ModeConfig", "PerformanceProfile", "get_mode_config", "list_modes", "resolve_config"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ModeConfig": "speakwith.modes.conversation_modes",
+    "get_mode_config": "speakwith.modes.conversation_modes",
+    "list_modes": "speakwith.modes.conversation_modes",
+    "PerformanceProfile": "speakwith.modes.performance",
+    "resolve_config": "speakwith.modes.conversation_modes",
+})
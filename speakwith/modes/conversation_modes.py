@@ -1,8 +1,10 @@
 """Conversation mode definitions and configurations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from speakwith.config import Config
 from speakwith.models import ConversationMode
+from speakwith.modes.performance import PerformanceProfile
 
 
 @dataclass
@@ -14,6 +16,8 @@ class ModeConfig:
     description: str
     reaction_style: str
     followup_style: str
+    phrases: tuple[str, ...] = field(default_factory=tuple)  # Seeds autocomplete
+    performance: PerformanceProfile = field(default_factory=PerformanceProfile)
 
 
 # Mode configurations
@@ -24,6 +28,25 @@ MODES: dict[ConversationMode, ModeConfig] = {
         description="Casual conversation with friends, family, or acquaintances",
         reaction_style="emotional, expressive, warm",
         followup_style="questions, sharing personal thoughts, showing empathy",
+        phrases=(
+            "I'm doing well, thanks for asking!",
+            "How have you been?",
+            "That sounds great!",
+            "I'd love to hear more about that.",
+            "What have you been up to lately?",
+            "It's really good to see you.",
+            "I agree with you.",
+            "Let's do that sometime.",
+        ),
+        # Longer turns: favour accuracy and wait for the speaker to finish
+        performance=PerformanceProfile(
+            chunk_duration=10.0,
+            beam_size=5,
+            llm_max_tokens=300,
+            trigger_threshold=0.55,
+            trigger_debounce=0.8,
+            trigger_max_staleness=8.0,
+        ),
     ),
     ConversationMode.SHOPPING: ModeConfig(
         mode=ConversationMode.SHOPPING,
@@ -31,6 +54,25 @@ MODES: dict[ConversationMode, ModeConfig] = {
         description="Transactional conversations in stores, restaurants, or services",
         reaction_style="confirmations, clarifications, practical responses",
         followup_style="product questions, price inquiries, decision-making",
+        phrases=(
+            "How much does this cost?",
+            "Do you have this in a different size?",
+            "I would like to pay by card.",
+            "Can I have a receipt, please?",
+            "I'm just looking, thank you.",
+            "Where can I find this?",
+            "I'll take it.",
+            "Could you recommend something?",
+        ),
+        # Short exchanges: smaller chunks, greedy decoding, quick replies
+        performance=PerformanceProfile(
+            chunk_duration=5.0,
+            beam_size=1,
+            llm_max_tokens=150,
+            trigger_threshold=0.45,
+            trigger_debounce=0.3,
+            trigger_max_staleness=4.0,
+        ),
     ),
 }
 
@@ -40,6 +82,16 @@ def get_mode_config(mode: ConversationMode) -> ModeConfig:
     return MODES[mode]
 
 
+def resolve_config(config: Config, mode: ConversationMode) -> Config:
+    """Config with the mode's performance profile applied (if enabled).
+
+    Settings given explicitly in the environment win over the profile.
+    """
+    if not config.mode_profiles:
+        return config
+    return MODES[mode].performance.apply(config, keep=config.explicit)
+
+
 def list_modes() -> list[ModeConfig]:
     """List all available conversation modes."""
     return list(MODES.values())
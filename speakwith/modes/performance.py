@@ -0,0 +1,44 @@
+"""Per-mode performance profiles (speed vs. accuracy settings)."""
+
+from dataclasses import dataclass, fields, replace
+from typing import Iterable, Optional
+
+from speakwith.config import Config
+
+
+@dataclass(frozen=True)
+class PerformanceProfile:
+    """Overrides of the speed/accuracy settings in Config.
+
+    Each field matches a Config field; None keeps the configured value.
+    """
+
+    # Chunking and endpointing
+    chunk_duration: Optional[float] = None
+    silence_threshold: Optional[float] = None
+
+    # Transcription
+    whisper_model: Optional[str] = None
+    beam_size: Optional[int] = None
+    decode_mode: Optional[str] = None
+    refine_in_background: Optional[bool] = None
+
+    # Suggestions
+    llm_model: Optional[str] = None
+    llm_max_tokens: Optional[int] = None
+    trigger_threshold: Optional[float] = None
+    trigger_debounce: Optional[float] = None
+    trigger_max_staleness: Optional[float] = None
+
+    def apply(self, config: Config, keep: Iterable[str] = ()) -> Config:
+        """Return a copy of `config` with this profile's overrides.
+
+        Fields named in `keep` are left as configured.
+        """
+        keep = frozenset(keep)
+        overrides = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None and f.name not in keep
+        }
+        return replace(config, **overrides) if overrides else config
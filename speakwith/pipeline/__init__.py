@@ -1,5 +1,12 @@
 """Pipeline orchestration."""
 
-from speakwith.pipeline.coordinator import PipelineCoordinator
+from speakwith._lazy import lazy_exports
 
-__all__ = ["PipelineCoordinator"]
+__all__ = ["PipelineCoordinator", "QualityController", "QualityRung", "quality_ladder"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "PipelineCoordinator": "speakwith.pipeline.coordinator",
+    "QualityController": "speakwith.pipeline.controller",
+    "QualityRung": "speakwith.pipeline.controller",
+    "quality_ladder": "speakwith.pipeline.controller",
+})
@@ -0,0 +1,307 @@
+"""Quality ladder controller that holds a latency target under CPU pressure."""
+
+import asyncio
+import json
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from speakwith.config import Config
+from speakwith.metrics import get_metrics
+from speakwith.modes.performance import PerformanceProfile
+
+# Whisper sizes, smallest first (".en" and large-v2/v3 variants map onto these)
+MODEL_SIZES = ("tiny", "base", "small", "medium", "large")
+
+# RMS below which the cheapest rung skips chunks (about -46 dBFS)
+MIN_SILENCE_THRESHOLD = 0.005
+
+
+def smaller_model(name: str, steps: int = 1) -> str:
+    """The Whisper model `steps` sizes below `name` (unknown names are kept)."""
+    base, _, suffix = name.partition(".")
+    size = base.split("-")[0]
+    if size not in MODEL_SIZES:
+        return name
+    smaller = MODEL_SIZES[max(MODEL_SIZES.index(size) - steps, 0)]
+    if smaller == size:
+        return name
+    # English-only variants exist up to medium
+    return f"{smaller}.en" if suffix == "en" else smaller
+
+
+@dataclass(frozen=True)
+class QualityRung:
+    """One step of the quality ladder."""
+
+    name: str
+    profile: PerformanceProfile
+
+
+def quality_ladder(config: Config) -> list[QualityRung]:
+    """Rungs from the configured quality down to the cheapest settings.
+
+    `config` is the mode-resolved config; each rung keeps the savings of
+    the rungs above it.
+    """
+    greedy = {"decode_mode": "greedy", "beam_size": 1, "refine_in_background": False}
+    return [
+        QualityRung("full", PerformanceProfile()),
+        # No beam search, re-decodes of weak segments or background refinement
+        QualityRung("greedy", PerformanceProfile(**greedy)),
+        QualityRung(
+            "smaller_model",
+            PerformanceProfile(whisper_model=smaller_model(config.whisper_model), **greedy),
+        ),
+        # Smallest model, and quiet chunks are skipped instead of decoded.
+        # Chunk length stays: the latency measured ends at the transcript,
+        # and longer chunks would only move the wait before it
+        QualityRung(
+            "minimal",
+            PerformanceProfile(
+                whisper_model=smaller_model(config.whisper_model, len(MODEL_SIZES)),
+                silence_threshold=max(config.silence_threshold, MIN_SILENCE_THRESHOLD),
+                **greedy,
+            ),
+        ),
+    ]
+
+
+@dataclass
+class QualityTransition:
+    """A step on the ladder and the measurements that caused it."""
+
+    timestamp: float  # wall clock
+    from_level: int
+    to_level: int
+    rung: str
+    reason: str
+    latency: float
+    rtf: float
+    queue_depth: int
+    loop_lag: float
+
+    def format(self) -> str:
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.timestamp))
+        direction = "down" if self.to_level > self.from_level else "up"
+        return f"[{stamp}] quality {direction} to {self.rung} ({self.reason})"
+
+
+class QualityController:
+    """Steps the pipeline down and up a quality ladder to hold a latency target.
+
+    Signals, checked every `interval` seconds:
+        - transcription latency (end of a chunk's audio to its transcript;
+          suggestion generation and rendering are not included)
+          and transcription real-time factor, over the last few chunks;
+        - depth of the transcription queue;
+        - event-loop lag (overshoot of the controller's own sleep).
+
+    Any sign of pressure (latency over target, RTF of 1 or more, a
+    backed-up queue, a lagging loop) steps one rung down, then measurements
+    start over and the next step waits at least `settle` seconds. A step
+    back up needs latency and RTF within `headroom` of their limits for
+    `recover` seconds; that wait doubles whenever an upgrade is undone
+    within it, so a machine at the edge does not flap between rungs.
+
+    Args:
+        apply: Coroutine switching the pipeline to a ladder level.
+        rungs: Names of the ladder levels, best first.
+        target_latency: Seconds from the end of a chunk's audio to its
+            transcript to hold.
+        queue_depth: Returns the number of chunks waiting for transcription.
+        log_path: File every transition is appended to (JSON lines).
+    """
+
+    WINDOW = 4  # Chunks the latency and RTF signals average over
+    MAX_QUEUE = 1  # Waiting chunks tolerated
+    MAX_LOOP_LAG = 0.1
+    MAX_RECOVER = 600.0
+
+    def __init__(
+        self,
+        apply: Callable[[int], Awaitable[None]],
+        rungs: list[str],
+        target_latency: float,
+        queue_depth: Callable[[], int],
+        interval: float = 1.0,
+        settle: float = 5.0,
+        recover: float = 30.0,
+        headroom: float = 0.5,
+        log_path: Optional[Path] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.apply = apply
+        self.rungs = rungs
+        self.target_latency = target_latency
+        self.queue_depth = queue_depth
+        self.interval = interval
+        self.settle = settle
+        self.recover = recover
+        self.headroom = headroom
+        self.log_path = log_path
+        self.clock = clock
+
+        self.level = 0
+        self.transitions: deque[QualityTransition] = deque(maxlen=100)
+        self._latency: deque[float] = deque(maxlen=self.WINDOW)
+        self._rtf: deque[float] = deque(maxlen=self.WINDOW)
+        self._loop_lag = 0.0
+        self._changed_at = clock()
+        self._healthy_since: Optional[float] = None
+        self._upgraded_at: Optional[float] = None
+        self._running = False
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Config,
+        apply: Callable[[int], Awaitable[None]],
+        queue_depth: Callable[[], int],
+    ) -> Optional["QualityController"]:
+        """A controller over `quality_ladder`, or None when disabled."""
+        if not config.quality_control:
+            return None
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return cls(
+            apply,
+            [rung.name for rung in quality_ladder(config)],
+            config.target_latency,
+            queue_depth,
+            log_path=config.user_data_dir / "quality" / f"transitions-{stamp}.jsonl",
+        )
+
+    @property
+    def rung(self) -> str:
+        return self.rungs[self.level]
+
+    def observe(self, latency: float, rtf: float) -> None:
+        """Record one transcribed chunk (latency from the end of its audio)."""
+        self._latency.append(max(latency, 0.0))
+        if rtf > 0:
+            self._rtf.append(rtf)
+
+    def _signals(self) -> tuple[float, float, int]:
+        latency = sum(self._latency) / len(self._latency) if self._latency else 0.0
+        rtf = sum(self._rtf) / len(self._rtf) if self._rtf else 0.0
+        return latency, rtf, self.queue_depth()
+
+    def decide(self) -> Optional[tuple[int, str]]:
+        """The level to switch to and why, or None to stay."""
+        now = self.clock()
+        latency, rtf, depth = self._signals()
+
+        pressure = []
+        if latency > self.target_latency:
+            pressure.append(f"latency {latency:.2f}s > {self.target_latency:.2f}s")
+        if rtf >= 1.0:
+            pressure.append(f"rtf {rtf:.2f}")
+        if depth > self.MAX_QUEUE:
+            pressure.append(f"queue depth {depth}")
+        if self._loop_lag > self.MAX_LOOP_LAG:
+            pressure.append(f"loop lag {self._loop_lag * 1000:.0f} ms")
+        if pressure:
+            self._healthy_since = None
+            if self.level < len(self.rungs) - 1 and now - self._changed_at >= self.settle:
+                return self.level + 1, ", ".join(pressure)
+            return None
+
+        healthy = (
+            bool(self._latency)
+            and latency <= self.headroom * self.target_latency
+            and rtf <= self.headroom
+            and self._loop_lag <= self.headroom * self.MAX_LOOP_LAG
+        )
+        if not healthy:
+            self._healthy_since = None
+            return None
+        if self._healthy_since is None:
+            self._healthy_since = now
+        if self.level > 0 and now - self._healthy_since >= self.recover:
+            return self.level - 1, f"headroom: latency {latency:.2f}s, rtf {rtf:.2f}"
+        return None
+
+    async def set_level(self, level: int, reason: str) -> QualityTransition:
+        """Switch to a ladder level now, logging the transition."""
+        latency, rtf, depth = self._signals()
+        transition = QualityTransition(
+            timestamp=time.time(),
+            from_level=self.level,
+            to_level=level,
+            rung=self.rungs[level],
+            reason=reason,
+            latency=latency,
+            rtf=rtf,
+            queue_depth=depth,
+            loop_lag=self._loop_lag,
+        )
+        now = self.clock()
+        if level > self.level and self._upgraded_at is not None and now - self._upgraded_at < self.recover:
+            self.recover = min(self.recover * 2, self.MAX_RECOVER)
+        if level < self.level:
+            self._upgraded_at = now
+
+        self.level = level
+        self._changed_at = now
+        self._healthy_since = None
+        # Measurements from the old rung say nothing about the new one
+        self._latency.clear()
+        self._rtf.clear()
+        self.transitions.append(transition)
+
+        metrics = get_metrics()
+        metrics.incr("quality_down" if level > transition.from_level else "quality_up")
+        metrics.set_gauge("quality_level", level)
+        try:
+            await self.apply(level)
+        except Exception:
+            metrics.incr("quality_errors")
+        if self.log_path is not None:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._log, transition)
+            except OSError:
+                pass
+        return transition
+
+    def _log(self, transition: QualityTransition) -> None:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(transition)) + "\n")
+
+    async def run(self) -> None:
+        """Background task sampling loop lag and stepping the ladder."""
+        self._running = True
+        loop = asyncio.get_running_loop()
+        try:
+            while self._running:
+                expected = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, loop.time() - expected)
+                # Follow spikes at once, let them decay over a few samples
+                self._loop_lag = max(lag, 0.5 * self._loop_lag)
+                decision = self.decide()
+                if decision is not None:
+                    await self.set_level(*decision)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Stop controlling (the current level stays applied)."""
+        self._running = False
+
+    def stats(self) -> dict:
+        latency, rtf, depth = self._signals()
+        return {
+            "level": self.level,
+            "rung": self.rung,
+            "latency": latency,
+            "rtf": rtf,
+            "queue_depth": depth,
+            "loop_lag": self._loop_lag,
+            "recover_seconds": self.recover,
+            "transitions": len(self.transitions),
+        }
@@ -3,14 +3,17 @@
 import asyncio
 from typing import Optional
 
-from speakwith.audio import AudioRecorder
+from speakwith.audio import AudioRecorder, ProcessAudioRecorder
+from speakwith.autocomplete import HISTORY_FILENAME, PredictiveText, strip_markdown, write_history
 from speakwith.cli import Display, InputHandler
 from speakwith.config import Config
-from speakwith.llm import OpenAIClient
-from speakwith.memory import ConversationMemory
-from speakwith.models import ConversationMode, PipelineStatus, SharedState
-from speakwith.profiles import ProfileLoader
-from speakwith.suggestions import SuggestionGenerator
+from speakwith.diagnostics import Diagnostics
+from speakwith.live_config import LiveConfig
+from speakwith.llm import create_client
+from speakwith.metrics import LoopLagMonitor, MetricsExporter, init_metrics
+from speakwith.models import ConversationMode
+from speakwith.modes import get_mode_config
+from speakwith.session import Session
 from speakwith.transcription import WhisperClient
 
 
@@ -18,12 +21,12 @@ class PipelineCoordinator:
     """Orchestrates all async tasks in the SpeakWith pipeline.
 
     Manages:
-    - Audio recording (10-second batches)
-    - Transcription (Whisper)
-    - Suggestion generation (LLM)
-    - Memory/summary updates
+    - A headless Session (recording, transcription, suggestions, memory)
     - Display rendering
     - User input handling
+    - Metrics export
+    - Diagnostics (loop stall watchdog and stack sampler)
+    - Live reload of .env edits
 
     All tasks run concurrently in the async event loop.
     """
@@ -32,21 +35,61 @@ class PipelineCoordinator:
         self.config = config
         self.mode = mode
 
-        # Initialize shared state
-        self.state = SharedState(mode=mode)
-
-        # Load user profile
-        profile_loader = ProfileLoader(config)
-        self.state.profile = profile_loader.load()
-
-        # Initialize components
-        self.recorder = AudioRecorder(config)
-        self.transcriber = WhisperClient(config)
-        self.llm = OpenAIClient(config)
-        self.memory = ConversationMemory(config, self.llm, self.state)
-        self.suggestion_gen = SuggestionGenerator(config, self.llm, self.state)
-        self.display = Display(self.state)
-        self.input_handler = InputHandler(self.state, self._on_user_response)
+        # Instrumentation (no-op unless enabled)
+        self.metrics = init_metrics(config.metrics_enabled)
+
+        # Core pipeline, driven by the microphone
+        recorder = ProcessAudioRecorder(config) if config.capture_process else AudioRecorder(config)
+        self.session = Session(
+            config,
+            mode,
+            audio_source=recorder,
+            transcriber=WhisperClient(config),
+            llm=create_client(config),
+        )
+        self.state = self.session.state
+        self.recorder = self.session.audio_source
+        self.transcriber = self.session.transcriber
+        self.llm = self.session.llm
+        self.memory = self.session.memory
+        self.suggestion_gen = self.session.suggestion_gen
+
+        # Predictive text: persisted history plus this session's seeds
+        self.predictor_path = config.user_data_dir / HISTORY_FILENAME
+        self.predictor = PredictiveText.load(self.predictor_path)
+        self.predictor.seed(strip_markdown(self.state.profile.background))
+        self.predictor.seed_phrases(get_mode_config(mode).phrases)
+
+        # Terminal UI
+        self.display = Display(
+            self.state,
+            max_fps=config.display_max_fps,
+            metrics=self.metrics if config.debug_panel else None,
+        )
+        self.input_handler = InputHandler(
+            self.state, self._on_user_response, predictor=self.predictor
+        )
+
+        self.loop_monitor = LoopLagMonitor(self.metrics)
+        self.exporter = MetricsExporter(
+            self.metrics,
+            config.user_data_dir / "metrics",
+            interval=config.metrics_export_interval,
+        )
+
+        self.diagnostics: Optional[Diagnostics] = None
+        if config.diagnostics:
+            self.diagnostics = Diagnostics(
+                config.user_data_dir / "diagnostics",
+                stall_threshold=config.stall_threshold_ms / 1000.0,
+                sample_interval=config.profile_sample_ms / 1000.0,
+            )
+
+        # .env edits reach the session and display without a restart
+        self.live_config = LiveConfig.from_config(config, resolve=self.session.effective_config)
+        if self.live_config is not None:
+            self.live_config.subscribe(Session.LIVE_KEYS, self.session.reconfigure)
+            self.live_config.subscribe(("display_max_fps",), self._reconfigure_display)
 
         # Task handles
         self._tasks: list[asyncio.Task] = []
@@ -54,51 +97,51 @@ class PipelineCoordinator:
 
     async def _on_user_response(self, response: str) -> None:
         """Handle user response selection."""
-        # Trigger new suggestions after user response
+        # Persist what the predictor learned without blocking the loop
         try:
-            suggestions = await self.suggestion_gen.generate()
-            await self.state.set_suggestions(suggestions)
-        except Exception:
+            loop = asyncio.get_event_loop()
+            data = self.predictor.to_bytes()
+            await loop.run_in_executor(None, write_history, self.predictor_path, data)
+        except OSError:
             pass
 
-    async def _recording_task(self) -> None:
-        """Task that records audio and queues it for transcription."""
-        try:
-            async for chunk in self.recorder.stream():
-                if not self._running:
-                    break
-
-                await self.state.set_status(PipelineStatus.RECORDING)
-
-                # Transcribe the chunk
-                await self.state.set_status(PipelineStatus.TRANSCRIBING)
-                transcript = await self.transcriber.transcribe(chunk)
-
-                # Add to memory (handles summary updates)
-                await self.memory.add_transcript(transcript)
+        # Trigger new suggestions after user response
+        await self.session.refresh_suggestions()
 
-                await self.state.set_status(PipelineStatus.IDLE)
+    def _reconfigure_display(self, config: Config) -> None:
+        self.display.max_fps = config.display_max_fps
 
-        except asyncio.CancelledError:
-            pass
+    async def set_mode(self, mode: ConversationMode) -> None:
+        """Switch conversation mode (and its performance profile) live."""
+        self.mode = mode
+        self.predictor.seed_phrases(get_mode_config(mode).phrases)
+        await self.session.set_mode(mode)
 
     async def initialize(self) -> None:
         """Initialize components (load models, etc.)."""
         # Pre-load Whisper model
-        await self.transcriber.initialize()
+        await self.session.initialize()
 
     async def run(self) -> None:
         """Start all pipeline tasks and run until stopped."""
         self._running = True
 
+        if self.diagnostics:
+            self.diagnostics.start()
+
         # Create tasks
         self._tasks = [
-            asyncio.create_task(self._recording_task(), name="recording"),
-            asyncio.create_task(self.suggestion_gen.run(), name="suggestions"),
+            asyncio.create_task(self.session.run(), name="session"),
             asyncio.create_task(self.display.run(), name="display"),
             asyncio.create_task(self.input_handler.run(), name="input"),
-            asyncio.create_task(self.memory.run_summary_task(), name="summary"),
         ]
+        if self.live_config is not None:
+            self._tasks.append(asyncio.create_task(self.live_config.run(), name="live_config"))
+        if self.metrics.enabled:
+            self._tasks += [
+                asyncio.create_task(self.loop_monitor.run(), name="loop_lag"),
+                asyncio.create_task(self.exporter.run(), name="metrics_export"),
+            ]
 
         try:
             # Wait for all tasks (or until one fails/is cancelled)
@@ -113,11 +156,13 @@ class PipelineCoordinator:
         self._running = False
 
         # Stop components
-        self.recorder.stop()
-        self.suggestion_gen.stop()
+        await self.session.stop()
         self.display.stop()
         self.input_handler.stop()
-        self.memory.stop()
+        self.loop_monitor.stop()
+        self.exporter.stop()
+        if self.live_config is not None:
+            self.live_config.stop()
 
         # Cancel all tasks
         for task in self._tasks:
@@ -129,3 +174,13 @@ class PipelineCoordinator:
             await asyncio.gather(*self._tasks, return_exceptions=True)
 
         self._tasks = []
+
+        if self.diagnostics:
+            self.diagnostics.stop()
+
+        # Leave a final snapshot behind
+        if self.metrics.enabled:
+            try:
+                await self.exporter.export()
+            except OSError:
+                pass
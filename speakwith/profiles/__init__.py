@@ -1,5 +1,11 @@
 """User profile management."""
 
-from speakwith.profiles.loader import ProfileLoader
+from speakwith._lazy import lazy_exports
 
-__all__ = ["ProfileLoader"]
+__all__ = ["ProfileCompiler", "ProfileLoader", "extract_digest"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ProfileCompiler": "speakwith.profiles.compiler",
+    "extract_digest": "speakwith.profiles.compiler",
+    "ProfileLoader": "speakwith.profiles.loader",
+})
@@ -0,0 +1,226 @@
+"""Compiles the user profile into a small digest and reloads it on edits."""
+
+import asyncio
+import hashlib
+import math
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from speakwith.config import Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.models import SharedState, UserProfile
+from speakwith.profiles.loader import ProfileLoader
+
+PROFILE_FILES = ("background.md", "mood_board.md")
+
+# Bump when the digest format changes so stale cache entries are ignored
+DIGEST_VERSION = 1
+
+# Whole-value template placeholders such as "(Your name)" or "- (Topic 1)"
+_PLACEHOLDER_RE = re.compile(r"^\([^)]*\)$")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English)."""
+    return math.ceil(len(text) / 4)
+
+
+@dataclass
+class _Item:
+    section: str
+    text: str
+    priority: int  # Lower is kept first
+    order: int
+
+
+def _items(markdown: str, priority: int, start: int) -> list[_Item]:
+    """Split markdown into (section, statement) items, dropping placeholders."""
+    items = []
+    section = ""
+    for line in markdown.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            section = line.lstrip("#").strip()
+            continue
+        line = line.lstrip("-*> ").strip()
+        _, sep, value = line.partition(":")
+        if sep and _PLACEHOLDER_RE.match(value.strip()):
+            continue
+        if not line or _PLACEHOLDER_RE.match(line):
+            continue
+        items.append(_Item(section, line, priority, start + len(items)))
+    return items
+
+
+def _truncate(text: str, tokens: int) -> str:
+    limit = tokens * 4
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 1].rsplit(" ", 1)[0]
+    return cut + "…"
+
+
+def extract_digest(profile: UserProfile, max_tokens: int) -> str:
+    """Condense the profile to at most `max_tokens` by extraction.
+
+    Today's mood board is kept first, then the background in file order.
+    Template placeholders are dropped. Items are grouped under their
+    section headings in the output.
+    """
+    mood = _items(profile.mood_board, 0, 0)
+    background = _items(profile.background, 1, len(mood))
+
+    kept: list[_Item] = []
+    used = 0
+    for item in sorted(mood + background, key=lambda i: (i.priority, i.order)):
+        cost = estimate_tokens(item.text) + 2
+        remaining = max_tokens - used
+        if cost > remaining:
+            if remaining < 8:
+                break
+            item = _Item(item.section, _truncate(item.text, remaining - 2), item.priority, item.order)
+            cost = remaining
+        kept.append(item)
+        used += cost
+
+    lines: list[str] = []
+    for label, priority in (("Background", 1), ("Today", 0)):
+        part = sorted((i for i in kept if i.priority == priority), key=lambda i: i.order)
+        if not part:
+            continue
+        lines.append(f"{label}:")
+        section = None
+        for item in part:
+            if item.section != section:
+                section = item.section
+                lines.append(f"- {section}: {item.text}" if section else f"- {item.text}")
+            else:
+                lines[-1] += f"; {item.text}"
+    return "\n".join(lines) or "(No profile details provided)"
+
+
+class ProfileCompiler:
+    """Keeps a token-bounded digest of the profile files up to date.
+
+    The digest is built once per distinct content (extractive, or LLM
+    summarized when `summarize` is set) and cached on disk under
+    `user_data/.cache/profile`, keyed by a hash of the files. `run()`
+    polls the files' mtimes and publishes edits to the shared state,
+    so changes to `mood_board.md` apply without a restart.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        llm: Optional[BaseLLMClient] = None,
+        on_change: Optional[Callable[[UserProfile], Awaitable[None]]] = None,
+    ):
+        self.loader = ProfileLoader(config)
+        self.user_data_dir = config.user_data_dir
+        self.cache_dir = config.user_data_dir / ".cache" / "profile"
+        self.max_tokens = config.profile_digest_tokens
+        self.summarize = config.profile_summarize and llm is not None
+        self.poll_interval = config.profile_poll_interval
+        self.llm = llm
+        self.on_change = on_change
+        self._mtimes: tuple[int, ...] = ()
+        self._running = False
+
+    def _stat(self) -> tuple[int, ...]:
+        mtimes = []
+        for name in PROFILE_FILES:
+            try:
+                mtimes.append((self.user_data_dir / name).stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(0)
+        return tuple(mtimes)
+
+    def _cache_key(self, profile: UserProfile) -> str:
+        method = "llm" if self.summarize else "extract"
+        h = hashlib.sha256()
+        for part in (str(DIGEST_VERSION), method, str(self.max_tokens), profile.background, profile.mood_board):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _read_cached(self, key: str) -> Optional[str]:
+        try:
+            return (self.cache_dir / f"{key}.txt").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_cached(self, key: str, digest: str) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_dir / f"{key}.tmp"
+            tmp.write_text(digest, encoding="utf-8")
+            tmp.replace(self.cache_dir / f"{key}.txt")
+        except OSError:
+            pass
+
+    async def _summarize(self, profile: UserProfile) -> Optional[str]:
+        system = (
+            "You condense a person's profile into short factual notes that help "
+            "suggest what they might say in conversation. Keep names, preferences, "
+            "topics to discuss or avoid, and today's mood. No commentary."
+        )
+        prompt = (
+            f"Condense this profile into at most {self.max_tokens * 3 // 4} words, "
+            f"as short bullet points.\n\nBACKGROUND:\n{profile.background}\n\n"
+            f"TODAY'S MOOD:\n{profile.mood_board}"
+        )
+        try:
+            text = (await self.llm.generate(prompt, system)).strip()
+        except Exception:
+            return None
+        return _truncate(text, self.max_tokens) if text else None
+
+    async def compile(self, profile: UserProfile) -> UserProfile:
+        """Return the profile with its digest filled in (cached by content)."""
+        if self.max_tokens <= 0:
+            return profile
+        loop = asyncio.get_event_loop()
+        key = self._cache_key(profile)
+        digest = await loop.run_in_executor(None, self._read_cached, key)
+        if digest is None:
+            digest = await self._summarize(profile) if self.summarize else None
+            if digest is not None or not self.summarize:
+                digest = digest or extract_digest(profile, self.max_tokens)
+                await loop.run_in_executor(None, self._write_cached, key, digest)
+            else:
+                # Summarizing failed: use extraction now, retry next time
+                digest = extract_digest(profile, self.max_tokens)
+        return UserProfile(background=profile.background, mood_board=profile.mood_board, digest=digest)
+
+    async def load(self) -> UserProfile:
+        """Read the profile files off the event loop and compile them."""
+        loop = asyncio.get_event_loop()
+        self._mtimes = await loop.run_in_executor(None, self._stat)
+        profile = await loop.run_in_executor(None, self.loader.load)
+        return await self.compile(profile)
+
+    async def run(self, state: SharedState) -> None:
+        """Poll the profile files and publish changes to `state`."""
+        self._running = True
+        loop = asyncio.get_event_loop()
+        try:
+            while self._running:
+                await asyncio.sleep(self.poll_interval)
+                mtimes = await loop.run_in_executor(None, self._stat)
+                if mtimes == self._mtimes:
+                    continue
+                profile = await self.load()
+                await state.set_profile(profile)
+                if self.on_change:
+                    await self.on_change(profile)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._running = False
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._running = False
@@ -0,0 +1,11 @@
+"""Headless multi-session server."""
+
+from speakwith._lazy import lazy_exports
+
+__all__ = ["ServerSession", "SpeakWithServer", "TranscriptionPool"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ServerSession": "speakwith.server.session",
+    "SpeakWithServer": "speakwith.server.app",
+    "TranscriptionPool": "speakwith.server.pool",
+})
@@ -0,0 +1,43 @@
+"""Run the headless SpeakWith server.
+
+Usage:
+    python -m speakwith.server --socket /tmp/speakwith.sock
+    python -m speakwith.server --port 8765
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from speakwith.config import init_config
+from speakwith.server.app import SpeakWithServer
+
+
+async def serve(args: argparse.Namespace) -> None:
+    config = init_config()
+    server = SpeakWithServer(config, workers=args.workers)
+    await server.start(socket_path=args.socket, host=args.host, port=args.port)
+    where = args.socket or f"{args.host}:{args.port}"
+    print(f"SpeakWith server listening on {where} ({args.workers} transcription workers)")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m speakwith.server")
+    parser.add_argument("--socket", type=Path, help="Listen on this Unix socket instead of TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="Parallel Whisper decodes on the shared model")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Headless SpeakWith server: many sessions, one transcription engine."""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from speakwith.config import Config
+from speakwith.llm import create_client
+from speakwith.llm.base import BaseLLMClient
+from speakwith.models import ConversationMode
+from speakwith.profiles import ProfileLoader
+from speakwith.server.pool import TranscriptionPool
+from speakwith.server.protocol import (
+    FRAME_AUDIO,
+    FRAME_JSON,
+    ProtocolError,
+    decode_json,
+    encode_json,
+    read_frame,
+)
+from speakwith.server.session import ServerSession
+from speakwith.transcription import WhisperClient
+
+
+class SpeakWithServer:
+    """Accepts sessions over a Unix socket or TCP and serves them headless.
+
+    All sessions share one WhisperModel (via TranscriptionPool) and one
+    LLM client with its HTTP connection pool and concurrency limit; token
+    usage is tracked per session.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        workers: int = 2,
+        llm: Optional[BaseLLMClient] = None,
+        transcriber: Optional[WhisperClient] = None,
+    ):
+        self.config = config
+        self.llm = llm or create_client(config)
+        self.transcriber = transcriber or WhisperClient(config, num_workers=workers)
+        self.pool = TranscriptionPool(self.transcriber, workers=workers)
+        self.profile = ProfileLoader(config).load()
+        self.sessions: dict[str, ServerSession] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._pool_task: Optional[asyncio.Task] = None
+
+    async def start(
+        self,
+        socket_path: Optional[Path] = None,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+    ) -> None:
+        """Load the model and start listening."""
+        await self.transcriber.initialize()
+        self._pool_task = asyncio.create_task(self.pool.run(), name="transcription_pool")
+        if socket_path is not None:
+            if socket_path.exists():
+                socket_path.unlink()
+            self._server = await asyncio.start_unix_server(self._handle, path=str(socket_path))
+            os.chmod(socket_path, 0o600)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+
+    async def serve_forever(self) -> None:
+        """Run until cancelled."""
+        if self._server is None:
+            raise RuntimeError("call start() first")
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        """Close the listener, every session and the pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for session in list(self.sessions.values()):
+            await session.close()
+        self.pool.stop()
+        if self._pool_task is not None:
+            self._pool_task.cancel()
+            await asyncio.gather(self._pool_task, return_exceptions=True)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection for the lifetime of its session."""
+        write_lock = asyncio.Lock()
+
+        async def send(message: dict[str, Any]) -> None:
+            async with write_lock:
+                writer.write(encode_json(message))
+                await writer.drain()
+
+        session: Optional[ServerSession] = None
+        try:
+            frame_type, payload = await read_frame(reader)
+            hello = decode_json(payload) if frame_type == FRAME_JSON else {}
+            if hello.get("type") != "hello":
+                raise ProtocolError("first message must be hello")
+
+            mode = ConversationMode(hello.get("mode", ConversationMode.FRIENDLY.value))
+            sample_rate = int(hello.get("sample_rate", self.config.sample_rate))
+            if sample_rate != self.config.sample_rate:
+                raise ProtocolError(f"sample_rate must be {self.config.sample_rate}")
+            session = ServerSession(
+                self.config,
+                mode,
+                self.llm,
+                self.pool,
+                send,
+                self.profile,
+                sample_rate=sample_rate,
+            )
+            self.sessions[session.session_id] = session
+            await send({"type": "ready", "session": session.session_id})
+
+            while True:
+                frame_type, payload = await read_frame(reader)
+                if frame_type == FRAME_AUDIO:
+                    session.feed_audio(payload)
+                    # Backpressure: stop reading this socket while its chunks queue up
+                    await session.wait_for_capacity()
+                    continue
+                message = decode_json(payload)
+                if message["type"] == "bye":
+                    session.flush()
+                    await session.drain()
+                    break
+                await session.handle_message(message)
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except (ProtocolError, ValueError) as e:
+            try:
+                await send({"type": "error", "message": str(e)})
+            except ConnectionError:
+                pass
+        finally:
+            if session is not None:
+                self.sessions.pop(session.session_id, None)
+                await session.close()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
@@ -0,0 +1,176 @@
+"""Load generator simulating many concurrent client sessions.
+
+Usage:
+    python -m speakwith.server.loadgen --sessions 20 --socket /tmp/speakwith.sock
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from speakwith.bench.replay import open_wav
+from speakwith.bench.runner import summarize
+from speakwith.server.protocol import (
+    FRAME_AUDIO,
+    FRAME_JSON,
+    decode_json,
+    encode_frame,
+    encode_json,
+    read_frame,
+)
+
+
+@dataclass
+class SessionResult:
+    """What one simulated client observed."""
+
+    transcripts: int = 0
+    suggestions: int = 0
+    errors: list[str] = field(default_factory=list)
+    latencies: list[float] = field(default_factory=list)  # chunk end -> suggestions
+
+
+def synthetic_audio(seconds: float, sample_rate: int, seed: int) -> np.ndarray:
+    """Speech-band noise bursts as int16, for when no WAV is supplied."""
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * sample_rate)
+    t = np.arange(samples) / sample_rate
+    envelope = (np.sin(2 * np.pi * 0.3 * t) > 0).astype(np.float32)
+    tone = np.sin(2 * np.pi * rng.uniform(120, 250) * t)
+    audio = 0.2 * envelope * (tone + 0.3 * rng.standard_normal(samples))
+    return (np.clip(audio, -1, 1) * 32767).astype("<i2")
+
+
+async def _connect(socket_path: Optional[Path], host: str, port: int):
+    if socket_path is not None:
+        return await asyncio.open_unix_connection(str(socket_path))
+    return await asyncio.open_connection(host, port)
+
+
+async def run_session(
+    index: int,
+    audio: np.ndarray,
+    sample_rate: int,
+    chunk_duration: float,
+    frame_ms: int,
+    realtime: bool,
+    socket_path: Optional[Path],
+    host: str,
+    port: int,
+) -> SessionResult:
+    """Stream audio as one client and record when suggestions arrive."""
+    result = SessionResult()
+    reader, writer = await _connect(socket_path, host, port)
+    writer.write(encode_json({"type": "hello", "mode": "friendly", "sample_rate": sample_rate}))
+    await writer.drain()
+
+    chunk_ends: list[float] = []  # When each full chunk finished sending
+
+    async def receive() -> None:
+        answered = 0
+        while True:
+            try:
+                frame_type, payload = await read_frame(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            if frame_type != FRAME_JSON:
+                continue
+            message = decode_json(payload)
+            kind = message["type"]
+            if kind == "transcript":
+                result.transcripts += 1
+            elif kind == "suggestions":
+                result.suggestions += 1
+                if answered < len(chunk_ends):
+                    result.latencies.append(time.perf_counter() - chunk_ends[answered])
+                    answered += 1
+            elif kind == "error":
+                result.errors.append(message.get("message", ""))
+
+    receiver = asyncio.create_task(receive())
+
+    frame_samples = sample_rate * frame_ms // 1000
+    chunk_samples = int(sample_rate * chunk_duration)
+    started = time.perf_counter()
+    for offset in range(0, len(audio), frame_samples):
+        frame = audio[offset:offset + frame_samples]
+        if realtime:
+            delay = started + offset / sample_rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        writer.write(encode_frame(FRAME_AUDIO, frame.tobytes()))
+        await writer.drain()
+        sent = offset + len(frame)
+        if sent // chunk_samples > len(chunk_ends):
+            chunk_ends.append(time.perf_counter())
+
+    writer.write(encode_json({"type": "bye"}))
+    await writer.drain()
+    await receiver
+    writer.close()
+    return result
+
+
+async def run(args: argparse.Namespace) -> dict:
+    if args.wav:
+        info, frames = open_wav(args.wav)
+        sample_rate = info.sample_rate
+        audio = np.ascontiguousarray(frames[:, 0])
+    else:
+        sample_rate = args.sample_rate
+        audio = None
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[
+        run_session(
+            i,
+            audio if audio is not None else synthetic_audio(args.seconds, sample_rate, seed=i),
+            sample_rate,
+            args.chunk_duration,
+            args.frame_ms,
+            not args.fast,
+            args.socket,
+            args.host,
+            args.port,
+        )
+        for i in range(args.sessions)
+    ])
+
+    latencies = [latency for r in results for latency in r.latencies]
+    return {
+        "sessions": args.sessions,
+        "wall_seconds": time.perf_counter() - started,
+        "transcripts": sum(r.transcripts for r in results),
+        "suggestions": sum(r.suggestions for r in results),
+        "errors": sum(len(r.errors) for r in results),
+        "chunk_to_suggestions": summarize(latencies),
+        "per_session_suggestions": [r.suggestions for r in results],
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m speakwith.server.loadgen")
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--socket", type=Path, help="Unix socket path (default: TCP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--wav", type=Path, help="16-bit PCM WAV streamed by every session")
+    parser.add_argument("--seconds", type=float, default=30.0, help="Length of synthetic audio")
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--chunk-duration", type=float, default=10.0,
+                        help="Server chunk duration, used to time latency")
+    parser.add_argument("--frame-ms", type=int, default=100)
+    parser.add_argument("--fast", action="store_true", help="Send as fast as possible instead of real time")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Shared transcription pool with fair per-session scheduling."""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from speakwith.models import AudioChunk, Transcript
+from speakwith.transcription import WhisperClient
+
+
+@dataclass
+class _Job:
+    chunk: AudioChunk
+    future: asyncio.Future
+    language: Optional[str] = None
+
+
+@dataclass
+class PoolStats:
+    """Counters for the transcription pool."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    max_in_flight: int = 0
+    per_session: dict[str, int] = field(default_factory=dict)
+
+
+class TranscriptionPool:
+    """One Whisper model shared by every session.
+
+    The model is loaded once with `workers` CTranslate2 workers, so up to
+    that many chunks are decoded in parallel against the same weights.
+    Pending chunks are queued per session and dispatched round-robin, so
+    a session streaming lots of audio cannot starve the others.
+    """
+
+    def __init__(self, transcriber: WhisperClient, workers: int = 2):
+        self.transcriber = transcriber
+        self.workers = workers
+        self.stats = PoolStats()
+        self._queues: dict[str, deque[_Job]] = {}
+        self._order: deque[str] = deque()  # Round-robin order of session ids
+        self._in_flight = 0
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+    async def submit(
+        self, session_id: str, chunk: AudioChunk, language: Optional[str] = None
+    ) -> Transcript:
+        """Queue a chunk for a session and wait for its transcript."""
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(session_id)
+        if queue is None:
+            queue = self._queues[session_id] = deque()
+            self._order.append(session_id)
+        queue.append(_Job(chunk, future, language))
+        self.stats.submitted += 1
+        self._wakeup.set()
+        return await future
+
+    def remove_session(self, session_id: str) -> None:
+        """Drop a session and cancel its pending chunks."""
+        queue = self._queues.pop(session_id, None)
+        if session_id in self._order:
+            self._order.remove(session_id)
+        for job in queue or ():
+            job.future.cancel()
+
+    def pending(self) -> int:
+        """Chunks waiting for a worker."""
+        return sum(len(q) for q in self._queues.values())
+
+    def _next_job(self) -> tuple[str, _Job] | None:
+        """Take the oldest chunk of the next session in round-robin order."""
+        for _ in range(len(self._order)):
+            session_id = self._order[0]
+            self._order.rotate(-1)
+            queue = self._queues.get(session_id)
+            if queue:
+                return session_id, queue.popleft()
+        return None
+
+    async def _run_job(self, session_id: str, job: _Job) -> None:
+        try:
+            transcript = await self.transcriber.transcribe(job.chunk, language=job.language)
+        except Exception as e:
+            self.stats.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            self.stats.completed += 1
+            self.stats.per_session[session_id] = self.stats.per_session.get(session_id, 0) + 1
+            if not job.future.done():
+                job.future.set_result(transcript)
+        finally:
+            self._in_flight -= 1
+            self._wakeup.set()
+
+    async def run(self) -> None:
+        """Scheduler task dispatching queued chunks to free workers."""
+        self._running = True
+        tasks: set[asyncio.Task] = set()
+        try:
+            while self._running:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._in_flight < self.workers:
+                    item = self._next_job()
+                    if item is None:
+                        break
+                    session_id, job = item
+                    if job.future.cancelled():
+                        continue
+                    self._in_flight += 1
+                    self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+                    task = asyncio.create_task(self._run_job(session_id, job))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._running = False
+
+    def stop(self) -> None:
+        """Stop dispatching."""
+        self._running = False
+        self._wakeup.set()
@@ -0,0 +1,80 @@
+"""Length-prefixed framing for the headless server.
+
+Every frame is a 4-byte big-endian payload length, a 1-byte frame type
+and the payload. JSON frames carry control messages and events, audio
+frames carry raw little-endian int16 mono PCM at the session sample rate.
+
+Client -> server JSON messages:
+    {"type": "hello", "mode": "friendly", "sample_rate": 16000}
+    {"type": "select", "index": 2}           # suggestion [2]
+    {"type": "response", "text": "..."}      # custom response
+    {"type": "usage"}                        # request LLM usage
+    {"type": "bye"}
+
+Server -> client JSON messages:
+    {"type": "ready", "session": "..."}
+    {"type": "transcript", "text": "...", "timestamp": 0.0}
+    {"type": "suggestions", "reactions": [...], "followups": [...]}
+    {"type": "summary", "text": "..."}
+    {"type": "usage", "tokens": {...}, "limiter": {...}}
+    {"type": "error", "message": "..."}
+"""
+
+import asyncio
+import json
+import struct
+from typing import Any
+
+FRAME_JSON = 1
+FRAME_AUDIO = 2
+
+_HEADER = struct.Struct(">IB")
+
+# Upper bound on a single frame (one minute of 48 kHz int16 audio)
+MAX_FRAME_BYTES = 48000 * 2 * 60
+
+
+class ProtocolError(Exception):
+    """Raised when a peer sends a malformed frame."""
+
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one frame.
+
+    Raises:
+        asyncio.IncompleteReadError: If the connection closed mid-frame.
+        ProtocolError: If the frame is too large or of unknown type.
+    """
+    header = await reader.readexactly(_HEADER.size)
+    length, frame_type = _HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ProtocolError(f"frame of {length} bytes exceeds limit")
+    if frame_type not in (FRAME_JSON, FRAME_AUDIO):
+        raise ProtocolError(f"unknown frame type {frame_type}")
+    payload = await reader.readexactly(length)
+    return frame_type, payload
+
+
+def encode_frame(frame_type: int, payload: bytes) -> bytes:
+    """Serialize one frame."""
+    return _HEADER.pack(len(payload), frame_type) + payload
+
+
+def encode_json(message: dict[str, Any]) -> bytes:
+    """Serialize a JSON control message as a frame."""
+    return encode_frame(FRAME_JSON, json.dumps(message, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_json(payload: bytes) -> dict[str, Any]:
+    """Parse a JSON frame payload.
+
+    Raises:
+        ProtocolError: If the payload is not a JSON object.
+    """
+    try:
+        message = json.loads(payload)
+    except ValueError as e:
+        raise ProtocolError(f"invalid JSON: {e}") from e
+    if not isinstance(message, dict) or "type" not in message:
+        raise ProtocolError("message must be an object with a 'type'")
+    return message
@@ -0,0 +1,235 @@
+"""Per-connection session state for the headless server."""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+
+from speakwith.audio.denoise import NoiseSuppressor
+from speakwith.config import Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.llm.limiter import LimitedLLMClient
+from speakwith.memory import ConversationMemory
+from speakwith.metrics import get_metrics
+from speakwith.models import AudioChunk, ConversationMode, SharedState, UserProfile
+from speakwith.modes.conversation_modes import resolve_config
+from speakwith.server.pool import TranscriptionPool
+from speakwith.suggestions import SuggestionGenerator
+from speakwith.transcription.filter import TranscriptFilter
+from speakwith.transcription.language import LanguageManager
+
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class ServerSession:
+    """One client conversation: its own SharedState, memory and suggestions.
+
+    Incoming PCM is accumulated into `chunk_duration` chunks and handed to
+    the shared TranscriptionPool; every non-empty transcript and every
+    user selection produces a fresh set of suggestions, streamed back
+    through `send`.
+
+    At most MAX_IN_FLIGHT chunks per session are queued or being
+    processed; the server stops reading a client's socket until
+    `wait_for_capacity()` returns, so a client sending faster than real
+    time is slowed by TCP flow control instead of filling the shared pool.
+    """
+
+    MAX_IN_FLIGHT = 3
+
+    def __init__(
+        self,
+        config: Config,
+        mode: ConversationMode,
+        llm: BaseLLMClient,
+        pool: TranscriptionPool,
+        send: Send,
+        profile: UserProfile,
+        sample_rate: int,
+    ):
+        self.session_id = uuid.uuid4().hex[:12]
+        # A limited client shares its limiter but tracks usage per session
+        if isinstance(llm, LimitedLLMClient):
+            llm = llm.for_session(self.session_id)
+        self.llm = llm
+        # Chunking and memory follow the mode's profile; the transcription
+        # pool and LLM client are shared, so their settings stay global
+        self.config = config = resolve_config(config, mode)
+        self.pool = pool
+        self.send = send
+        self.sample_rate = sample_rate
+        self.state = SharedState(mode=mode, profile=profile, max_transcripts=config.max_transcripts)
+        self.language = LanguageManager(fixed=config.language)
+        self.transcript_filter = TranscriptFilter.from_config(config)
+        self.suppressor = NoiseSuppressor.from_config(config)
+        self.memory = ConversationMemory(config, llm, self.state)
+        self.suggestion_gen = SuggestionGenerator(config, llm, self.state)
+
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._stream_start = time.time()
+        self._samples_seen = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._last_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()  # Serializes memory and suggestion updates
+
+    @property
+    def bytes_per_chunk(self) -> int:
+        """Bytes of int16 PCM making up one chunk."""
+        return int(self.sample_rate * self.config.chunk_duration) * 2
+
+    def feed_audio(self, pcm: bytes) -> None:
+        """Accumulate PCM and dispatch every complete chunk."""
+        self._pending.append(pcm)
+        self._pending_bytes += len(pcm)
+        while self._pending_bytes >= self.bytes_per_chunk:
+            data = b"".join(self._pending)
+            chunk_bytes, rest = data[:self.bytes_per_chunk], data[self.bytes_per_chunk:]
+            self._pending = [rest] if rest else []
+            self._pending_bytes = len(rest)
+            self._dispatch(chunk_bytes)
+
+    def flush(self) -> None:
+        """Dispatch whatever partial chunk is buffered."""
+        if self._pending_bytes >= 2:
+            data = b"".join(self._pending)
+            self._dispatch(data[:len(data) - len(data) % 2])
+        self._pending = []
+        self._pending_bytes = 0
+
+    def _dispatch(self, pcm: bytes) -> None:
+        # A view over the received bytes; converted once by the transcriber
+        samples = np.frombuffer(pcm, dtype="<i2")
+        chunk = AudioChunk(
+            data=samples,
+            sample_rate=self.sample_rate,
+            timestamp=self._stream_start + self._samples_seen / self.sample_rate,
+            duration=len(samples) / self.sample_rate,
+        )
+        self._samples_seen += len(samples)
+        if self.suppressor is not None:
+            # Chunks are dispatched in capture order, as the stream state needs
+            chunk = self.suppressor.process_chunk(chunk)
+        task = asyncio.create_task(self._process(chunk, self._last_task))
+        self._last_task = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @property
+    def in_flight(self) -> int:
+        """Chunks dispatched but not processed yet."""
+        return len(self._tasks)
+
+    async def wait_for_capacity(self) -> None:
+        """Return once fewer than MAX_IN_FLIGHT chunks are in flight."""
+        if len(self._tasks) < self.MAX_IN_FLIGHT:
+            return
+        get_metrics().incr("server_backpressure")
+        while len(self._tasks) >= self.MAX_IN_FLIGHT:
+            await asyncio.wait(list(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+
+    async def _process(self, chunk: AudioChunk, previous: asyncio.Task | None) -> None:
+        try:
+            language = self.language.next_language()
+            transcript = await self.pool.submit(self.session_id, chunk, language)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            await self.send({"type": "error", "message": f"transcription failed: {e}"})
+            return
+
+        # Chunks may finish out of order; apply them in capture order
+        if previous is not None:
+            await asyncio.wait([previous])
+        self.language.observe(transcript, language)
+        if self.language.language != self.state.language:
+            await self.state.set_language(self.language.language)
+        if transcript.is_empty:
+            return
+        if self.transcript_filter is not None:
+            reason = self.transcript_filter.apply(transcript)
+            if reason is not None:
+                get_metrics().incr(f"filtered_{reason}")
+                return
+
+        async with self._lock:
+            await self.send({"type": "transcript", "text": transcript.text, "timestamp": transcript.timestamp})
+            previous_summary = self.state.summary
+            await self.memory.add_transcript(transcript)
+            if self.state.summary != previous_summary:
+                await self.send({"type": "summary", "text": self.state.summary})
+            await self._send_suggestions()
+
+    async def _send_suggestions(self) -> None:
+        try:
+            suggestions = await self.suggestion_gen.generate()
+        except Exception as e:
+            await self.send({"type": "error", "message": f"suggestions failed: {e}"})
+            return
+        await self.state.set_suggestions(suggestions)
+        await self.send({
+            "type": "suggestions",
+            "reactions": suggestions.reactions,
+            "followups": suggestions.followups,
+        })
+
+    async def handle_message(self, message: dict[str, Any]) -> None:
+        """Apply a client control message."""
+        kind = message.get("type")
+        if kind == "select":
+            response = self._selection(message.get("index"))
+            if response is None:
+                await self.send({"type": "error", "message": "no suggestion at that index"})
+                return
+        elif kind == "response":
+            response = str(message.get("text", "")).strip()
+            if not response:
+                return
+        elif kind == "usage":
+            await self.send({"type": "usage", **self.usage()})
+            return
+        else:
+            await self.send({"type": "error", "message": f"unknown message type {kind!r}"})
+            return
+
+        async with self._lock:
+            await self.memory.record_user_response(response)
+            await self._send_suggestions()
+
+    def _selection(self, index: Any) -> str | None:
+        """Resolve a suggestion index using the CLI numbering (1-3, 4-6)."""
+        if not isinstance(index, int):
+            return None
+        suggestions = self.state.suggestions
+        if 1 <= index <= 3 and index <= len(suggestions.reactions):
+            return suggestions.reactions[index - 1]
+        if 4 <= index <= 6 and index - 4 < len(suggestions.followups):
+            return suggestions.followups[index - 4]
+        return None
+
+    def usage(self) -> dict[str, Any]:
+        """This session's LLM token usage and the shared limiter state."""
+        if not isinstance(self.llm, LimitedLLMClient):
+            return {}
+        totals = self.llm.usage.by_session.get(self.session_id)
+        return {
+            "tokens": totals.to_dict() if totals is not None else {},
+            "limiter": self.llm.limiter.stats(),
+        }
+
+    async def drain(self) -> None:
+        """Wait until every dispatched chunk has been processed."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Cancel in-flight work and leave the pool."""
+        self.pool.remove_session(self.session_id)
+        if isinstance(self.llm, LimitedLLMClient):
+            self.llm.usage.forget(self.session_id)
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,546 @@
+"""Embeddable async API for the SpeakWith pipeline.
+
+A Session runs capture, transcription, memory and suggestion generation
+without any terminal UI. Every component can be injected, and results
+are delivered through async iterators or listener callbacks:
+
+    async with Session(config, audio_source=my_source) as session:
+        async for suggestions in session.suggestions:
+            show(suggestions)
+
+Importing this module does not import rich, aioconsole, openai or
+sounddevice; the defaults are only imported when they are needed.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Optional, Protocol, TypeVar, Union
+
+from speakwith.audio.denoise import NoiseSuppressor
+from speakwith.audio.spool import AudioSpool
+from speakwith.config import Config
+from speakwith.llm.base import BaseLLMClient
+from speakwith.memory import ConversationMemory
+from speakwith.metrics import get_metrics
+from speakwith.models import (
+    AudioChunk,
+    ConversationMode,
+    PipelineStatus,
+    SharedState,
+    Suggestions,
+    Transcript,
+    UserProfile,
+)
+from speakwith.modes.conversation_modes import resolve_config
+from speakwith.pipeline.controller import QualityController, quality_ladder
+from speakwith.profiles.compiler import ProfileCompiler
+from speakwith.suggestions import SuggestionGenerator
+from speakwith.transcription.filter import TranscriptFilter
+from speakwith.transcription.language import LanguageManager
+
+T = TypeVar("T")
+
+Listener = Callable[[T], Union[None, Awaitable[None]]]
+
+
+class AudioSource(Protocol):
+    """Anything that yields AudioChunks (AudioRecorder, ReplayAudioSource, ...)."""
+
+    def stream(self) -> AsyncIterator[AudioChunk]: ...
+
+    def stop(self) -> None: ...
+
+
+class Transcriber(Protocol):
+    """Anything that turns AudioChunks into Transcripts (WhisperClient, ...)."""
+
+    async def initialize(self) -> None: ...
+
+    async def transcribe(
+        self,
+        chunk: AudioChunk,
+        on_segment: Optional[Callable[[str], None]] = None,
+        language: Optional[str] = None,
+    ) -> Transcript: ...
+
+
+_CLOSED = object()
+
+
+class EventStream(Generic[T]):
+    """Fan-out of session events to listeners and async iterators.
+
+    Each `async for` over the stream gets its own queue and sees every
+    event published after it started iterating; iteration ends when the
+    session stops.
+    """
+
+    def __init__(self) -> None:
+        self._queues: list[asyncio.Queue] = []
+        self._listeners: list[Listener] = []
+        self._pending: set[asyncio.Task] = set()
+        self._closed = False
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call `listener(event)` for every event (sync or async callable)."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        """Stop calling a listener."""
+        self._listeners.remove(listener)
+
+    def emit(self, event: T) -> None:
+        """Publish an event (must be called on the event loop)."""
+        for queue in self._queues:
+            queue.put_nowait(event)
+        for listener in self._listeners:
+            result = listener(event)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+
+    def close(self) -> None:
+        """End every active iteration."""
+        self._closed = True
+        for queue in self._queues:
+            queue.put_nowait(_CLOSED)
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        if self._closed:
+            return
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                event = await queue.get()
+                if event is _CLOSED:
+                    return
+                yield event
+        finally:
+            self._queues.remove(queue)
+
+
+class Session:
+    """A headless conversation: audio in, transcripts and suggestions out.
+
+    Args:
+        config: Application configuration. The mode's performance profile
+            is applied on top of it (see `set_mode`).
+        mode: Conversation mode shaping the suggestions.
+        audio_source: Source of AudioChunks. If omitted, feed audio with
+            `push_audio`.
+        transcriber: Speech-to-text engine (defaults to WhisperClient).
+        llm: LLM client (defaults to OpenAIClient).
+        profile: User profile (defaults to the files in user_data_dir).
+
+    Events:
+        transcripts: every non-empty Transcript that passes the
+            transcript filter; with background refinement, the refined
+            version follows later with the same seq and decode_mode
+            "refined".
+        partials: segment text as soon as the transcriber decodes it.
+        suggestions: every new Suggestions.
+        summaries: every updated summary string.
+    """
+
+    # Chunks waiting for transcription before capture applies backpressure
+    AUDIO_QUEUE_SIZE = 4
+
+    # Settings `reconfigure` applies to a running session (see LiveConfig);
+    # capture format, paths, instrumentation and the LLM limiter's on/off
+    # switch need a restart
+    LIVE_KEYS = frozenset({
+        "whisper_model", "beam_size", "decode_mode", "redecode_logprob",
+        "redecode_compression", "refine_in_background", "language",
+        "chunk_duration", "noise_suppression", "noise_reduction_db", "agc_target_dbfs",
+        "openai_api_key", "openai_base_url", "llm_model", "llm_temperature",
+        "llm_max_tokens", "llm_max_concurrency", "llm_timeout", "llm_max_retries",
+        "mode_profiles", "target_latency", "max_transcripts", "summary_update_interval",
+        "trigger_threshold", "trigger_debounce", "trigger_max_staleness",
+        "silence_threshold", "transcript_filter", "max_no_speech_prob", "min_avg_logprob",
+    })
+
+    def __init__(
+        self,
+        config: Config,
+        mode: ConversationMode = ConversationMode.FRIENDLY,
+        *,
+        audio_source: Optional[AudioSource] = None,
+        transcriber: Optional[Transcriber] = None,
+        llm: Optional[BaseLLMClient] = None,
+        profile: Optional[UserProfile] = None,
+    ):
+        self.base_config = config
+        self.config = config = resolve_config(config, mode)
+        self.mode = mode
+
+        # Profiles read from user_data are compiled and watched for edits
+        watch_profile = profile is None
+        if profile is None:
+            from speakwith.profiles import ProfileLoader
+
+            profile = ProfileLoader(config).load()
+        if transcriber is None:
+            from speakwith.transcription import WhisperClient
+
+            transcriber = WhisperClient(config)
+        if llm is None:
+            from speakwith.llm.factory import create_client
+
+            llm = create_client(config)
+
+        self.state = SharedState(mode=mode, profile=profile, max_transcripts=config.max_transcripts)
+        self.audio_source = audio_source
+        self.transcriber = transcriber
+        self.llm = llm
+
+        self.transcripts: EventStream[Transcript] = EventStream()
+        self.partials: EventStream[str] = EventStream()
+        self.suggestions: EventStream[Suggestions] = EventStream()
+        self.summaries: EventStream[str] = EventStream()
+
+        self.profile_compiler: Optional[ProfileCompiler] = None
+        if watch_profile:
+            self.profile_compiler = ProfileCompiler(config, llm)
+
+        # Every chunk is spooled to disk when AUDIO_SPOOL is on
+        self.spool = AudioSpool.from_config(config)
+        self.suppressor = NoiseSuppressor.from_config(config)
+        self.language = LanguageManager(fixed=config.language)
+        self.transcript_filter = TranscriptFilter.from_config(config)
+        self.memory = ConversationMemory(
+            config, llm, self.state, on_summary=self._emit_summary, on_transcript=self.transcripts.emit
+        )
+        self.suggestion_gen = SuggestionGenerator(
+            config, llm, self.state, on_suggestions=self._emit_suggestions
+        )
+
+        # Components built elsewhere still use the unprofiled config
+        self._reconfigure_components(config)
+
+        self._audio_queue: asyncio.Queue[AudioChunk] = asyncio.Queue(maxsize=self.AUDIO_QUEUE_SIZE)
+
+        # Rung of the quality ladder applied on top of the mode's profile
+        self.quality_level = 0
+        self.quality = QualityController.from_config(config, self.set_quality, self._audio_queue.qsize)
+
+        self._initialized = False
+        self._tasks: list[asyncio.Task] = []
+        self._refinements: set[asyncio.Task] = set()
+        self._runner: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def _emit_summary(self, summary: str) -> None:
+        self.summaries.emit(summary)
+
+    async def _emit_suggestions(self, suggestions: Suggestions) -> None:
+        self.suggestions.emit(suggestions)
+
+    # ----- input ----------------------------------------------------------
+
+    async def push_audio(self, chunk: AudioChunk) -> None:
+        """Queue a chunk for transcription (waits if the queue is full)."""
+        if self.spool is not None:
+            self.spool.append(chunk)
+        await self._audio_queue.put(chunk)
+        get_metrics().set_gauge("audio_queue_depth", self._audio_queue.qsize())
+
+    async def respond(self, response: str) -> None:
+        """Record the user's response and refresh suggestions."""
+        await self.memory.record_user_response(response)
+        await self.refresh_suggestions()
+
+    async def select(self, index: int) -> Optional[str]:
+        """Respond with suggestion [index] (1-3 reactions, 4-6 follow-ups)."""
+        suggestions = self.state.suggestions
+        if 1 <= index <= 3 and index <= len(suggestions.reactions):
+            response = suggestions.reactions[index - 1]
+        elif 4 <= index <= 6 and (index - 4) < len(suggestions.followups):
+            response = suggestions.followups[index - 4]
+        else:
+            return None
+        await self.respond(response)
+        return response
+
+    async def refresh_suggestions(self) -> None:
+        """Regenerate suggestions now (errors keep the previous ones)."""
+        try:
+            await self.suggestion_gen.refresh()
+        except Exception:
+            pass
+
+    # ----- pipeline tasks -------------------------------------------------
+
+    async def _capture_task(self) -> None:
+        """Move chunks from the audio source into the transcription queue."""
+        metrics = get_metrics()
+        try:
+            started = metrics.now()
+            async for chunk in self.audio_source.stream():
+                metrics.observe("capture", started)
+                if not self._running:
+                    break
+                await self.push_audio(chunk)
+                started = metrics.now()
+        except asyncio.CancelledError:
+            pass
+
+    def _accept(self, transcript: Transcript) -> bool:
+        """Run the transcript filter, counting rejections."""
+        if self.transcript_filter is None:
+            return True
+        metrics = get_metrics()
+        started = metrics.now()
+        reason = self.transcript_filter.apply(transcript)
+        metrics.observe("filter", started)
+        if reason is not None:
+            metrics.incr(f"filtered_{reason}")
+            return False
+        return True
+
+    async def _transcription_task(self) -> None:
+        """Transcribe queued audio and add it to memory."""
+        metrics = get_metrics()
+        try:
+            while self._running:
+                chunk = await self._audio_queue.get()
+                metrics.set_gauge("audio_queue_depth", self._audio_queue.qsize())
+
+                # Streaming noise suppression sees every chunk in order
+                if self.suppressor is not None:
+                    started = metrics.now()
+                    chunk = self.suppressor.process_chunk(chunk)
+                    metrics.observe("denoise", started)
+
+                # Skip chunks that are too quiet to contain speech
+                started = metrics.now()
+                threshold = self.config.silence_threshold
+                silent = threshold > 0 and chunk.rms < threshold
+                metrics.observe("silence_gate", started)
+                if silent:
+                    metrics.incr("silent_chunks")
+                    continue
+
+                await self.state.set_status(PipelineStatus.TRANSCRIBING)
+                started = metrics.now()
+                language = self.language.next_language()
+                transcript = await self.transcriber.transcribe(
+                    chunk, on_segment=self.partials.emit, language=language
+                )
+                metrics.observe("transcribe", started)
+                if transcript.decode_mode:
+                    metrics.incr(f"decode_{transcript.decode_mode}")
+                    metrics.set_gauge("transcribe_rtf", transcript.rtf)
+                if self.quality is not None:
+                    self.quality.observe(time.time() - (chunk.timestamp + chunk.duration), transcript.rtf)
+                if transcript.needs_refinement:
+                    # The chunk is usually a view into the capture ring, which
+                    # reuses its slots long before a busy refinement gets to it
+                    chunk = replace(chunk, data=chunk.data.copy())
+
+                # Lock in (or re-check) the conversation language
+                self.language.observe(transcript, language)
+                if self.language.language != self.state.language:
+                    await self.state.set_language(self.language.language)
+
+                if transcript.is_empty or not self._accept(transcript):
+                    await self.state.set_status(PipelineStatus.IDLE)
+                    continue
+
+                # Add to memory (handles summary updates); it publishes the
+                # transcript once it has the seq a refined version reuses
+                await self.memory.add_transcript(transcript)
+
+                if transcript.needs_refinement:
+                    self._spawn_refinement(chunk, transcript)
+
+                await self.state.set_status(PipelineStatus.IDLE)
+
+        except asyncio.CancelledError:
+            pass
+
+    def _spawn_refinement(self, chunk: AudioChunk, transcript: Transcript) -> None:
+        refine = getattr(self.transcriber, "refine", None)
+        if refine is None:
+            return
+        task = asyncio.create_task(self._refine(refine, chunk, transcript), name="refine")
+        self._refinements.add(task)
+        task.add_done_callback(self._refinements.discard)
+
+    async def _refine(
+        self,
+        refine: Callable[[AudioChunk, Transcript], Awaitable[Optional[Transcript]]],
+        chunk: AudioChunk,
+        transcript: Transcript,
+    ) -> None:
+        """Beam re-decode a greedy transcript and swap it in if it changed."""
+        metrics = get_metrics()
+        try:
+            started = metrics.now()
+            refined = await refine(chunk, transcript)
+            metrics.observe("refine", started)
+            if refined is None or not await self.state.replace_transcript(refined):
+                return
+            metrics.incr("decode_refined")
+            self.transcripts.emit(refined)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            metrics.incr("refine_errors")
+
+    # ----- performance profile --------------------------------------------
+
+    def _reconfigure_components(self, config: Config) -> None:
+        for component in (self.audio_source, self.transcriber):
+            reconfigure = getattr(component, "reconfigure", None)
+            if reconfigure is not None:
+                reconfigure(config)
+        self.llm.reconfigure(config)
+        self.memory.config = config
+        self.suggestion_gen.reconfigure(config)
+
+    def effective_config(self, base: Config) -> Config:
+        """`base` with the mode's profile, then the quality rung, applied."""
+        config = resolve_config(base, self.mode)
+        if self.quality_level:
+            config = quality_ladder(config)[self.quality_level].profile.apply(config)
+        return config
+
+    async def set_mode(self, mode: ConversationMode) -> None:
+        """Switch mode and its performance profile without restarting.
+
+        Chunking, decoding, LLM and trigger settings apply from the next
+        chunk or call on. Whisper models already loaded are reused; a model
+        not loaded yet is loaded in the background before this returns.
+        """
+        self.mode = mode
+        self.config = self.effective_config(self.base_config)
+        self._reconfigure_components(self.config)
+        await self.state.set_mode(mode)
+        if self._initialized:
+            await self.transcriber.initialize()
+
+    async def reconfigure(self, config: Config) -> None:
+        """Apply new base settings (LIVE_KEYS) without restarting.
+
+        Like a mode switch, changes take effect from the next chunk or LLM
+        call. Loaded Whisper models, the LLM connection pool, the noise
+        profile and the conversation so far are kept unless a setting that
+        shapes them changed; a new Whisper model is loaded before this
+        returns.
+        """
+        old = self.base_config
+        self.base_config = config
+        self.config = self.effective_config(self.base_config)
+        self._reconfigure_components(self.config)
+
+        self.state.max_transcripts = config.max_transcripts
+        if config.language != old.language:
+            self.language = LanguageManager(fixed=config.language)
+        if config.transcript_filter != old.transcript_filter:
+            self.transcript_filter = TranscriptFilter.from_config(config)
+        elif self.transcript_filter is not None:
+            self.transcript_filter.reconfigure(config)
+        noise_keys = ("noise_suppression", "noise_reduction_db", "agc_target_dbfs")
+        if any(getattr(config, k) != getattr(old, k) for k in noise_keys):
+            self.suppressor = NoiseSuppressor.from_config(config)
+        if self.quality is not None:
+            self.quality.target_latency = config.target_latency
+        if self._initialized and config.whisper_model != old.whisper_model:
+            await self.transcriber.initialize()
+
+    async def set_quality(self, level: int) -> None:
+        """Move to a rung of `quality_ladder` (0 = the mode's own settings).
+
+        Used by the quality controller; applies like `set_mode`, except
+        that a smaller Whisper model is loaded by the next transcription.
+        """
+        self.quality_level = level
+        self.config = self.effective_config(self.base_config)
+        self._reconfigure_components(self.config)
+
+    # ----- lifecycle ------------------------------------------------------
+
+    async def initialize(self) -> None:
+        """Load models (optional; run() does it on first use)."""
+        if not self._initialized:
+            await self.transcriber.initialize()
+            if self.profile_compiler is not None:
+                await self.state.set_profile(await self.profile_compiler.load())
+            self._initialized = True
+
+    async def run(self) -> None:
+        """Run all pipeline tasks until stopped."""
+        await self.initialize()
+        self._running = True
+        if self.spool is not None:
+            self.spool.start()
+
+        self._tasks = [
+            asyncio.create_task(self._transcription_task(), name="transcription"),
+            asyncio.create_task(self.suggestion_gen.run(), name="suggestions"),
+            asyncio.create_task(self.memory.run_summary_task(), name="summary"),
+        ]
+        if self.audio_source is not None:
+            self._tasks.append(asyncio.create_task(self._capture_task(), name="capture"))
+        if self.quality is not None:
+            self._tasks.append(asyncio.create_task(self.quality.run(), name="quality"))
+        if self.profile_compiler is not None:
+            self._tasks.append(
+                asyncio.create_task(self.profile_compiler.run(self.state), name="profile")
+            )
+
+        try:
+            await asyncio.gather(*self._tasks)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self.stop()
+
+    async def start(self) -> None:
+        """Initialize and run the pipeline in the background."""
+        await self.initialize()
+        self._runner = asyncio.create_task(self.run(), name="session")
+        # Let the pipeline tasks get scheduled before returning
+        await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        """Stop all pipeline tasks and end event iteration."""
+        self._running = False
+
+        if self.audio_source is not None:
+            self.audio_source.stop()
+        self.suggestion_gen.stop()
+        self.memory.stop()
+        if self.profile_compiler is not None:
+            self.profile_compiler.stop()
+        if self.quality is not None:
+            self.quality.stop()
+
+        tasks = self._tasks + list(self._refinements)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self.spool is not None:
+            # Drains the writer queue and saves the index
+            await asyncio.get_running_loop().run_in_executor(None, self.spool.close)
+
+        for stream in (self.transcripts, self.partials, self.suggestions, self.summaries):
+            stream.close()
+
+    async def __aenter__(self) -> "Session":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+        if self._runner is not None:
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
@@ -0,0 +1,144 @@
+"""Startup-time helpers: background preloading and import profiling."""
+
+import importlib
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+# Module imported by the `speakwith` console script
+ENTRY_MODULE = "speakwith.main"
+
+# Budget for importing the entry module in a fresh interpreter
+IMPORT_BUDGET_MS = 250.0
+
+# Heavy modules loaded in the background while the user picks a mode
+PRELOAD_MODULES = (
+    "numpy",
+    "openai",
+    "sounddevice",
+    "aioconsole",
+    "speakwith.pipeline.coordinator",
+    "faster_whisper",
+)
+
+
+@dataclass
+class ImportTiming:
+    """One line of `python -X importtime` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 1 for modules imported directly by the measured statement
+
+    @property
+    def cumulative_ms(self) -> float:
+        return self.cumulative_us / 1000.0
+
+    @property
+    def self_ms(self) -> float:
+        return self.self_us / 1000.0
+
+
+def preload_in_background(modules: Iterable[str] = PRELOAD_MODULES) -> threading.Thread:
+    """Import heavy modules on a daemon thread.
+
+    Import failures are ignored here; they resurface with a proper
+    traceback when the module is imported for real.
+    """
+
+    def _preload() -> None:
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=_preload, name="speakwith-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse `-X importtime` lines into timings."""
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        label = parts[2].rstrip()
+        module = label.lstrip()
+        depth = (len(label) - len(module) - 1) // 2 + 1
+        timings.append(ImportTiming(module, int(parts[0]), int(parts[1]), depth))
+    return timings
+
+
+def measure_import_times(modules: Iterable[str], python: Optional[str] = None) -> list[ImportTiming]:
+    """Import modules in a fresh interpreter and return per-import timings."""
+    statement = "; ".join(f"import {name}" for name in modules)
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def entry_import_ms(module: str = ENTRY_MODULE, runs: int = 3) -> float:
+    """Best-of-N cumulative import time of a module, in milliseconds."""
+    best = float("inf")
+    for _ in range(runs):
+        for timing in measure_import_times([module]):
+            if timing.module == module and timing.depth == 1:
+                best = min(best, timing.cumulative_ms)
+    return best
+
+
+def check_import_budget(
+    module: str = ENTRY_MODULE,
+    budget_ms: float = IMPORT_BUDGET_MS,
+    runs: int = 3,
+) -> tuple[bool, float]:
+    """Check that importing `module` stays within the startup budget.
+
+    Returns:
+        (within_budget, best_ms)
+    """
+    best = entry_import_ms(module, runs)
+    return best <= budget_ms, best
+
+
+def print_startup_profile(top: int = 25) -> None:
+    """Print the entry import cost and the heaviest imports, lazy ones included."""
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    entry = measure_import_times([ENTRY_MODULE])
+    entry_total = next(
+        (t.cumulative_ms for t in entry if t.module == ENTRY_MODULE and t.depth == 1), 0.0
+    )
+    console.print(
+        f"[bold]{ENTRY_MODULE}[/bold] imports in {entry_total:.1f} ms "
+        f"(budget {IMPORT_BUDGET_MS:.0f} ms)"
+    )
+
+    full = measure_import_times([ENTRY_MODULE, *PRELOAD_MODULES])
+    table = Table(title=f"Top {top} imports including deferred modules")
+    table.add_column("module")
+    table.add_column("self ms", justify="right")
+    table.add_column("cumulative ms", justify="right")
+    table.add_column("deferred", justify="center")
+    eager = {t.module for t in entry}
+    for timing in sorted(full, key=lambda t: t.self_us, reverse=True)[:top]:
+        table.add_row(
+            timing.module,
+            f"{timing.self_ms:.1f}",
+            f"{timing.cumulative_ms:.1f}",
+            "" if timing.module in eager else "yes",
+        )
+    console.print(table)
@@ -1,5 +1,9 @@
 """Response suggestion generation."""
 
-from speakwith.suggestions.generator import SuggestionGenerator
+from speakwith._lazy import lazy_exports
 
 __all__ = ["SuggestionGenerator"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "SuggestionGenerator": "speakwith.suggestions.generator",
+})
@@ -1,49 +1,90 @@
 """Response suggestion generator using LLM."""
 
 import asyncio
+from typing import Awaitable, Callable, Optional
 
 from speakwith.config import Config
 from speakwith.llm.base import BaseLLMClient
+from speakwith.metrics import get_metrics
 from speakwith.models import PipelineStatus, SharedState, Suggestions
+from speakwith.suggestions.trigger import TriggerPolicy
 
 
 class SuggestionGenerator:
     """Generates contextual response suggestions using LLM.
 
     Watches for new transcripts and generates suggestions based on
-    the current conversation context.
+    the current conversation context, once the trigger policy judges
+    that the other person has finished their turn.
     """
 
-    def __init__(self, config: Config, llm: BaseLLMClient, state: SharedState):
+    def __init__(
+        self,
+        config: Config,
+        llm: BaseLLMClient,
+        state: SharedState,
+        on_suggestions: Optional[Callable[[Suggestions], Awaitable[None]]] = None,
+        trigger: Optional[TriggerPolicy] = None,
+    ):
         self.config = config
         self.llm = llm
         self.state = state
+        self.on_suggestions = on_suggestions
+        self.trigger = trigger or TriggerPolicy.from_config(config)
         self._running = False
-        self._last_transcript_count = 0
+        self._last_seq = 0
+
+    @property
+    def seen_seq(self) -> int:
+        """Seq of the newest transcript the trigger policy has observed."""
+        return self._last_seq
+
+    def reconfigure(self, config: Config) -> None:
+        """Apply new settings, including the trigger thresholds."""
+        self.config = config
+        self.trigger.reconfigure(config)
 
     async def generate(self) -> Suggestions:
         """Generate suggestions based on current conversation context."""
+        metrics = get_metrics()
+        started = metrics.now()
         context = self.state.get_context()
-        return await self.llm.generate_suggestions(context)
+        suggestions = await self.llm.generate_suggestions(context)
+        metrics.observe("suggest", started)
+        return suggestions
+
+    async def refresh(self) -> None:
+        """Generate suggestions now and publish them to the shared state."""
+        self.trigger.reset()
+        suggestions = await self.generate()
+        await self.state.set_suggestions(suggestions)
+        if self.on_suggestions:
+            await self.on_suggestions(suggestions)
 
     async def run(self) -> None:
-        """Background task that generates suggestions when new transcripts arrive."""
+        """Background task that generates suggestions at the end of each turn."""
         self._running = True
         try:
             while self._running:
-                # Wait for state changes
-                await self.state.wait_for_change()
+                # Wait for a new transcript, or until pending ones are due
+                arrived = await self.state.wait_for_transcript(
+                    self._last_seq, self.trigger.time_until_due()
+                )
+                if arrived:
+                    snapshot = self.state.snapshot()
+                    new = snapshot.transcripts_since(self._last_seq)
+                    self._last_seq = snapshot.transcript_seq
+                    if new:
+                        self.trigger.observe(new[-1])
 
-                # Check if we have new transcripts
-                current_count = len(self.state.transcripts)
-                if current_count > self._last_transcript_count:
-                    self._last_transcript_count = current_count
+                reason = self.trigger.due()
+                if reason is not None:
+                    get_metrics().incr(f"trigger_{reason}")
 
                     # Generate new suggestions
                     await self.state.set_status(PipelineStatus.GENERATING)
                     try:
-                        suggestions = await self.generate()
-                        await self.state.set_suggestions(suggestions)
+                        await self.refresh()
                     except Exception:
                         # Keep old suggestions on error
                         pass
@@ -0,0 +1,137 @@
+"""Decides when new transcripts warrant a fresh set of suggestions."""
+
+import re
+import time
+from typing import Callable, Optional
+
+from speakwith.config import Config
+from speakwith.models import Transcript
+
+# Words that open a question ("do you ...", "where is ...")
+INTERROGATIVES = frozenset({
+    "who", "whom", "whose", "what", "when", "where", "why", "how", "which",
+    "do", "does", "did", "is", "are", "was", "were", "am",
+    "can", "could", "would", "will", "should", "shall", "may", "might",
+    "have", "has", "had", "want", "anything",
+})
+
+_WORD = re.compile(r"[a-z']+")
+
+# Trailing silence that counts as a clear pause (seconds)
+PAUSE_SECONDS = 0.8
+
+
+def end_of_turn_score(transcript: Transcript) -> float:
+    """Likelihood (0-1) that the speaker finished their turn with this transcript.
+
+    Combines the trailing silence after the last decoded word, question
+    cues and how complete the utterance looks.
+    """
+    text = transcript.text.strip()
+    words = _WORD.findall(text.lower())
+    if not words:
+        return 0.0
+
+    score = 0.0
+
+    # Trailing silence: the strongest cue when the transcriber reports it
+    if transcript.speech_end is not None:
+        silence = max(transcript.duration - transcript.speech_end, 0.0)
+        score += 0.5 * min(silence / PAUSE_SECONDS, 1.0)
+    else:
+        score += 0.2
+
+    # Questions expect an answer right away
+    if text.endswith("?"):
+        score += 0.4
+    elif words[0] in INTERROGATIVES:
+        score += 0.25
+    elif text[-1] in ".!":
+        score += 0.15
+
+    # Fragments are usually mid-sentence; longer utterances are more complete
+    score += 0.2 * min(len(words) / 8.0, 1.0)
+    if len(words) < 3 and not text.endswith("?"):
+        score -= 0.2
+
+    return max(0.0, min(score, 1.0))
+
+
+class TriggerPolicy:
+    """Fires suggestion generation at plausible ends of turn.
+
+    Feed every new transcript to `observe`. A transcript scoring at least
+    `threshold` makes generation due once `debounce` seconds pass without
+    another transcript; anything else waits until `max_staleness` seconds
+    after the first unanswered transcript.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        debounce: float = 0.5,
+        max_staleness: float = 6.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.threshold = threshold
+        self.debounce = debounce
+        self.max_staleness = max_staleness
+        self.clock = clock
+        self.last_score = 0.0
+        self._pending_since: Optional[float] = None
+        self._last_arrival = 0.0
+
+    @classmethod
+    def from_config(cls, config: Config) -> "TriggerPolicy":
+        return cls(
+            threshold=config.trigger_threshold,
+            debounce=config.trigger_debounce,
+            max_staleness=config.trigger_max_staleness,
+        )
+
+    def reconfigure(self, config: Config) -> None:
+        """Adopt new thresholds; pending transcripts stay pending."""
+        self.threshold = config.trigger_threshold
+        self.debounce = config.trigger_debounce
+        self.max_staleness = config.trigger_max_staleness
+
+    @property
+    def pending(self) -> bool:
+        """Whether transcripts arrived since the last generation."""
+        return self._pending_since is not None
+
+    def observe(self, transcript: Transcript) -> None:
+        """Record a new transcript."""
+        now = self.clock()
+        if self._pending_since is None:
+            self._pending_since = now
+        self._last_arrival = now
+        self.last_score = end_of_turn_score(transcript)
+
+    def _due_at(self) -> Optional[float]:
+        if self._pending_since is None:
+            return None
+        stale_at = self._pending_since + self.max_staleness
+        if self.last_score >= self.threshold:
+            return min(self._last_arrival + self.debounce, stale_at)
+        return stale_at
+
+    def time_until_due(self) -> Optional[float]:
+        """Seconds until generation becomes due (None if nothing is pending)."""
+        due_at = self._due_at()
+        if due_at is None:
+            return None
+        return max(due_at - self.clock(), 0.0)
+
+    def due(self) -> Optional[str]:
+        """Why generation should run now ("end_of_turn" or "stale"), or None."""
+        due_at = self._due_at()
+        if due_at is None or self.clock() < due_at:
+            return None
+        if self.last_score >= self.threshold and self._last_arrival + self.debounce <= due_at:
+            return "end_of_turn"
+        return "stale"
+
+    def reset(self) -> None:
+        """Mark the pending transcripts as answered."""
+        self._pending_since = None
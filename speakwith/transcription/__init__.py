@@ -1,5 +1,11 @@
 """Transcription module using local Whisper."""
 
-from speakwith.transcription.whisper_client import WhisperClient
+from speakwith._lazy import lazy_exports
 
-__all__ = ["WhisperClient"]
+__all__ = ["LanguageManager", "TranscriptFilter", "WhisperClient"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "LanguageManager": "speakwith.transcription.language",
+    "TranscriptFilter": "speakwith.transcription.filter",
+    "WhisperClient": "speakwith.transcription.whisper_client",
+})
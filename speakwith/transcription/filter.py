@@ -0,0 +1,177 @@
+"""Filter for Whisper hallucinations and repeated transcripts."""
+
+import re
+from collections import Counter, deque
+from difflib import SequenceMatcher
+from typing import Iterable, Mapping, Optional
+
+from speakwith.config import Config
+from speakwith.models import Transcript
+
+# Filler Whisper tends to produce on silence, music or background noise,
+# keyed by transcript language (normalized: lowercase, punctuation removed).
+# Several are also real turns ("Thank you.", "Bye"), so a match only
+# rejects a transcript whose decoder statistics look weak as well.
+# Languages without a list are filtered on statistics alone.
+KNOWN_HALLUCINATIONS: dict[str, frozenset[str]] = {
+    "en": frozenset({
+        "you",
+        "thank you",
+        "thank you very much",
+        "thanks for watching",
+        "thank you for watching",
+        "thank you so much for watching",
+        "please subscribe",
+        "like and subscribe",
+        "subtitles by the amaraorg community",
+        "transcribed by",
+        "bye",
+        "bye bye",
+        "so",
+        "uh",
+        "um",
+        "hmm",
+        "music",
+        "applause",
+        "silence",
+    }),
+    "de": frozenset({
+        "untertitel im auftrag des zdf für funk 2017",
+        "untertitel der amaraorg community",
+        "vielen dank",
+        "tschüss",
+    }),
+    "es": frozenset({
+        "subtítulos realizados por la comunidad de amaraorg",
+        "gracias por ver el video",
+        "gracias",
+    }),
+    "fr": frozenset({
+        "soustitres réalisés par la communauté damaraorg",
+        "merci davoir regardé cette vidéo",
+        "merci",
+    }),
+}
+
+REASONS = ("hallucination", "no_speech", "low_confidence", "repetitive", "duplicate")
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return _SPACES.sub(" ", _PUNCTUATION.sub("", text.lower())).strip()
+
+
+class TranscriptFilter:
+    """Rejects transcripts that should not reach memory or the LLM.
+
+    Checks, in order:
+    - hallucination: no text left after normalization
+    - no_speech / low_confidence / repetitive: faster-whisper segment
+      statistics beyond their thresholds
+    - hallucination: the whole text is a known filler phrase for its
+      language and the statistics are weak, though within the limits
+      above (no_speech_prob over `hallucination_no_speech_prob` or
+      avg_logprob under `hallucination_min_logprob`)
+    - duplicate: nearly identical to one of the recent accepted transcripts
+      whose audio overlaps it or ends at most `duplicate_gap` seconds
+      before it starts; Whisper repeats itself across adjacent chunks, but
+      a speaker repeating a sentence later is a real turn
+
+    Rejections are counted per reason in `rejected`.
+    """
+
+    def __init__(
+        self,
+        max_no_speech_prob: float = 0.6,
+        min_avg_logprob: float = -1.0,
+        max_compression_ratio: float = 2.4,
+        duplicate_ratio: float = 0.9,
+        duplicate_window: int = 5,
+        duplicate_min_chars: int = 12,
+        duplicate_gap: float = 1.0,
+        hallucination_no_speech_prob: float = 0.2,
+        hallucination_min_logprob: float = -0.5,
+        hallucinations: Mapping[str, Iterable[str]] = KNOWN_HALLUCINATIONS,
+    ):
+        self.max_no_speech_prob = max_no_speech_prob
+        self.min_avg_logprob = min_avg_logprob
+        self.max_compression_ratio = max_compression_ratio
+        self.duplicate_ratio = duplicate_ratio
+        self.duplicate_min_chars = duplicate_min_chars
+        self.duplicate_gap = duplicate_gap
+        self.hallucination_no_speech_prob = hallucination_no_speech_prob
+        self.hallucination_min_logprob = hallucination_min_logprob
+        self.hallucinations = {
+            language: frozenset(normalize(p) for p in phrases)
+            for language, phrases in hallucinations.items()
+        }
+        self.rejected: Counter[str] = Counter()
+        self.accepted = 0
+        # (normalized text, audio start, audio end) of recent accepted transcripts
+        self._recent: deque[tuple[str, float, float]] = deque(maxlen=duplicate_window)
+
+    @classmethod
+    def from_config(cls, config: Config) -> Optional["TranscriptFilter"]:
+        """Filter configured from the environment, or None if disabled."""
+        if not config.transcript_filter:
+            return None
+        return cls(
+            max_no_speech_prob=config.max_no_speech_prob,
+            min_avg_logprob=config.min_avg_logprob,
+        )
+
+    def reconfigure(self, config: Config) -> None:
+        """Adopt new thresholds; the duplicate history is kept."""
+        self.max_no_speech_prob = config.max_no_speech_prob
+        self.min_avg_logprob = config.min_avg_logprob
+
+    def check(self, transcript: Transcript) -> Optional[str]:
+        """Return the rejection reason, or None if the transcript passes."""
+        text = normalize(transcript.text)
+        if not text:
+            return "hallucination"
+        if transcript.no_speech_prob > self.max_no_speech_prob:
+            return "no_speech"
+        if transcript.avg_logprob < self.min_avg_logprob:
+            return "low_confidence"
+        if transcript.compression_ratio > self.max_compression_ratio:
+            return "repetitive"
+        # Unknown language: Whisper's filler is overwhelmingly English
+        phrases = self.hallucinations.get(transcript.language or "en", frozenset())
+        if text in phrases and (
+            transcript.no_speech_prob > self.hallucination_no_speech_prob
+            or transcript.avg_logprob < self.hallucination_min_logprob
+        ):
+            return "hallucination"
+        if len(text) >= self.duplicate_min_chars:
+            start, end = transcript.timestamp, transcript.timestamp + transcript.duration
+            for previous, previous_start, previous_end in self._recent:
+                if start > previous_end + self.duplicate_gap or end < previous_start:
+                    continue  # Too far apart in time to be the same speech
+                matcher = SequenceMatcher(None, text, previous)
+                if matcher.real_quick_ratio() >= self.duplicate_ratio and matcher.ratio() >= self.duplicate_ratio:
+                    return "duplicate"
+        return None
+
+    def apply(self, transcript: Transcript) -> Optional[str]:
+        """Check a transcript and record the outcome.
+
+        Returns:
+            The rejection reason, or None if the transcript was accepted.
+        """
+        reason = self.check(transcript)
+        if reason is not None:
+            self.rejected[reason] += 1
+            return reason
+        self.accepted += 1
+        self._recent.append(
+            (normalize(transcript.text), transcript.timestamp, transcript.timestamp + transcript.duration)
+        )
+        return None
+
+    def stats(self) -> dict[str, int]:
+        """Accepted count plus rejections per reason."""
+        return {"accepted": self.accepted, **{r: self.rejected[r] for r in REASONS}}
@@ -0,0 +1,102 @@
+"""Session-level spoken language detection."""
+
+from collections import defaultdict
+from typing import Optional
+
+from speakwith.models import Transcript
+
+# Names used in prompts for common Whisper language codes
+LANGUAGE_NAMES = {
+    "ar": "Arabic", "cs": "Czech", "da": "Danish", "de": "German", "el": "Greek",
+    "en": "English", "es": "Spanish", "fa": "Persian", "fi": "Finnish", "fr": "French",
+    "he": "Hebrew", "hi": "Hindi", "hu": "Hungarian", "id": "Indonesian", "it": "Italian",
+    "ja": "Japanese", "ko": "Korean", "nl": "Dutch", "no": "Norwegian", "pl": "Polish",
+    "pt": "Portuguese", "ro": "Romanian", "ru": "Russian", "sv": "Swedish", "th": "Thai",
+    "tr": "Turkish", "uk": "Ukrainian", "vi": "Vietnamese", "zh": "Chinese",
+}
+
+
+def language_name(code: str) -> str:
+    """Human-readable name for a language code (the code if unknown)."""
+    return LANGUAGE_NAMES.get(code, code)
+
+
+class LanguageManager:
+    """Detects the conversation language once instead of on every chunk.
+
+    While unlocked, chunks are transcribed with auto-detection and the
+    detected language probabilities are accumulated over voiced chunks.
+    The language locks once one detection reaches `lock_confidence`, or
+    after `max_probe_chunks` voiced chunks by the highest total. Locked
+    chunks skip detection; a re-check runs every `recheck_every` chunks
+    or after a low-confidence transcript, and switches language only on
+    a confident detection.
+
+    Args:
+        fixed: Language code to always use (no detection).
+    """
+
+    def __init__(
+        self,
+        fixed: Optional[str] = None,
+        lock_confidence: float = 0.8,
+        max_probe_chunks: int = 3,
+        recheck_every: int = 30,
+        recheck_logprob: float = -0.9,
+    ):
+        self.fixed = fixed or None
+        self.lock_confidence = lock_confidence
+        self.max_probe_chunks = max_probe_chunks
+        self.recheck_every = recheck_every
+        self.recheck_logprob = recheck_logprob
+
+        self.language: Optional[str] = self.fixed
+        self.detections = 0  # Chunks transcribed with auto-detection
+        self._votes: dict[str, float] = defaultdict(float)
+        self._probes = 0
+        self._since_check = 0
+        self._recheck = False
+
+    @property
+    def locked(self) -> bool:
+        return self.language is not None
+
+    def next_language(self) -> Optional[str]:
+        """Language to decode the next chunk with (None = auto-detect)."""
+        if self.fixed:
+            return self.fixed
+        if self.language is None or self._recheck:
+            return None
+        return self.language
+
+    def observe(self, transcript: Transcript, requested: Optional[str]) -> None:
+        """Update from a transcript decoded with `requested` language."""
+        if self.fixed or transcript.is_empty:
+            return
+
+        if requested is not None:
+            self._since_check += 1
+            if self._since_check >= self.recheck_every or transcript.avg_logprob < self.recheck_logprob:
+                self._recheck = True
+            return
+
+        self.detections += 1
+        detected = transcript.language
+        confidence = transcript.language_probability
+        if detected is None:
+            return
+
+        if self.language is not None:
+            # Re-check: only a confident detection changes the language
+            if detected != self.language and confidence >= self.lock_confidence:
+                self.language = detected
+            self._recheck = False
+            self._since_check = 0
+            return
+
+        self._probes += 1
+        self._votes[detected] += confidence
+        if confidence >= self.lock_confidence or self._probes >= self.max_probe_chunks:
+            self.language = max(self._votes, key=self._votes.get)
+            self._votes.clear()
+            self._since_check = 0
@@ -1,11 +1,43 @@
 """Local Whisper transcription client using faster-whisper."""
 
 import asyncio
-
-import numpy as np
+import time
+from dataclasses import replace
+from typing import Any, Callable, Optional
 
 from speakwith.config import Config
-from speakwith.models import AudioChunk, Transcript
+from speakwith.models import AudioChunk, Transcript, TranscriptSegment
+
+# Audio kept around a weak segment when re-decoding it (seconds)
+SEGMENT_PADDING = 0.2
+
+
+def build_transcript(
+    chunk: AudioChunk,
+    segments: list[TranscriptSegment],
+    language: Optional[str],
+    language_probability: float,
+    **fields: Any,
+) -> Transcript:
+    """Combine segments into a Transcript with aggregate statistics."""
+    logprob_sum = weight = 0.0
+    for segment in segments:
+        length = max(segment.end - segment.start, 1e-3)
+        logprob_sum += segment.avg_logprob * length
+        weight += length
+    return Transcript(
+        text=" ".join(s.text for s in segments if s.text).strip(),
+        timestamp=chunk.timestamp,
+        duration=chunk.duration,
+        no_speech_prob=max((s.no_speech_prob for s in segments), default=0.0),
+        avg_logprob=logprob_sum / weight if weight else 0.0,
+        compression_ratio=max((s.compression_ratio for s in segments), default=0.0),
+        speech_end=segments[-1].end if segments else None,
+        language=language,
+        language_probability=language_probability,
+        segments=tuple(segments),
+        **fields,
+    )
 
 
 class WhisperClient:
@@ -14,61 +46,219 @@ class WhisperClient:
     Uses CTranslate2 backend for efficient inference.
     Loads the model lazily on first use to avoid startup delay.
     Runs transcription in executor to avoid blocking the event loop.
+    Loaded models are kept, so switching back to a model is instant.
+
+    Decoding modes (`decode_mode`):
+        beam: beam search with `beam_size` for every chunk.
+        greedy: greedy decoding only.
+        adaptive: greedy first; only segments below the confidence
+            thresholds are re-decoded with beam search, either inline or,
+            with `refine_in_background`, later through `refine()`.
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, num_workers: int = 1):
+        self.num_workers = num_workers  # Parallel transcribe() calls on one model
+        self._models: dict[str, Any] = {}
+        self.reconfigure(config)
+
+    def reconfigure(self, config: Config) -> None:
+        """Switch model and decoding settings for subsequent chunks."""
         self.model_name = config.whisper_model
-        self._model = None
+        self.beam_size = config.beam_size
+        self.decode_mode = config.decode_mode
+        self.redecode_logprob = config.redecode_logprob
+        self.redecode_compression = config.redecode_compression
+        self.refine_in_background = config.refine_in_background
 
-    def _load_model(self):
-        """Load the Whisper model (lazy initialization)."""
-        if self._model is None:
+    def _load_model(self, name: Optional[str] = None):
+        """Load a Whisper model (lazy initialization, cached by name)."""
+        name = name or self.model_name
+        model = self._models.get(name)
+        if model is None:
             from faster_whisper import WhisperModel
 
             # Use CPU by default, can be changed to "cuda" for GPU
-            self._model = WhisperModel(
-                self.model_name,
+            model = self._models[name] = WhisperModel(
+                name,
                 device="cpu",
                 compute_type="int8",  # Efficient for CPU
+                num_workers=self.num_workers,
             )
-        return self._model
+        return model
 
-    async def transcribe(self, chunk: AudioChunk) -> Transcript:
+    def is_weak(self, segment: TranscriptSegment) -> bool:
+        """Whether a segment is worth re-decoding with beam search."""
+        return (
+            segment.avg_logprob < self.redecode_logprob
+            or segment.compression_ratio > self.redecode_compression
+        )
+
+    @staticmethod
+    def _decode(
+        model: Any,
+        audio: Any,
+        language: Optional[str],
+        beam_size: int,
+        vad_filter: bool,
+        on_segment: Optional[Callable[[str], None]] = None,
+        offset: float = 0.0,
+    ) -> tuple[list[TranscriptSegment], Any]:
+        segments, info = model.transcribe(
+            audio,
+            language=language,
+            beam_size=beam_size,
+            vad_filter=vad_filter,
+        )
+        # Decoding happens lazily while iterating
+        decoded = []
+        for segment in segments:
+            text = segment.text.strip()
+            if on_segment is not None:
+                on_segment(text)
+            decoded.append(TranscriptSegment(
+                text=text,
+                start=segment.start + offset,
+                end=segment.end + offset,
+                avg_logprob=segment.avg_logprob,
+                compression_ratio=segment.compression_ratio,
+                no_speech_prob=segment.no_speech_prob,
+            ))
+        return decoded, info
+
+    def _redecode(
+        self,
+        model: Any,
+        audio: Any,
+        sample_rate: int,
+        segments: list[TranscriptSegment],
+        language: Optional[str],
+        beam_size: int,
+    ) -> tuple[list[TranscriptSegment], int]:
+        """Re-decode weak segments with beam search; keeps whichever is better."""
+        result = []
+        redecoded = 0
+        for segment in segments:
+            if not self.is_weak(segment):
+                result.append(segment)
+                continue
+            start = max(segment.start - SEGMENT_PADDING, 0.0)
+            end = segment.end + SEGMENT_PADDING
+            piece = audio[int(start * sample_rate):int(end * sample_rate)]
+            candidates, _ = self._decode(model, piece, language, beam_size, False, offset=start)
+            redecoded += 1
+            if not candidates:
+                result.append(segment)
+                continue
+            window = AudioChunk(data=piece, sample_rate=sample_rate, timestamp=0.0, duration=end - start)
+            merged = build_transcript(window, candidates, language, 1.0)
+            if merged.avg_logprob > segment.avg_logprob:
+                result.append(TranscriptSegment(
+                    text=merged.text,
+                    start=segment.start,
+                    end=segment.end,
+                    avg_logprob=merged.avg_logprob,
+                    compression_ratio=merged.compression_ratio,
+                    no_speech_prob=merged.no_speech_prob,
+                ))
+            else:
+                result.append(segment)
+        return result, redecoded
+
+    async def transcribe(
+        self,
+        chunk: AudioChunk,
+        on_segment: Optional[Callable[[str], None]] = None,
+        language: Optional[str] = None,
+    ) -> Transcript:
         """Transcribe an audio chunk to text.
 
         Args:
             chunk: AudioChunk containing audio data.
+            on_segment: Called on the event loop with each segment's text
+                as soon as it is decoded (partial results).
+            language: Language code to decode with; None runs language
+                detection first (see LanguageManager).
 
         Returns:
-            Transcript with the transcribed text.
+            Transcript with the transcribed text, its decode mode and
+            real-time factor.
         """
         loop = asyncio.get_event_loop()
+        model_name, beam_size, mode = self.model_name, self.beam_size, self.decode_mode
+        background = self.refine_in_background
+        if beam_size <= 1:
+            mode = "greedy"
+
+        def _partial(text: str) -> None:
+            loop.call_soon_threadsafe(on_segment, text)
 
-        def _transcribe() -> str:
-            model = self._load_model()
-            # faster-whisper expects float32 audio normalized to [-1, 1]
-            audio = chunk.data.astype(np.float32)
+        def _transcribe() -> Transcript:
+            started = time.perf_counter()
+            model = self._load_model(model_name)
+            # faster-whisper expects float32 audio normalized to [-1, 1];
+            # this is the only conversion of the int16 capture data
+            audio = chunk.as_float32()
 
-            segments, _ = model.transcribe(
-                audio,
-                language="en",
-                beam_size=5,
+            first_beam = beam_size if mode == "beam" else 1
+            segments, info = self._decode(
+                model, audio, language, first_beam,
                 vad_filter=True,  # Filter out silence
+                on_segment=_partial if on_segment is not None else None,
             )
 
-            # Combine all segments
-            text = " ".join(segment.text.strip() for segment in segments)
-            return text.strip()
+            used_mode = mode
+            needs_refinement = False
+            if mode == "adaptive":
+                weak = any(self.is_weak(s) for s in segments)
+                if not weak:
+                    used_mode = "greedy"
+                elif background:
+                    used_mode, needs_refinement = "greedy", True
+                else:
+                    segments, _ = self._redecode(
+                        model, audio, chunk.sample_rate, segments, info.language, beam_size
+                    )
 
-        text = await loop.run_in_executor(None, _transcribe)
+            elapsed = time.perf_counter() - started
+            return build_transcript(
+                chunk, segments, info.language, info.language_probability,
+                decode_mode=used_mode,
+                rtf=elapsed / chunk.duration if chunk.duration else 0.0,
+                needs_refinement=needs_refinement,
+            )
 
-        return Transcript(
-            text=text,
-            timestamp=chunk.timestamp,
-            duration=chunk.duration,
-        )
+        return await loop.run_in_executor(None, _transcribe)
+
+    async def refine(self, chunk: AudioChunk, transcript: Transcript) -> Optional[Transcript]:
+        """Beam re-decode the weak segments of a greedy transcript.
+
+        Returns:
+            The refined transcript (same seq), or None if nothing changed.
+        """
+        if not transcript.needs_refinement:
+            return None
+        loop = asyncio.get_event_loop()
+        model_name, beam_size = self.model_name, self.beam_size
+
+        def _refine() -> Optional[Transcript]:
+            started = time.perf_counter()
+            model = self._load_model(model_name)
+            segments, redecoded = self._redecode(
+                model, chunk.as_float32(), chunk.sample_rate,
+                list(transcript.segments), transcript.language, beam_size,
+            )
+            if not redecoded or list(transcript.segments) == segments:
+                return None
+            refined = build_transcript(
+                chunk, segments, transcript.language, transcript.language_probability,
+                decode_mode="refined",
+                rtf=transcript.rtf + (time.perf_counter() - started) / chunk.duration,
+            )
+            return replace(refined, seq=transcript.seq)
+
+        return await loop.run_in_executor(None, _refine)
 
     async def initialize(self) -> None:
-        """Pre-load the model (optional, for faster first transcription)."""
+        """Pre-load the current model (optional, for faster first transcription)."""
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self._load_model)
@@ -0,0 +1,156 @@
+"""Copy discipline of the audio buffers: views where promised, copies where needed."""
+
+import asyncio
+import tracemalloc
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from speakwith.audio.ring import AudioRing
+from speakwith.audio.spool import AudioSpool
+from speakwith.bench.replay import ReplayAudioSource
+from speakwith.models import AudioChunk
+
+SAMPLE_RATE = 16000
+
+
+def write_wav(path: Path, seconds: float) -> Path:
+    samples = (np.arange(int(seconds * SAMPLE_RATE)) % 2000 - 1000).astype(np.int16)
+    with wave.open(str(path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(SAMPLE_RATE)
+        out.writeframes(samples.tobytes())
+    return path
+
+
+# ----- AudioRing --------------------------------------------------------------
+
+
+def test_ring_reads_are_views_into_the_buffer():
+    ring = AudioRing(chunk_samples=4, slots=4)
+    assert ring.write(np.arange(8, dtype=np.int16)) == 2
+
+    first, second = ring.read(), ring.read()
+    assert np.shares_memory(first, ring.buffer)
+    assert np.shares_memory(second, ring.buffer)
+    assert not first.flags.writeable
+    assert first.tolist() == [0, 1, 2, 3]
+    assert second.tolist() == [4, 5, 6, 7]
+    assert ring.read() is None
+
+
+def test_ring_drops_instead_of_overwriting_unread_chunks():
+    ring = AudioRing(chunk_samples=2, slots=3)
+    ring.write(np.arange(10, dtype=np.int16))
+
+    assert ring.overruns == 6
+    assert ring.read().tolist() == [0, 1]
+    assert ring.read().tolist() == [2, 3]
+
+
+# ----- AudioChunk.as_float32 ---------------------------------------------------
+
+
+def test_as_float32_returns_float32_input_unchanged():
+    data = np.linspace(-1, 1, 100, dtype=np.float32)
+    chunk = AudioChunk(data, SAMPLE_RATE, 0.0, len(data) / SAMPLE_RATE)
+
+    assert chunk.as_float32() is data
+
+
+def test_as_float32_converts_int16_in_one_allocation():
+    small = AudioChunk(np.array([-32768, 0, 16384], dtype=np.int16), SAMPLE_RATE, 0.0, 3 / SAMPLE_RATE)
+    converted = small.as_float32()
+    assert converted.dtype == np.float32
+    assert converted.tolist() == [-1.0, 0.0, 0.5]
+
+    chunk = AudioChunk(np.zeros(SAMPLE_RATE, dtype=np.int16), SAMPLE_RATE, 0.0, 1.0)
+    tracemalloc.start()
+    try:
+        chunk.as_float32()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The float32 result plus the ufunc's small casting buffer; a float64
+    # intermediate would add twice the result
+    assert peak < 2 * SAMPLE_RATE * 4
+
+
+# ----- AudioSpool --------------------------------------------------------------
+
+
+def test_spool_append_copies_the_chunk(tmp_path):
+    spool = AudioSpool(tmp_path / "spool", SAMPLE_RATE, retention=1.0)
+    buffer = np.full(100, 7, dtype=np.int16)  # Stands in for a reused ring slot
+
+    assert spool.append(AudioChunk(buffer, SAMPLE_RATE, 0.0, 100 / SAMPLE_RATE))
+    buffer[:] = 0
+    spool.start()
+    spool.close()
+
+    assert spool.read_samples(0, 100).tolist() == [7] * 100
+
+
+def test_spool_reads_of_a_closed_spool_are_views(tmp_path):
+    spool = AudioSpool(tmp_path / "spool", SAMPLE_RATE, retention=1.0)
+    spool.append(AudioChunk(np.arange(1000, dtype=np.int16), SAMPLE_RATE, 0.0, 1000 / SAMPLE_RATE))
+    spool.start()
+    spool.close()
+
+    reopened = AudioSpool.open(tmp_path / "spool")
+    samples = reopened.read_samples(100, 200)
+    assert np.shares_memory(samples, reopened._map)
+    assert not samples.flags.writeable
+    assert samples.tolist() == list(range(100, 200))
+
+
+def test_live_spool_copies_only_audio_about_to_be_overwritten(tmp_path):
+    spool = AudioSpool(tmp_path / "spool", 100, retention=100.0)  # 10000 samples, 30 s guard
+    for i in range(15):
+        spool._write(np.full(1000, i, dtype=np.int16), float(i))
+
+    # The oldest retained audio (from 5000) is what the writer reuses next
+    near_head = spool.read_samples(5000, 6000)
+    assert not np.shares_memory(near_head, spool._map)
+    assert near_head.tolist() == [5] * 1000
+
+    far = spool.read_samples(12000, 13000)
+    assert np.shares_memory(far, spool._map)
+    assert far.tolist() == [12] * 1000
+
+
+# ----- ReplayAudioSource -------------------------------------------------------
+
+
+def replay_peak(path: Path) -> tuple[int, int]:
+    """Peak traced allocation while replaying a file, and the samples seen."""
+
+    async def consume() -> int:
+        total = 0
+        async for chunk in ReplayAudioSource([path], SAMPLE_RATE, 1.0).stream():
+            chunk.as_float32()
+            total += len(chunk.data)
+        return total
+
+    tracemalloc.start()
+    try:
+        total = asyncio.run(consume())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, total
+
+
+def test_replay_memory_stays_flat_over_a_long_file(tmp_path):
+    short_peak, short_total = replay_peak(write_wav(tmp_path / "short.wav", 30))
+    long_peak, long_total = replay_peak(write_wav(tmp_path / "long.wav", 600))
+
+    assert short_total == 30 * SAMPLE_RATE
+    assert long_total == 600 * SAMPLE_RATE
+    # The file is memory-mapped and only one chunk is converted at a time,
+    # so 20x the audio must not cost more memory
+    chunk_bytes = SAMPLE_RATE * 4
+    assert long_peak < short_peak + chunk_bytes
+    assert long_peak < 4 * chunk_bytes
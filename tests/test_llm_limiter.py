@@ -0,0 +1,119 @@
+"""AdaptiveLimiter behaviour through the real OpenAI client against StandInLLMServer."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from speakwith.bench.llm_server import StandInLLMServer
+from speakwith.config import Config
+from speakwith.llm.limiter import AdaptiveLimiter, LimitedLLMClient
+from speakwith.llm.openai_client import OpenAIClient
+from speakwith.models import ConversationContext, ConversationMode, UserProfile
+
+
+def context() -> ConversationContext:
+    return ConversationContext(
+        recent_transcripts=[],
+        summary="",
+        profile=UserProfile.empty(),
+        mode=ConversationMode.FRIENDLY,
+        user_last_response=None,
+    )
+
+
+@asynccontextmanager
+async def limited_client(
+    server: StandInLLMServer, limiter: AdaptiveLimiter, retry_base: float = 0.05
+) -> AsyncIterator[LimitedLLMClient]:
+    config = Config(openai_api_key="stand-in", openai_base_url=server.base_url, llm_timeout=10.0)
+    openai = OpenAIClient(config)
+    try:
+        yield LimitedLLMClient(openai, limiter, timeout=config.llm_timeout, max_retries=5, retry_base=retry_base)
+    finally:
+        await openai.client.close()
+
+
+def test_rate_limits_shrink_the_limit_once_per_burst():
+    async def scenario() -> None:
+        async with StandInLLMServer(capacity=1, latency=0.2, retry_after=0.25) as server:
+            limiter = AdaptiveLimiter(initial=4, reserved=0, cooldown=10.0)
+            async with limited_client(server, limiter) as llm:
+                await asyncio.gather(*(llm.generate_suggestions(context()) for _ in range(4)))
+
+            assert server.rejected >= 3
+            assert server.served == 4
+            # Three 429s from one burst count as a single halving (4 -> 2);
+            # the four successes add back only about 1/limit each
+            assert limiter.decreases == 1
+            assert 2.0 < limiter.limit < 4.0
+            assert llm.usage.snapshot()["total"]["rate_limited"] >= 3
+
+    asyncio.run(scenario())
+
+
+def test_retry_waits_for_retry_after_instead_of_backoff():
+    async def scenario() -> None:
+        async with StandInLLMServer(capacity=1, latency=0.2, retry_after=0.5) as server:
+            # Without the header the retry would sleep 5-15 s
+            async with limited_client(server, AdaptiveLimiter(initial=2, reserved=0), retry_base=10.0) as llm:
+                first = asyncio.create_task(llm.generate_suggestions(context()))
+                await asyncio.sleep(0.05)
+                started = time.perf_counter()
+                await llm.generate_suggestions(context())
+                elapsed = time.perf_counter() - started
+                await first
+
+            assert server.rejected == 1
+            assert 0.5 <= elapsed < 2.0
+
+    asyncio.run(scenario())
+
+
+def test_interactive_calls_go_before_queued_background_calls():
+    async def scenario() -> None:
+        async with StandInLLMServer(capacity=4, latency=0.1) as server:
+            limiter = AdaptiveLimiter(initial=1, max_limit=1, reserved=0)
+            finished: list[str] = []
+
+            async def call(name: str, request) -> None:
+                await request
+                finished.append(name)
+
+            async with limited_client(server, limiter) as llm:
+                holder = asyncio.create_task(call("holder", llm.generate_summary(["Hi"], "")))
+                await asyncio.sleep(0.02)
+                background = [
+                    asyncio.create_task(call(f"summary{i}", llm.generate_summary([f"Hi {i}"], "")))
+                    for i in range(2)
+                ]
+                await asyncio.sleep(0.02)
+                interactive = asyncio.create_task(call("suggestions", llm.generate_suggestions(context())))
+                await asyncio.gather(holder, interactive, *background)
+
+            assert server.rejected == 0
+            assert finished == ["holder", "suggestions", "summary0", "summary1"]
+
+    asyncio.run(scenario())
+
+
+def test_background_flood_leaves_the_reserved_slot_free():
+    async def scenario() -> None:
+        async with StandInLLMServer(capacity=4, latency=0.2) as server:
+            limiter = AdaptiveLimiter(initial=2, max_limit=2, reserved=1)
+            async with limited_client(server, limiter) as llm:
+                flood = [asyncio.create_task(llm.generate_summary([f"Hi {i}"], "")) for i in range(10)]
+                await asyncio.sleep(0.05)
+                assert limiter.in_flight == 1  # Background calls stop short of the reserved slot
+
+                started = time.perf_counter()
+                await llm.generate_suggestions(context())
+                elapsed = time.perf_counter() - started
+                await asyncio.gather(*flood)
+
+            # Served at once, not after the ten queued summaries (about 2 s)
+            assert elapsed < 0.6
+            assert server.peak_in_flight == 2
+            assert server.rejected == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,125 @@
+"""SharedAudioRing: wraparound, the mirror region, the reserve and a real capture process."""
+
+import multiprocessing
+import time
+
+import numpy as np
+import pytest
+
+from speakwith.audio.capture_process import capture_main
+from speakwith.audio.shm_ring import OVERRUNS, RUNNING, SharedAudioRing
+from speakwith.bench.capture_stress import RAMP, open_synthetic
+
+
+@pytest.fixture
+def make_ring():
+    rings: list[SharedAudioRing] = []
+
+    def make(capacity: int, mirror: int) -> SharedAudioRing:
+        ring = SharedAudioRing(capacity, mirror)
+        rings.append(ring)
+        return ring
+
+    yield make
+    for ring in rings:
+        ring.close()
+        ring.unlink()
+
+
+def counting(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.int16)
+
+
+def test_samples_come_back_in_order_across_many_wraps(make_ring):
+    ring = make_ring(capacity=16, mirror=5)
+    produced = consumed = 0
+    for block in [3, 5, 2, 5, 4, 1, 5] * 10:  # Odd sizes land the wrap everywhere
+        assert ring.write(counting(produced, block)) == block
+        produced += block
+        view = ring.read(block)
+        assert view.tolist() == counting(consumed, block).tolist()
+        consumed += block
+
+    assert produced > 10 * ring.capacity
+    assert ring.stats()["overruns"] == 0
+    assert ring.available == 0
+
+
+def test_reads_across_the_wrap_are_one_contiguous_view(make_ring):
+    ring = make_ring(capacity=16, mirror=6)
+    ring.write(counting(0, 8))
+    ring.read(6)
+    ring.read(2)
+    ring.write(counting(8, 6))
+    ring.read(6)
+    ring.write(counting(14, 6))  # Buffer positions 14, 15, then 0..3
+
+    view = ring.read(6)
+    assert view.tolist() == counting(14, 6).tolist()
+    assert np.shares_memory(view, ring.samples)
+    assert view.base is not None and view.flags.c_contiguous
+    assert not view.flags.writeable
+    # The wrapped head is duplicated past the end of the buffer
+    assert ring.samples[ring.capacity:ring.capacity + 4].tolist() == counting(16, 4).tolist()
+    assert ring.samples[:4].tolist() == counting(16, 4).tolist()
+
+
+def test_reads_are_capped_at_the_mirror(make_ring):
+    ring = make_ring(capacity=16, mirror=4)
+    ring.write(counting(0, 8))
+    with pytest.raises(ValueError):
+        ring.read(5)
+    assert ring.read(3).tolist() == [0, 1, 2]
+
+
+def test_a_full_reserve_drops_new_audio_without_reordering(make_ring):
+    ring = make_ring(capacity=16, mirror=4)  # Reserve: 8 samples behind READ
+    assert ring.write(counting(0, 6)) == 6
+    assert ring.write(counting(6, 6)) == 2  # Only 8 samples fit before the reserve
+    assert int(ring.header[OVERRUNS]) == 4
+    assert ring.write(counting(12, 3)) == 0
+    assert ring.stats()["overruns"] == 7
+
+    assert ring.read(4).tolist() == [0, 1, 2, 3]
+    assert ring.read(4).tolist() == [4, 5, 6, 7]
+    assert ring.read(1) is None
+
+    # Room again: the stream resumes after the dropped samples, still in order
+    assert ring.write(counting(15, 4)) == 4
+    assert ring.read(4).tolist() == [15, 16, 17, 18]
+
+
+def test_capture_process_delivers_every_sample_in_order(make_ring):
+    sample_rate = 16000
+    block = sample_rate // 10
+    ring = make_ring(capacity=sample_rate, mirror=block)
+    process = multiprocessing.get_context("spawn").Process(
+        target=capture_main,
+        args=(ring.name, ring.capacity, ring.mirror, sample_rate, False, 1, open_synthetic),
+        daemon=True,
+    )
+    process.start()
+    try:
+        deadline = time.monotonic() + 20.0
+        while ring.state != RUNNING:
+            assert time.monotonic() < deadline, "capture process did not start"
+            time.sleep(0.01)
+
+        received: list[np.ndarray] = []
+        while len(received) < 30:  # Three seconds: the ring wraps three times
+            assert time.monotonic() < deadline, "capture process stalled"
+            view = ring.read(block)
+            if view is None:
+                time.sleep(0.005)
+                continue
+            received.append(view.copy())
+    finally:
+        ring.request_stop()
+        process.join(5.0)
+
+    assert process.exitcode == 0
+    samples = np.concatenate(received).astype(np.int64)
+    # The synthetic driver delivers a ramp from 0: any loss or reordering breaks it
+    assert samples[0] == 0
+    assert np.all(np.diff(samples) % RAMP == 1)
+    assert ring.stats()["overruns"] == 0